@@ -56,3 +56,66 @@ class Config:
 
     # Timeouts
     DEFAULT_TIMEOUT = int(os.getenv("TIMEOUT", 10000))
+
+
+    # ============================================================================
+    # API CONCURRENCY
+    # ============================================================================
+    # Max parallel requests for APIClient.fetch_many / iter_products
+    API_MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", "8"))
+    # Pages fetched ahead of the consumer by APIClient.iter_products
+    API_PREFETCH_PAGES = int(os.getenv("API_PREFETCH_PAGES", "2"))
+
+    # ============================================================================
+    # API RESPONSE CACHE (opt-in, see utils/response_cache.py)
+    # ============================================================================
+    # Shared by all xdist workers on the same machine
+    API_CACHE_DIR = os.getenv("API_CACHE_DIR", ".api_cache")
+    # Freshness override in seconds, e.g. 300 for reference data (unset/empty/0 = follow Cache-Control)
+    API_CACHE_TTL = float(os.getenv("API_CACHE_TTL") or 0) or None
+
+    # ============================================================================
+    # ENVIRONMENT HEALTH (preflight probe + circuit breaker, see utils/health.py)
+    # ============================================================================
+    PREFLIGHT = os.getenv("PREFLIGHT", "true").lower() == "true"
+    # Seconds per probe request (kept far below CLOUDFLARE_TIMEOUT on purpose)
+    HEALTH_PROBE_TIMEOUT = float(os.getenv("HEALTH_PROBE_TIMEOUT", "10"))
+    # Consecutive navigation/API failures before the environment is declared down
+    CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3"))
+    # What to do with remaining tests once the breaker is open: "skip" or "fail"
+    OUTAGE_POLICY = os.getenv("OUTAGE_POLICY", "skip")
+
+    # ============================================================================
+    # DATA-DRIVEN TESTS
+    # ============================================================================
+    # Run only one slice of @pytest.mark.dataset rows, e.g. "2/4" (CI matrix shards)
+    DATA_SHARD = os.getenv("DATA_SHARD", "")
+    # Reuse one cart per group of rows sharing a product (see pages/cart_session.py)
+    CART_BATCHING = os.getenv("CART_BATCHING", "false").lower() == "true"
+    # localStorage key where the storefront keeps the login token (API login shortcut)
+    AUTH_TOKEN_STORAGE_KEY = os.getenv("AUTH_TOKEN_STORAGE_KEY", "auth-token")
+
+    # ============================================================================
+    # BROWSER
+    # ============================================================================
+    # Disable animations/transitions in test pages (see utils/animations.py)
+    DISABLE_ANIMATIONS = os.getenv("DISABLE_ANIMATIONS", "false").lower() == "true"
+
+    # ============================================================================
+    # CATALOG SNAPSHOT (see utils/catalog_store.py)
+    # ============================================================================
+    # SQLAlchemy URL of the snapshot store ("sqlite://" = in memory, per process)
+    CATALOG_DB_URL = os.getenv("CATALOG_DB_URL", "sqlite://")
+
+    # ============================================================================
+    # SEARCH LATENCY BENCHMARK (see utils/search_benchmark.py)
+    # ============================================================================
+    # Comma-separated terms typed into the search box
+    SEARCH_BENCH_TERMS = [t.strip() for t in os.getenv(
+        "SEARCH_BENCH_TERMS", "hammer,pliers,screwdriver,saw,wrench").split(",") if t.strip()]
+    # Delay between keystrokes in ms (~100-200ms is a realistic typing cadence)
+    SEARCH_BENCH_KEY_DELAY_MS = int(os.getenv("SEARCH_BENCH_KEY_DELAY_MS", "150"))
+    # How long to wait for the last keystroke's suggestions after typing a term (ms)
+    SEARCH_BENCH_SETTLE_MS = int(os.getenv("SEARCH_BENCH_SETTLE_MS", "3000"))
+    # Fail when the aggregate p95 exceeds this (ms, unset/empty/0 = report only)
+    SEARCH_BENCH_P95_BUDGET_MS = float(os.getenv("SEARCH_BENCH_P95_BUDGET_MS") or 0) or None
@@ -6,6 +6,8 @@ Copy this file to every new Playwright Python project
 
 Features:
 ✅ Timestamped results folder (complete test history)
+✅ Per-endpoint API latency metrics (JSON + HTML report summary)
+✅ Fail-fast on outages (preflight probe + circuit breaker)
 ✅ Beautiful test execution banners with emojis
 ✅ Real-time PASS/FAIL/SKIP reporting
 ✅ Automatic screenshots on test failure
@@ -18,6 +20,7 @@ results_Playwright/
 ├── 2025-11-24_09-56-53/    ← First test run
 │   ├── test-report.html
 │   ├── test-logs.log
+│   ├── api-metrics.json
 │   ├── screenshots/
 │   └── videos/
 ├── 2025-11-24_10-15-30/    ← Second test run
@@ -34,6 +37,10 @@ import pytest
 from datetime import datetime
 from pathlib import Path
 import logging
+from utils.api_metrics import api_metrics
+from utils.health import environment_health, probe_environment
+from utils.animations import suppress_animations
+from config.config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +113,73 @@ def pytest_configure(config):
     print(f"{'='*70}\n")
 
 
+# ============================================================================
+# ENVIRONMENT HEALTH - FAIL FAST ON OUTAGES
+# ============================================================================
+
+def pytest_addoption(parser):
+    """
+    Custom command line options.
+
+    --no-preflight     Do not probe the environment at session start
+    --outage-policy    skip|fail remaining tests once the environment is down
+    --data-shard K/N   Keep only shard K of N of every dataset-driven test
+    --cart-batching    Group dataset rows by product and reuse one cart session
+    --no-animations    Disable CSS/JS animations in every test page (opt-out: keep_animations)
+    """
+    group = parser.getgroup("environment health")
+    group.addoption("--no-preflight", action="store_true", default=not Config.PREFLIGHT,
+                    help="Skip the session-start health probe")
+    group.addoption("--outage-policy", choices=["skip", "fail"], default=Config.OUTAGE_POLICY,
+                    help="What to do with remaining tests when the environment is unhealthy")
+
+    group = parser.getgroup("data-driven tests")
+    group.addoption("--data-shard", default=Config.DATA_SHARD,
+                    help="Run one slice of @pytest.mark.dataset rows, e.g. 2/4 (CI matrix shards)")
+    group.addoption("--cart-batching", action="store_true", default=Config.CART_BATCHING,
+                    help="Reuse one cart session for consecutive dataset rows of the same product")
+
+    group = parser.getgroup("browser")
+    group.addoption("--no-animations", action="store_true", default=Config.DISABLE_ANIMATIONS,
+                    help="Disable animations, transitions, smooth scrolling and caret blinking "
+                         "(tests marked keep_animations are left untouched)")
+
+
+def pytest_sessionstart(session):
+    """
+    Preflight: probe storefront, API and login page once, with a short timeout.
+
+    Any failure opens the circuit breaker before the first test runs.
+    Skipped on the xdist controller (workers probe for themselves)
+    and for --collect-only runs.
+    """
+    config = session.config
+    is_xdist_controller = getattr(config.option, "numprocesses", None) and not hasattr(config, "workerinput")
+    if config.getoption("--no-preflight") or config.option.collectonly or is_xdist_controller:
+        return
+
+    results = probe_environment()
+    down = {name: error for name, error in results.items() if error is not None}
+    for name, error in down.items():
+        environment_health.record_failure(f"preflight:{name}", error)
+    if down:
+        environment_health.trip(f"preflight probe failed for {', '.join(sorted(down))}")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Gate every test on the circuit breaker (before any fixture is created).
+
+    Tests marked `offline` do not need the remote environment and always run.
+    """
+    if not environment_health.is_open or item.get_closest_marker("offline"):
+        return
+    if item.config.getoption("--outage-policy") == "fail":
+        pytest.fail(environment_health.diagnostic(), pytrace=False)
+    pytest.skip(environment_health.diagnostic())
+
+
 # ============================================================================
 # PYTEST HOOKS - TEST EXECUTION
 # ============================================================================
@@ -198,6 +272,16 @@ def pytest_sessionfinish(session, exitstatus):
             if png_count > 0:
                 print(f"🧹 Cleaned up {png_count} invalid video file(s)")
     
+    # API metrics: xdist workers hand them to the controller, which dumps them
+    if hasattr(session.config, 'workeroutput'):
+        session.config.workeroutput['api_metrics'] = api_metrics.snapshot()
+    elif hasattr(session.config, 'results_dir') and api_metrics.endpoints:
+        metrics_path = session.config.results_dir / "api-metrics.json"
+        api_metrics.dump(metrics_path)
+        print(f"📊 API metrics saved: {metrics_path}")
+        for row in api_metrics.summary_rows()[:5]:
+            print(f"   {row['endpoint']:<40} calls={row['calls']:<5} p50={row['p50_ms']}ms p95={row['p95_ms']}ms p99={row['p99_ms']}ms")
+    
     # Display exit status
     if exitstatus == 0:
         print(f"✅ ALL TESTS PASSED!")
@@ -215,6 +299,25 @@ def pytest_sessionfinish(session, exitstatus):
     print(f"{'='*70}\n")
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    pytest-xdist hook (controller side): merge a finished worker's API metrics.
+    """
+    snapshot = getattr(node, 'workeroutput', {}).get('api_metrics')
+    if snapshot:
+        api_metrics.merge(snapshot)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    """
+    pytest-html hook: add the API latency table to the report summary.
+    """
+    if api_metrics.endpoints:
+        postfix.append(api_metrics.to_html())
+
+
 # ============================================================================
 # FIXTURES - AUTOMATIC SETUP
 # ============================================================================
@@ -228,6 +331,7 @@ def page_setup(page, request):
     
     BEFORE test:
     - Sets default timeout to 10 seconds
+    - Disables animations with --no-animations (unless marked keep_animations)
     
     AFTER test:
     - Takes screenshot if test failed
@@ -238,6 +342,8 @@ def page_setup(page, request):
         request: Pytest request object (for accessing config)
     """
     page.set_default_timeout(10000)
+    if request.config.getoption("--no-animations") and not request.node.get_closest_marker("keep_animations"):
+        suppress_animations(page)
     
     yield page # Test runs here
     
@@ -1,12 +1,81 @@
 from playwright.sync_api import Page, Locator, expect
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+from utils.health import environment_health
+from utils.clock_control import skip_window
+from utils.animations import animations_suppressed
 import logging
 import re
 import time
 
 logger = logging.getLogger(__name__)
 
+# Cheap content fingerprint of everything matching a selector: count + FNV-1a of href/text
+_FINGERPRINT_JS = r"""
+selector => {
+    let hash = 0x811c9dc5;
+    const elements = document.querySelectorAll(selector);
+    for (const el of elements) {
+        const text = (el.getAttribute('href') || '') + '\u0000' + el.textContent;
+        for (let i = 0; i < text.length; i++) hash = Math.imul(hash ^ text.charCodeAt(i), 16777619);
+    }
+    return `${elements.length}:${(hash >>> 0).toString(16)}`;
+}
+"""
+
+# Resolves once the fingerprint differs from `before`, has at least `minCount` elements
+# (not the empty grid between clear and re-render) and holds for one more frame,
+# or with changed=false after `timeout` ms without such a change
+_TRANSITION_JS = """
+([selector, before, timeout, minCount]) => new Promise(resolve => {
+    const fingerprint = %s;
+    const deadline = performance.now() + timeout;
+    let candidate = null;
+    const check = () => {
+        const current = fingerprint(selector);
+        const settled = current !== before && Number(current.split(':')[0]) >= minCount;
+        if (settled && current === candidate) return resolve({changed: true, fingerprint: current});
+        candidate = settled ? current : null;
+        if (performance.now() > deadline) return resolve({changed: false, fingerprint: current});
+        requestAnimationFrame(check);
+    };
+    requestAnimationFrame(check);
+})
+""" % _FINGERPRINT_JS.strip()
+
+# Resolves many (selector, properties) reads in one evaluation
+_READ_MANY_JS = """
+specs => {
+    const isVisible = el => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const read = (elements, property) => {
+        const first = elements[0];
+        if (property === 'count') return elements.length;
+        if (property === 'texts') return elements.map(el => el.innerText.trim());
+        if (property === 'values') return elements.map(el => el.value);
+        if (property === 'visible') return !!first && isVisible(first);
+        if (!first) return null;
+        if (property === 'text') return first.innerText.trim();
+        if (property === 'enabled') return !first.matches(':disabled');
+        if (property === 'checked') return !!first.checked;
+        if (property === 'value') return first.value === undefined ? null : first.value;
+        return first.getAttribute(property.slice('attr:'.length));
+    };
+    return Object.fromEntries(specs.map(([name, selector, properties]) => {
+        const elements = [...document.querySelectorAll(selector)];
+        return [name, Object.fromEntries(properties.map(p => [p, read(elements, p)]))];
+    }));
+}
+"""
+
+# Properties read_many understands (plus "attr:<name>")
+READ_PROPERTIES = ("count", "text", "texts", "values", "visible", "enabled", "checked", "value")
+
+# How long an action may leave the content unchanged before "no change" is accepted (ms)
+NO_CHANGE_TIMEOUT = 3000
+
 
 async def click_element(locator: Locator):
     try:
@@ -25,7 +94,15 @@ class BasePage:
     Provides common functionality that all pages need.
     Each page object should inherit from this.
 
+    TIME_WINDOWS lists the timer-driven waits the page knows about
+    (name -> ms); subclasses extend it. They are skipped instantly when the
+    page clock is installed (utils/clock_control.py).
+
+    With animations suppressed (--no-animations, utils/animations.py)
+    elements are static once visible, and the settle waits are skipped.
     """
+
+    TIME_WINDOWS: Dict[str, int] = {}
     
     def __init__(self, page: Page):
         """
@@ -41,6 +118,27 @@ class BasePage:
     # NAVIGATION METHODS
     # ========================================
 
+    def goto(self, url: str):
+        """
+        Load a URL and report the outcome to the environment health breaker.
+        
+        No extra waiting: callers wait for what they need.
+        
+        Args:
+            url: Full URL to navigate to
+        """
+        logger.info(f"Navigating to: {url}")
+        try:
+            response = self.page.goto(url)
+        except Exception as e:
+            environment_health.record_failure("navigation", f"{url}: {e}")
+            raise
+        if response is not None and response.status >= 500:
+            environment_health.record_failure("navigation", f"{url}: HTTP {response.status}")
+        else:
+            environment_health.record_success("navigation")
+        return response
+
     def navigate_to(self, url: str):
         """
         Navigate to a specific URL.
@@ -48,8 +146,7 @@ class BasePage:
         Args:
             url: Full URL to navigate to
         """
-        logger.info(f"Navigating to: {url}")
-        self.page.goto(url)
+        self.goto(url)
         self.page.wait_for_timeout(5000)
         self.wait_for_page_load()
     
@@ -86,6 +183,76 @@ class BasePage:
     # ========================================
     # WAITING METHODS
     # ========================================
+
+    def content_fingerprint(self, selector: str) -> str:
+        """Cheap fingerprint (count + hash of href/text) of the elements matching a CSS selector."""
+        return self.page.evaluate(_FINGERPRINT_JS, selector)
+
+    def wait_for_transition(self, selector: str, action: Callable[[], Any],
+                            no_change_timeout: int = NO_CHANGE_TIMEOUT, min_count: int = 1) -> bool:
+        """
+        Run `action` and wait until the content under `selector` really re-renders.
+        
+        The fingerprint is taken before the action; afterwards the page itself
+        polls (one round trip, every animation frame) until a different
+        fingerprint with at least `min_count` elements holds for two frames,
+        so a briefly emptied container is never taken for the result. If the
+        action legitimately changes nothing, the wait ends after `no_change_timeout`.
+        
+        Args:
+            selector: CSS selector of the elements to watch (e.g. product cards)
+            action: The UI action expected to re-render them
+            no_change_timeout: Max wait for a change in milliseconds
+            min_count: Fewest elements an accepted state may have (0 = empty result allowed)
+        
+        Returns:
+            True if the content changed, False if it stayed the same
+        """
+        before = self.content_fingerprint(selector)
+        action()
+        result = self.page.evaluate(_TRANSITION_JS, [selector, before, no_change_timeout, min_count])
+        if result["changed"]:
+            logger.info(f"Content re-rendered ({before} -> {result['fingerprint']})")
+        else:
+            logger.info(f"Content unchanged after {no_change_timeout}ms ({before})")
+        return result["changed"]
+
+    @property
+    def animations_suppressed(self) -> bool:
+        """True when the page runs without animations (no settle waits needed)."""
+        return animations_suppressed(self.page)
+
+    def wait_for_static(self, locator: Locator, timeout: Optional[int] = None):
+        """
+        Wait until an element is visible and no longer moving.
+        
+        With animations suppressed, visible already means static. Otherwise
+        the element's box must be unchanged over two animation frames
+        (checked in the page, one round trip).
+        
+        Args:
+            locator: Playwright Locator object
+            timeout: Max wait time in milliseconds (optional)
+        """
+        timeout = timeout or self.timeout
+        expect(locator).to_be_visible(timeout=timeout)
+        if self.animations_suppressed:
+            return
+        locator.evaluate(
+            """(el, timeout) => new Promise(resolve => {
+                const deadline = performance.now() + timeout;
+                let last = null;
+                const check = () => {
+                    const r = el.getBoundingClientRect();
+                    const box = [r.x, r.y, r.width, r.height].join();
+                    if (box === last || performance.now() > deadline) return resolve();
+                    last = box;
+                    requestAnimationFrame(check);
+                };
+                requestAnimationFrame(check);
+            })""",
+            timeout,
+        )
     
     def wait_for_page_load(self):
         """Wait for page to fully load (DOM + network idle)."""
@@ -131,6 +298,17 @@ class BasePage:
         logger.info(f"Waiting for URL to contain: {text}")
         self.page.wait_for_url(f"**/*{text}*", timeout=timeout)
     
+    def skip_time(self, window: str) -> bool:
+        """
+        Jump over a known timer window (see TIME_WINDOWS) on the virtual clock.
+        
+        No-op in real time: callers still wait for the outcome (expect, response).
+        
+        Returns:
+            True if time was skipped
+        """
+        return skip_window(self, window)
+
     def wait(self, milliseconds: int):
         """
         Hard wait for specified time.
@@ -175,7 +353,8 @@ class BasePage:
         except:
             pass
         self._wait_for_dom_stable(timeout=2000)
-        time.sleep(0.1)
+        if not self.animations_suppressed:
+            time.sleep(0.1)  # let transitions finish
     
     def _wait_for_dom_stable(self, timeout: int = 2000):
         """Internal helper.
@@ -422,6 +601,40 @@ class BasePage:
         """
         return locator.count()
     
+    def read_many(self, selectors: Dict[str, Union[str, Tuple[str, Sequence[str]]]],
+                  properties: Sequence[str] = ("count", "visible", "text")) -> Dict[str, Dict[str, Any]]:
+        """
+        Read several elements' state in one in-page evaluation (one round trip).
+        
+        Replaces chains of get_text / get_attribute / is_visible / is_enabled /
+        get_element_count calls, one IPC call each.
+        
+        Args:
+            selectors: name -> CSS selector, or name -> (CSS selector, properties)
+                (use the raw selector constants of the locator classes)
+            properties: Default properties for entries that do not list their own:
+                count, texts / values (all matches), and of the first match
+                text, visible, enabled, checked, value, attr:<name>
+        
+        Returns:
+            name -> {property: value}; text/value/attr are None when nothing matches
+        
+        Example:
+            state = home_page.read_many({
+                "cards": HomePageLocators.PRODUCT_CARDS,
+                "sort": (HomePageLocators.SORT, ["value", "enabled"]),
+            })
+            assert state["cards"]["count"] == 9
+        """
+        specs = []
+        for name, spec in selectors.items():
+            selector, wanted = (spec, properties) if isinstance(spec, str) else spec
+            unknown = [p for p in wanted if p not in READ_PROPERTIES and not p.startswith("attr:")]
+            if unknown:
+                raise ValueError(f"Unknown properties for {name!r}: {unknown}")
+            specs.append([name, selector, list(wanted)])
+        return self.page.evaluate(_READ_MANY_JS, specs)
+
     def get_collection_count_safe(self, locator: Locator, minimum=1) -> int:
         """
         Get product count safely (waits for products first).
@@ -1,10 +1,65 @@
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.checkout_page import CheckoutSignInStep
 from pages.components.project_locators.pages_locators import CartPageLocators
+from config.config import Config
+from utils.product_table import parse_decimal_price, parse_price
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Whole cart table in one round trip: raw texts, parsed in Python
+_CART_SNAPSHOT_JS = """
+([rowSelector, productSelector, unitPriceSelector, quantitySelector, lineTotalSelector, totalSelector]) => ({
+    lines: [...document.querySelectorAll(rowSelector)]
+        .filter(row => row.querySelector(productSelector))
+        .map(row => ({
+            product: row.querySelector(productSelector).innerText.trim(),
+            unitPrice: (row.querySelector(unitPriceSelector) || {}).innerText || '',
+            quantity: (row.querySelector(quantitySelector) || {}).value || '0',
+            lineTotal: (row.querySelector(lineTotalSelector) || {}).innerText || '',
+        })),
+    total: (document.querySelector(totalSelector) || {}).innerText || null,
+})
+"""
+
+# Expected line: quantity, or (quantity, unit price)
+ExpectedLine = Union[int, Tuple[int, Union[Decimal, str, float]]]
+
+
+class CartLine:
+    """One row of the cart table."""
+
+    __slots__ = ("product", "unit_price", "quantity", "line_total")
+
+    def __init__(self, product: str, unit_price: Decimal, quantity: int, line_total: Decimal):
+        self.product = product
+        self.unit_price = unit_price
+        self.quantity = quantity
+        self.line_total = line_total
+
+    def __repr__(self):
+        return f"CartLine({self.product!r}, {self.quantity} x {self.unit_price} = {self.line_total})"
+
+
+class CartSnapshot:
+    """Every cart line plus subtotal (sum of line totals) and displayed total."""
+
+    def __init__(self, lines: List[CartLine], total: Optional[Decimal]):
+        self.lines = lines
+        self.total = total
+        self.subtotal = sum((line.line_total for line in lines), Decimal("0"))
+
+    def line(self, product: str) -> Optional[CartLine]:
+        return next((line for line in self.lines if line.product == product), None)
+
+    @property
+    def item_count(self) -> int:
+        return sum(line.quantity for line in self.lines)
+
+
 class CartPage(BasePage):
 
     def __init__(self, page: Page):
@@ -19,23 +74,143 @@ class CartPage(BasePage):
     def get_total_cart_amount(self) -> float:
         """Extracts the final total price as a float."""
         total_text = self.locators.total_price.inner_text()
-        return float(total_text.replace('$', '').strip())
+        return parse_price(total_text)
 
     def get_cart_total(self) -> int:
-        """Retrieves the final amount from the checkout page."""
+        """
+        Retrieves the final amount from the checkout page, in whole units.
+
+        Raises:
+            ValueError: The total has cents (use get_final_price instead)
+        """
         expect(self.locators.total_price_text).to_be_visible()
         price_str = self.locators.total_price_text.text_content()
-        clean_price = price_str.replace("$", "").replace(",", "").strip()
-        return int(clean_price)
+        total = parse_decimal_price(price_str)
+        if total != total.to_integral_value():
+            raise ValueError(f"Cart total {price_str.strip()!r} is not a whole amount, use get_final_price()")
+        return int(total)
 
     def get_final_price(self) -> float:
         """Retrieves the final amount from the checkout page."""
         expect(self.locators.total_price_text).to_be_visible()
         price_str = self.locators.total_price_text.text_content()
-        clean_price = price_str.replace("$", "").replace(",", "").strip()
-        return float(clean_price)
+        return parse_price(price_str)
+
+    def get_line_quantity(self, product_name: str) -> int:
+        """Current quantity of a cart line."""
+        quantity_input = self.get_product_row(product_name).locator(self.locators.line_quantity_input)
+        return int(quantity_input.input_value() or 0)
+
+    def set_line_quantity(self, product_name: str, quantity: int) -> None:
+        """
+        Change the quantity of an existing cart line in place.
+
+        Waits for the cart update request instead of a fixed sleep.
+        """
+        if self.get_line_quantity(product_name) == quantity:
+            return
+        quantity_input = self.get_product_row(product_name).locator(self.locators.line_quantity_input)
+        with self.page.expect_response(lambda r: "/carts/" in r.url and r.request.method == "PUT"):
+            quantity_input.fill(str(quantity))
+            quantity_input.press("Tab")  # commit the value (change event)
+        logger.info(f"Cart line <{product_name}> quantity set to {quantity}")
+
+    def clear_cart(self) -> None:
+        """Remove every line from the cart."""
+        while self.locators.delete_button.count() > 0:
+            with self.page.expect_response(lambda r: "/carts/" in r.url and r.request.method == "DELETE"):
+                self.locators.delete_button.first.click()
+        logger.info("Cart cleared")
+
+    def attach_cart(self, cart_id: str, item_count: int) -> None:
+        """
+        Make the browser use a cart built through the API (APIClient.seed_cart), then open it.
+        
+        The storefront keeps the cart in sessionStorage (cart_id, cart_quantity),
+        so the origin must be loaded before writing them.
+        
+        Args:
+            cart_id: Id returned by APIClient.seed_cart
+            item_count: Total units (shown in the cart badge)
+        """
+        if not self.page.url.startswith(Config.BASE_URL):
+            self.goto(Config.BASE_URL)
+        self.page.evaluate(
+            "([cartId, count]) => { sessionStorage.setItem('cart_id', cartId);"
+            " sessionStorage.setItem('cart_quantity', String(count)); }",
+            [cart_id, item_count],
+        )
+        self.goto(f"{Config.BASE_URL.rstrip('/')}/checkout")
+        expect(self.locators.total_price_text).to_be_visible()
+        logger.info(f"Attached seeded cart {cart_id} ({item_count} item(s))")
+
+    def snapshot(self) -> CartSnapshot:
+        """
+        Read the whole cart (every line, subtotal, total) in one evaluate call.
+        
+        Returns:
+            CartSnapshot with Decimal amounts
+        """
+        expect(self.locators.total_price_text).to_be_visible()
+        raw = self.page.evaluate(_CART_SNAPSHOT_JS, [
+            CartPageLocators.CART_ROW, CartPageLocators.LINE_PRODUCT, CartPageLocators.LINE_UNIT_PRICE,
+            CartPageLocators.LINE_QUANTITY, CartPageLocators.LINE_TOTAL, CartPageLocators.CART_TOTAL,
+        ])
+        lines = [
+            CartLine(
+                product=line["product"],
+                unit_price=parse_decimal_price(line["unitPrice"]),
+                quantity=int(line["quantity"]),
+                line_total=parse_decimal_price(line["lineTotal"]),
+            )
+            for line in raw["lines"]
+        ]
+        total = parse_decimal_price(raw["total"]) if raw["total"] else None
+        return CartSnapshot(lines, total)
+
+    def verify_against(self, expected_lines: Dict[str, ExpectedLine]) -> CartSnapshot:
+        """
+        Check the whole cart in one pass (one snapshot, every mismatch reported at once).
+        
+        Checks: same products, quantities, unit prices (when given),
+        line total = unit price x quantity, total = sum of line totals.
+        
+        Args:
+            expected_lines: product name -> quantity, or -> (quantity, unit price)
+        
+        Returns:
+            The snapshot, for further assertions
+        
+        Raises:
+            AssertionError: Listing every mismatch
+        """
+        snapshot = self.snapshot()
+        problems = []
+        for product, expected in expected_lines.items():
+            quantity, unit_price = expected if isinstance(expected, tuple) else (expected, None)
+            line = snapshot.line(product)
+            if line is None:
+                problems.append(f"{product}: missing from cart")
+                continue
+            if line.quantity != quantity:
+                problems.append(f"{product}: quantity {line.quantity}, expected {quantity}")
+            if unit_price is not None and line.unit_price != Decimal(str(unit_price)):
+                problems.append(f"{product}: unit price {line.unit_price}, expected {unit_price}")
+            if line.line_total != line.unit_price * line.quantity:
+                problems.append(f"{product}: line total {line.line_total} != {line.quantity} x {line.unit_price}")
+        for line in snapshot.lines:
+            if line.product not in expected_lines:
+                problems.append(f"{line.product}: unexpected line")
+        if snapshot.total != snapshot.subtotal:
+            problems.append(f"cart total {snapshot.total} != sum of lines {snapshot.subtotal}")
+
+        if problems:
+            raise AssertionError("Cart mismatch:\n  " + "\n  ".join(problems))
+        logger.info(f"Cart verified: {len(snapshot.lines)} line(s), total {snapshot.total}")
+        return snapshot
 
-    def proceed_to_checkout(self) -> None:
-        """Proceeds to the checkout page."""
+    def proceed_to_checkout(self) -> CheckoutSignInStep:
+        """Proceeds to the sign in step of the checkout wizard."""
         self.locators.checkout_button.click()
+        return CheckoutSignInStep(self.page)
 
@@ -0,0 +1,55 @@
+from playwright.sync_api import Page
+from pages.cart_page import CartPage
+from pages.home_page import HomePage
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CartSession:
+    """
+    Drives "put N units of a product in the cart and read the total".
+
+    Two modes:
+        reuse=False: every call starts from scratch (open product, add N times, open cart).
+        reuse=True:  the cart is kept between calls. While consecutive calls
+                     target the same product, only the cart line quantity is
+                     changed in place; a new product empties the cart first.
+
+    Example:
+        session = CartSession(page, reuse=True)
+        session.order_total("Hammer", 1)   # open product + add + open cart
+        session.order_total("Hammer", 3)   # only updates the quantity
+    """
+
+    def __init__(self, page: Page, reuse: bool = False):
+        self.page = page
+        self.reuse = reuse
+        self.home_page = HomePage(page)
+        self.cart_page = CartPage(page)
+        self.current_product: Optional[str] = None
+
+    def order_total(self, product_name: str, quantity: int) -> float:
+        """Put `quantity` units of the product in the cart and return the cart total."""
+        if not self.reuse:
+            logger.info(f"Fresh cart for product: {product_name}")
+            self.home_page.add_product_to_cart(product_name, quantity)
+            self.home_page.go_to_cart()
+            return self.cart_page.get_final_price()
+
+        if self.current_product != product_name:
+            logger.info(f"New cart batch for product: {product_name}")
+            if self.current_product is not None:
+                self.cart_page.clear_cart()
+            self.home_page.add_product_to_cart(product_name, 1)
+            self.home_page.go_to_cart()
+            self.current_product = product_name
+
+        self.cart_page.set_line_quantity(product_name, quantity)
+        return self.cart_page.get_final_price()
+
+    def finish_row(self) -> None:
+        """End of one data row: fresh sessions go on to checkout, batches keep the cart."""
+        if not self.reuse:
+            self.cart_page.proceed_to_checkout()
@@ -0,0 +1,132 @@
+from playwright.sync_api import Page, expect
+from pages.base_page import BasePage
+from pages.components.project_locators.pages_locators import CheckoutLocators
+from typing import Dict, Optional
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Billing address fields, in form order
+ADDRESS_FIELDS = ("street", "city", "state", "country", "postal_code")
+
+
+class CheckoutSignInStep(BasePage):
+    """Step 2 of the checkout wizard: sign in (or confirm the current login)."""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.locators = CheckoutLocators(page)
+
+    def is_logged_in(self) -> bool:
+        """True when the step only shows the "already logged in" message."""
+        return self.locators.logged_in_message.is_visible()
+
+    def sign_in(self, email: str, password: str) -> None:
+        """Log in through the step's own form."""
+        logger.info(f"Checkout sign in as: {email}")
+        self.locators.email_input.fill(email)
+        self.locators.password_input.fill(password)
+        self.locators.login_button.click()
+        expect(self.locators.proceed_sign_in).to_be_visible()
+
+    def proceed(self) -> "BillingAddressStep":
+        """Go on to the billing address step."""
+        self.locators.proceed_sign_in.click()
+        self.wait_for_static(self.locators.street)
+        return BillingAddressStep(self.page)
+
+
+class BillingAddressStep(BasePage):
+    """Step 3 of the checkout wizard: billing address (pre-filled from the account)."""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.locators = CheckoutLocators(page)
+
+    def _field(self, name: str):
+        return getattr(self.locators, name)
+
+    def get_address(self) -> Dict[str, str]:
+        """Current value of every address field."""
+        return {name: self._field(name).input_value() for name in ADDRESS_FIELDS}
+
+    def fill(self, address: Dict[str, str]) -> None:
+        """
+        Fill the given fields (others keep their current value).
+
+        Args:
+            address: Subset of street, city, state, country, postal_code
+        """
+        for name in ADDRESS_FIELDS:
+            if name in address:
+                self._field(name).fill(str(address[name]))
+        logger.info(f"Billing address filled: {address}")
+
+    def can_proceed(self) -> bool:
+        """The proceed button is only enabled once the address is valid."""
+        return self.locators.proceed_address.is_enabled()
+
+    def proceed(self) -> "PaymentStep":
+        """Go on to the payment step."""
+        expect(self.locators.proceed_address).to_be_enabled()
+        self.locators.proceed_address.click()
+        self.wait_for_static(self.locators.payment_method)
+        return PaymentStep(self.page)
+
+
+class PaymentStep(BasePage):
+    """Step 4 of the checkout wizard: payment method, payment, order confirmation."""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.locators = CheckoutLocators(page)
+
+    def choose_method(self, method: str) -> None:
+        """
+        Select the payment method.
+
+        Args:
+            method: Option value, e.g. "credit-card", "bank-transfer", "cash-on-delivery"
+        """
+        self.locators.payment_method.select_option(method)
+
+    def pay_by_credit_card(self, number: str, expiration: str, cvv: str, holder: str) -> None:
+        """Select credit card and fill its details (expiration as MM/YYYY)."""
+        self.choose_method("credit-card")
+        self.locators.card_number.fill(number)
+        self.locators.card_expiration.fill(expiration)
+        self.locators.card_cvv.fill(cvv)
+        self.locators.card_holder.fill(holder)
+
+    def pay_by_bank_transfer(self, bank_name: str, account_name: str, account_number: str) -> None:
+        """Select bank transfer and fill its details."""
+        self.choose_method("bank-transfer")
+        self.locators.bank_name.fill(bank_name)
+        self.locators.account_name.fill(account_name)
+        self.locators.account_number.fill(account_number)
+
+    def finish(self) -> str:
+        """
+        Submit the payment.
+
+        Returns:
+            The payment success message
+        """
+        self.locators.finish_button.click()
+        expect(self.locators.payment_success).to_be_visible()
+        return self.locators.payment_success.inner_text().strip()
+
+    def confirm_order(self) -> Optional[str]:
+        """
+        Place the order after a successful payment.
+
+        Returns:
+            Invoice number (e.g. "INV-2026000123"), None if not shown
+        """
+        self.locators.finish_button.click()
+        expect(self.locators.order_confirmation).to_be_visible()
+        match = re.search(r"INV-\d+", self.locators.order_confirmation.inner_text())
+        invoice = match.group(0) if match else None
+        logger.info(f"Order confirmed: {invoice}")
+        return invoice
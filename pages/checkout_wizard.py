@@ -0,0 +1,75 @@
+from playwright.sync_api import Page
+from pages.cart_page import CartPage
+from pages.login_page import LoginPage
+from config.config import Config
+from utils.product_locator import product_locator
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Wizard steps, in order
+STEPS = ("cart", "sign_in", "address", "payment")
+
+
+class CheckoutWizard:
+    """
+    Opens the checkout wizard directly at the step a test targets.
+
+    Everything before that step is prepared through the API instead of the UI:
+        cart     -> APIClient.seed_cart + CartPage.attach_cart
+        sign in  -> APIClient.login + LoginPage.attach_token
+        address  -> the account's stored address pre-fills the form
+                    (pass `address` to override it)
+    The earlier steps are then only passed with their "proceed" buttons.
+
+    Full UI flows stay in tests/SmokeTests.
+
+    Example:
+        payment = CheckoutWizard(page, api_client).open_at("payment", {"Hammer": 2})
+        payment.pay_by_bank_transfer("Test Bank", "Jane Doe", "12345678")
+        payment.finish()
+    """
+
+    def __init__(self, page: Page, api_client):
+        self.page = page
+        self.api_client = api_client
+
+    def open_at(self, step: str, lines: Dict[str, int], email: Optional[str] = None,
+                password: Optional[str] = None, address: Optional[Dict[str, str]] = None):
+        """
+        Prepare cart and login through the API, then open the wizard at `step`.
+
+        Args:
+            step: One of STEPS
+            lines: Product name -> quantity
+            email: Account to log in with (default: Config.TEST_USER)
+            password: Its password (default: Config.TEST_PWD)
+            address: Billing address fields to fill when passing the address step
+
+        Returns:
+            CartPage, CheckoutSignInStep, BillingAddressStep or PaymentStep
+        """
+        if step not in STEPS:
+            raise ValueError(f"Unknown checkout step {step!r}, expected one of {STEPS}")
+
+        token = self.api_client.login(email or Config.TEST_USER, password or Config.TEST_PWD)
+        cart_id = self.api_client.seed_cart({product_locator.resolve(name): qty for name, qty in lines.items()})
+        LoginPage(self.page).attach_token(token)
+        cart_page = CartPage(self.page)
+        cart_page.attach_cart(cart_id, sum(lines.values()))
+        logger.info(f"Cart and login prepared via API, advancing to <{step}>")
+        if step == "cart":
+            return cart_page
+
+        sign_in = cart_page.proceed_to_checkout()
+        if step == "sign_in":
+            return sign_in
+
+        address_step = sign_in.proceed()
+        if step == "address":
+            return address_step
+
+        if address:
+            address_step.fill(address)
+        return address_step.proceed()
@@ -1,7 +1,60 @@
 from playwright.sync_api import Page
-from project_locators.components_locators import FilterLocators
+from pages.components.project_locators.components_locators import FilterLocators
+from utils.clock_control import skip_window
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Reads every checkbox of one or more groups in a single round trip
+_CHECKBOX_STATE_JS = """
+selectors => Object.fromEntries(Object.entries(selectors).map(([group, selector]) => [
+    group,
+    [...document.querySelectorAll(selector)].map(box => ({
+        value: box.value,
+        label: ((box.closest('label') || box.parentElement || {}).innerText || '').trim(),
+        dataTest: box.getAttribute('data-test'),
+        checked: box.checked,
+    })),
+]))
+"""
+
+# Clicks the given checkboxes (by value) of each group in a single round trip
+_TOGGLE_JS = """
+groups => groups.forEach(([selector, values]) => {
+    const wanted = new Set(values);
+    document.querySelectorAll(selector).forEach(box => { if (wanted.has(box.value)) box.click(); });
+})
+"""
+
+# Geometry and value of one ngx-slider handle: where to grab it, where the track is
+_SLIDER_POINTER_JS = """
+pointer => {
+    const track = pointer.closest('ngx-slider').getBoundingClientRect();
+    const handle = pointer.getBoundingClientRect();
+    return {
+        trackLeft: track.left,
+        trackWidth: track.width,
+        handleX: handle.left + handle.width / 2,
+        handleY: handle.top + handle.height / 2,
+        handleWidth: handle.width,
+        floor: Number(pointer.getAttribute('aria-valuemin')),
+        ceil: Number(pointer.getAttribute('aria-valuemax')),
+        value: Number(pointer.getAttribute('aria-valuenow')),
+    };
+}
+"""
+
+# Grid considered settled after this long without a new /products request
+# (real time: on top of the filter debounce, so a pending request is not missed)
+GRID_QUIET_MS = 150
+
 
 class Filters:
+    # Timer windows skipped on the virtual clock (utils/clock_control.py)
+    TIME_WINDOWS = {"filter_debounce": 500}
 
     def __init__(self, page: Page):
         self.page = page
@@ -39,31 +92,185 @@ class Filters:
         elif isinstance(brand_identifier, int):
             self.locators.brand_id.nth(brand_identifier).uncheck()
     
-    def set_price_range(self, min_price: None, max_price: None):
-        """Set price range filter."""
-        if min_price is not None:
-            self.locators.price_min.fill(str(min_price))
-        if max_price is not None:
-            self.locators.price_max.fill(str(max_price))
-        self.locators.price_apply_btn.click()
+    def get_price_range(self) -> Tuple[int, int]:
+        """Current (min, max) of the price slider."""
+        return (int(self.locators.slider_min_pointer.get_attribute("aria-valuenow")),
+                int(self.locators.slider_max_pointer.get_attribute("aria-valuenow")))
+
+    def _drag_pointer(self, pointer, value: int) -> None:
+        """
+        Move one slider handle to `value` with a single drag.
+        
+        The target pixel is computed the way ngx-slider maps positions to
+        values (handle centre travels over track width - handle width), so
+        the cost does not depend on the distance. Sub-pixel rounding may land
+        one step off; that is corrected with arrow keys.
+        """
+        geometry = pointer.evaluate(_SLIDER_POINTER_JS)
+        if geometry["value"] == value:
+            return
+        floor, ceil = geometry["floor"], geometry["ceil"]
+        if not floor <= value <= ceil:
+            raise ValueError(f"Price {value} outside the slider range [{floor}, {ceil}]")
+
+        travel = geometry["trackWidth"] - geometry["handleWidth"]
+        target_x = geometry["trackLeft"] + geometry["handleWidth"] / 2 + (value - floor) / (ceil - floor) * travel
+        mouse = self.page.mouse
+        mouse.move(geometry["handleX"], geometry["handleY"])
+        mouse.down()
+        mouse.move(target_x, geometry["handleY"])
+        mouse.up()
+
+        offset = value - int(pointer.get_attribute("aria-valuenow"))
+        for _ in range(abs(offset)):
+            pointer.press("ArrowRight" if offset > 0 else "ArrowLeft")
+        if offset:
+            logger.info(f"Slider landed {-offset:+d} step(s) off {value}, corrected with arrow keys")
+
+    def set_price_range(self, min_price: Optional[int] = None, max_price: Optional[int] = None,
+                        timeout: int = 10000) -> Tuple[int, int]:
+        """
+        Set the price slider to exact values, then settle the grid once.
+        
+        One drag per handle (computed target, no per-unit key presses), and
+        only the response of the last /products request is awaited.
+        
+        Args:
+            min_price: New lower bound (None = unchanged)
+            max_price: New upper bound (None = unchanged)
+            timeout: Max wait for the grid requests to stop (ms)
+        
+        Returns:
+            (min, max) shown by the slider afterwards
+        """
+        self.locators.slider_min_pointer.scroll_into_view_if_needed()
+        current_min, current_max = self.get_price_range()
+        moves = [(self.locators.slider_min_pointer, min_price), (self.locators.slider_max_pointer, max_price)]
+        # Handles cannot cross: raising the minimum past the current maximum needs the maximum moved first
+        if min_price is not None and min_price > current_max:
+            moves.reverse()
+        moves = [(pointer, value) for pointer, value in moves if value is not None]
+
+        def drag():
+            for pointer, value in moves:
+                self._drag_pointer(pointer, value)
+
+        requests = self._settle_grid(drag, timeout)
+        price_range = self.get_price_range()
+        logger.info(f"Price range set to {price_range} ({requests} grid request(s))")
+        return price_range
     
     def reset_all_filters(self):
         """Click reset button to clear all filters."""
         self.locators.reset_filters_btn.click()
     
+    def get_checkbox_states(self) -> Dict[str, List[dict]]:
+        """
+        State of every category and brand checkbox, read in one evaluate call.
+        
+        Returns:
+            {"categories": [...], "brands": [...]}, each item
+            {"value": id, "label": text, "dataTest": attr, "checked": bool}
+        """
+        return self.page.evaluate(_CHECKBOX_STATE_JS, {
+            "categories": FilterLocators.CATEGORY_CHECKBOXES,
+            "brands": FilterLocators.BRAND_CHECKBOXES,
+        })
+
+    def apply_filter_set(self, categories: Optional[Iterable[str]] = None,
+                         brands: Optional[Iterable[str]] = None, timeout: int = 10000) -> Dict[str, List[str]]:
+        """
+        Make exactly these categories/brands checked, then settle the grid once.
+        
+        The state is read in one evaluate call, all toggles happen in a second
+        one; instead of waiting after each toggle, only the response of the
+        last /products request they trigger is awaited.
+        
+        Args:
+            categories: Labels or ids to leave checked (None = leave categories as they are)
+            brands: Labels or ids to leave checked (None = leave brands as they are)
+            timeout: Max wait for the grid requests to stop (ms)
+        
+        Returns:
+            Checked ids per requested group after the change
+
+        Raises:
+            ValueError: A requested name matches no checkbox label or id (nothing is clicked)
+        """
+        targets = {"categories": categories, "brands": brands}
+        selectors = {"categories": FilterLocators.CATEGORY_CHECKBOXES, "brands": FilterLocators.BRAND_CHECKBOXES}
+        states = self.get_checkbox_states()
+
+        # Plan in Python from one read: final ids and the boxes to click
+        expected: Dict[str, List[str]] = {}
+        toggles = []
+        unmatched: Dict[str, List[str]] = {}
+        for group, wanted in targets.items():
+            if wanted is None:
+                continue
+            want = {w.lower(): w for w in wanted}
+            matches = [box for box in states[group] if box["label"].lower() in want or box["value"].lower() in want]
+            matched = {box["label"].lower() for box in matches} | {box["value"].lower() for box in matches}
+            if want.keys() - matched:
+                unmatched[group] = sorted(want[w] for w in want.keys() - matched)
+                continue
+            target = {box["value"] for box in matches}
+            expected[group] = sorted(target)
+            to_click = [box["value"] for box in states[group] if box["checked"] != (box["value"] in target)]
+            if to_click:
+                toggles.append([selectors[group], to_click])
+        if unmatched:
+            raise ValueError(f"No filter checkbox matches: {unmatched}")
+        if not toggles:
+            logger.info("Filters already in the requested state")
+            return expected
+
+        requests = self._settle_grid(lambda: self.page.evaluate(_TOGGLE_JS, toggles), timeout)
+        logger.info(f"Applied filter set in one batch ({requests} grid request(s)): {expected}")
+        return expected
+
+    def _settle_grid(self, action: Callable[[], None], timeout: int) -> int:
+        """
+        Run `action`, then wait only for the response of the last /products request it fired.
+        
+        Returns:
+            Number of grid requests fired
+        """
+        grid_requests = []
+
+        def on_request(request):
+            if urlparse(request.url).path.endswith("/products"):
+                grid_requests.append(request)
+
+        self.page.on("request", on_request)
+        try:
+            action()
+            # Debounced filters fire their request at once on the virtual clock;
+            # in real time the quiet window has to outlast the debounce instead
+            if skip_window(self, "filter_debounce"):
+                quiet_ms = GRID_QUIET_MS
+            else:
+                quiet_ms = self.TIME_WINDOWS["filter_debounce"] + GRID_QUIET_MS
+            deadline = time.monotonic() + timeout / 1000
+            seen = -1
+            # Quiet window: no new grid request for quiet_ms
+            while len(grid_requests) != seen and time.monotonic() < deadline:
+                seen = len(grid_requests)
+                self.page.wait_for_timeout(quiet_ms)
+        finally:
+            self.page.remove_listener("request", on_request)
+
+        if grid_requests:
+            grid_requests[-1].response()
+        return len(grid_requests)
+
     def reset_all_categories(self):
-        """Manually uncheck all category filters."""
-        count = self.locators.category_id.count()
-        for i in range(count):
-            if self.locators.category_id.nth(i).is_checked():
-                self.locators.category_id.nth(i).uncheck()
+        """Uncheck all category filters (one batch, one grid reload)."""
+        self.apply_filter_set(categories=[])
     
     def reset_all_brands(self):
-        """Manually uncheck all brand filters."""
-        count = self.locators.brand_id.count()
-        for i in range(count):
-            if self.locators.brand_id.nth(i).is_checked():
-                self.locators.brand_id.nth(i).uncheck()
+        """Uncheck all brand filters (one batch, one grid reload)."""
+        self.apply_filter_set(brands=[])
     
     def get_active_filters_count(self) -> int:
         """Get number of active filters."""
@@ -74,12 +281,5 @@ class Filters:
         return self.page.get_by_label(filter_name).is_checked()
     
     def get_checked_categories(self) -> list[str]:
-        """Get list of checked category names."""
-        checked = []
-        count = self.locators.category_id.count()
-        for i in range(count):
-            checkbox = self.locators.category_id.nth(i)
-            if checkbox.is_checked():
-                label = checkbox.get_attribute("data-test")
-                checked.append(label)
-        return checked
\ No newline at end of file
+        """Get list of checked category names (data-test values), read in one call."""
+        return [box["dataTest"] for box in self.get_checkbox_states()["categories"] if box["checked"]]
@@ -1,5 +1,6 @@
 from playwright.sync_api import Page
 from project_locators.components_locators import ProductGridLocators
+from utils.product_table import ProductTable, parse_price, parse_prices
 
 class ProductGrid:
 
@@ -30,7 +31,7 @@ class ProductGrid:
     def get_all_product_prices(self) -> list[float]:
         """Get all visible product prices as floats."""
         price_texts = self.locators.product_prices.all_inner_texts()
-        return [float(p.replace("$", "").replace(",", "").strip()) for p in price_texts]
+        return parse_prices(price_texts).tolist()
     
     def get_product_name(self, index: int = 0) -> str:
         """Get name of specific product."""
@@ -39,8 +40,12 @@ class ProductGrid:
     def get_product_price(self, index: int = 0) -> float:
         """Get price of specific product."""
         price_text = self.locators.product_prices.nth(index).inner_text()
-        return float(price_text.replace("$", "").replace(",", "").strip())
+        return parse_price(price_text)
     
+    def get_product_table(self) -> ProductTable:
+        """Snapshot of the visible grid (ids, names, prices) in one evaluate."""
+        return ProductTable.from_cards(self.locators.product_cards)
+
     def is_product_visible(self, index: int = 0) -> bool:
         """Check if product at index is visible."""
         return self.locators.product_cards.nth(index).is_visible()
@@ -67,15 +72,12 @@ class ProductGrid:
     
     def is_sorted_by_price_ascending(self) -> bool:
         """Verify products are sorted by price (low to high)."""
-        prices = self.get_all_product_prices()
-        return prices == sorted(prices)
+        return self.get_product_table().is_sorted("price")
     
     def is_sorted_by_price_descending(self) -> bool:
         """Verify products are sorted by price (high to low)."""
-        prices = self.get_all_product_prices()
-        return prices == sorted(prices, reverse=True)
+        return self.get_product_table().is_sorted("price", descending=True)
     
     def is_sorted_by_name_ascending(self) -> bool:
         """Verify products are sorted by name (A-Z)."""
-        names = self.get_all_product_names()
-        return names == sorted(names)
\ No newline at end of file
+        return self.get_product_table().is_sorted("name")
\ No newline at end of file
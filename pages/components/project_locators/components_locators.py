@@ -1,16 +1,24 @@
 from playwright.sync_api import Page
 
 class FilterLocators:
+    # Raw selectors, also used by the batch (single evaluate) operations
+    CATEGORY_CHECKBOXES = "input[name='category_id']"
+    BRAND_CHECKBOXES = "input[name='brand_id']"
+    SLIDER_MIN_POINTER = ".ngx-slider-pointer-min"
+    SLIDER_MAX_POINTER = ".ngx-slider-pointer-max"
+
     def __init__(self, page: Page):
         self.page = page
         # ===== Filters locators =====
         self.price_apply_btn = page.locator('[data-test="price-apply"]')
         self.reset_filters_btn = page.locator('[data-test="reset-filters"]')
         self.active_filters = page.locator('[data-test="active-filter"]')
-        self.category_id = page.locator("input[name='category_id']")
-        self.brand_id = page.locator("input[name='brand_id']")
+        self.category_id = page.locator(self.CATEGORY_CHECKBOXES)
+        self.brand_id = page.locator(self.BRAND_CHECKBOXES)
         self.price_min = page.locator('[data-test="price-min"]')
         self.price_max = page.locator('[data-test="price-max"]')
+        self.slider_min_pointer = page.locator(self.SLIDER_MIN_POINTER)
+        self.slider_max_pointer = page.locator(self.SLIDER_MAX_POINTER)
 
 
 class HeaderLocators:
@@ -50,13 +58,17 @@ class ProductGridLocators:
 
 
 class SearchBarLocators:
+    # Raw selectors, also used by the in-page search benchmark probe
+    SEARCH_INPUT = '[data-test="search-query"]'
+    SUGGESTIONS = '[data-test^="search-suggestion"]'
+
     def __init__(self, page: Page):
         self.page = page
         # ===== Search bar locators =====
-        self.search_input = page.locator('[data-test="search-query"]')
+        self.search_input = page.locator(self.SEARCH_INPUT)
+        self.search_suggestions = page.locator(self.SUGGESTIONS)
         self.search_button = page.locator('[data-test="search-submit"]')
         self.search_reset = page.locator('[data-test="search-reset"]')
-        self.search_suggestions = page.locator('[data-test="search-suggestions"]')
 
 class HomePageLocators:
     def __init__(self, page: Page):
@@ -87,7 +99,7 @@ class HomePageLocators:
         self.search_input = page.locator('[data-test="search-query"]')
         self.search_submit_button = page.locator('[data-test="search-submit"]')
         self.search_reset_button = page.locator('[data-test="search-reset"]')
-        self.search_suggestions = page.locator('[data-test="search-suggestions"]')
+        self.search_suggestions = page.locator(SearchBarLocators.SUGGESTIONS)
         self.search_term = page.locator("[data-test=\"search-term\"]")
 
         # FILTER SIDEBAR LOCATORS
@@ -1,4 +1,5 @@
 from playwright.sync_api import Page
+from pages.components.project_locators.components_locators import SearchBarLocators
 
 
 class LoginPageLocators:
@@ -14,6 +15,15 @@ class LoginPageLocators:
 
 
 class HomePageLocators:
+    # Raw selectors, also used by in-page reads/waits (BasePage.read_many, wait_for_transition)
+    PRODUCT_CARDS = "a.card[href^='/product/']"
+    NAVBAR = "nav.navbar"
+    CART_COUNT = '[data-test="cart-quantity"]'
+    SEARCH_INPUT = '[data-test="search-query"]'
+    SORT = '[data-test="sort"]'
+    ACTIVE_PAGE = "li.page-item.active a[role='button']"
+    PAGINATION = ".pagination"
+
     def __init__(self, page: Page):
         self.page = page
         # ===== HomePage locators =====
@@ -22,13 +32,13 @@ class HomePageLocators:
         self.signin_link = page.locator('[data-test="nav-sign-in"]')
         self.register_link = page.locator('[data-test=\"register-link\"]')
         self.cart_icon = page.locator('[data-test="nav-cart"]')
-        self.cart_count_badge = page.locator('[data-test="cart-quantity"]')
+        self.cart_count_badge = page.locator(self.CART_COUNT)
         self.user_menu = page.locator('[data-test="nav-user-menu"]')
-        self.active_page_number = page.locator("li.page-item.active a[role='button']")
+        self.active_page_number = page.locator(self.ACTIVE_PAGE)
 
         # SORTING & PAGINATION LOCATORS
-        self.sort_dropdown = page.locator('[data-test="sort"]')
-        self.pagination = page.locator(".pagination")
+        self.sort_dropdown = page.locator(self.SORT)
+        self.pagination = page.locator(self.PAGINATION)
         self.next_page_button = page.locator('[aria-label="Next"]')
         self.prev_page_button = page.locator('[aria-label="Previous"]')
 
@@ -39,10 +49,10 @@ class HomePageLocators:
         self.slider_text_200 = page.get_by_text("200").nth(1)
 
         # SEARCH BAR LOCATORS
-        self.search_input = page.locator('[data-test="search-query"]')
+        self.search_input = page.locator(self.SEARCH_INPUT)
         self.search_submit_button = page.locator('[data-test="search-submit"]')
         self.search_reset_button = page.locator('[data-test="search-reset"]')
-        self.search_suggestions = page.locator('[data-test="search-suggestions"]')
+        self.search_suggestions = page.locator(SearchBarLocators.SUGGESTIONS)
         self.search_term = page.locator("[data-test=\"search-term\"]")
 
         # FILTER SIDEBAR LOCATORS
@@ -55,7 +65,7 @@ class HomePageLocators:
 
         # PRODUCT GRID LOCATORS
         self.products_container = page.locator("div.col-md-9")
-        self.product_cards = page.locator("a.card[href^='/product/']")
+        self.product_cards = page.locator(self.PRODUCT_CARDS)
         self.first_product = page.locator("a.card[href^='/product/']").first
         self.product_name = page.locator('[data-test="product-name"]')
         self.product_prices = page.locator('[data-test="product-price"]')
@@ -71,7 +81,7 @@ class HomePageLocators:
         self.footer_contact_link = page.locator("footer a[href*='contact']")
 
         # PAGE STRUCTURE LOCATORS
-        self.navbar = page.locator("nav.navbar")
+        self.navbar = page.locator(self.NAVBAR)
         self.hero_section = page.locator(".hero-section")
 
 class ProductDetailsPageLocators:
@@ -101,6 +111,14 @@ class ProductDetailsPageLocators:
         self.cart_badge = page.locator('[data-test="cart-quantity"]')
 
 class CartPageLocators:
+    # Raw selectors, also used by CartPage.snapshot (single evaluate)
+    CART_ROW = "tbody tr"
+    LINE_PRODUCT = '[data-test="product-title"]'
+    LINE_UNIT_PRICE = '[data-test="product-price"]'
+    LINE_QUANTITY = '[data-test="product-quantity"]'
+    LINE_TOTAL = '[data-test="line-price"]'
+    CART_TOTAL = '[data-test="cart-total"]'
+
     def __init__(self, page: Page):
         self.page = page
 
@@ -117,6 +135,7 @@ class CartPageLocators:
 
         # ===== Quantity Controls (Inside the Cart) =====
         self.quantity_input = page.locator('[data-test="quantity"]')
+        self.line_quantity_input = page.locator('[data-test="product-quantity"]')
 
         # ===== Totals & Summary =====
         self.total_price = page.locator('[data-test="cart-total]')
@@ -136,3 +155,38 @@ class CartPageLocators:
         self.add_to_cart_btn = page.get_by_role("button", name="Add to Cart")
         self.cart_icon = page.locator(".cart-icon")
         self.checkout_btn = page.get_by_role("button", name="Proceed to Checkout")
+
+class CheckoutLocators:
+    def __init__(self, page: Page):
+        self.page = page
+
+        # ===== Wizard navigation (one "proceed" button per step) =====
+        self.proceed_cart = page.locator('[data-test="proceed-1"]')
+        self.proceed_sign_in = page.locator('[data-test="proceed-2"]')
+        self.proceed_address = page.locator('[data-test="proceed-3"]')
+
+        # ===== Step 2: Sign in =====
+        self.email_input = page.locator('[data-test="email"]')
+        self.password_input = page.locator('[data-test="password"]')
+        self.login_button = page.locator('[data-test="login-submit"]')
+        self.logged_in_message = page.get_by_text("you are already logged in")
+
+        # ===== Step 3: Billing address =====
+        self.street = page.locator('[data-test="street"]')
+        self.city = page.locator('[data-test="city"]')
+        self.state = page.locator('[data-test="state"]')
+        self.country = page.locator('[data-test="country"]')
+        self.postal_code = page.locator('[data-test="postal_code"]')
+
+        # ===== Step 4: Payment =====
+        self.payment_method = page.locator('[data-test="payment-method"]')
+        self.card_number = page.locator('[data-test="credit_card_number"]')
+        self.card_expiration = page.locator('[data-test="expiration_date"]')
+        self.card_cvv = page.locator('[data-test="cvv"]')
+        self.card_holder = page.locator('[data-test="card_holder_name"]')
+        self.bank_name = page.locator('[data-test="bank_name"]')
+        self.account_name = page.locator('[data-test="account_name"]')
+        self.account_number = page.locator('[data-test="account_number"]')
+        self.finish_button = page.locator('[data-test="finish"]')
+        self.payment_success = page.locator('[data-test="payment-success-message"]')
+        self.order_confirmation = page.locator('#order-confirmation')
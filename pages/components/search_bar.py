@@ -1,7 +1,10 @@
 from playwright.sync_api import Page
-from project_locators.components_locators import SearchBarLocators
+from pages.components.project_locators.components_locators import SearchBarLocators
+from utils.clock_control import skip_window
 
 class SearchBar:
+    # Timer windows skipped on the virtual clock (utils/clock_control.py)
+    TIME_WINDOWS = {"search_debounce": 500}
 
     def __init__(self, page: Page):
         self.page = page
@@ -33,14 +36,25 @@ class SearchBar:
         self.search_for(term)
         self.page.wait_for_load_state("networkidle", timeout=timeout)
     
-    def type_search_term(self, term: str):
-        """Type in search box WITHOUT submitting (for autocomplete testing)."""
-        self.locators.search_input.fill(term)
+    def type_search_term(self, term: str, delay: float = 0):
+        """
+        Type in search box WITHOUT submitting (for autocomplete testing).
+        
+        Args:
+            term: Text to enter
+            delay: Ms between keystrokes (0 = set the value at once, one input event)
+        """
+        if delay:
+            # Realistic typing (latency benchmark): keep real time
+            self.locators.search_input.press_sequentially(term, delay=delay)
+        else:
+            self.locators.search_input.fill(term)
+            skip_window(self, "search_debounce")
     
     def has_suggestions(self) -> bool:
         """Check if search suggestions are visible."""
-        return self.locators.search_suggestions.is_visible()
+        return self.locators.search_suggestions.first.is_visible()
     
     def click_first_suggestion(self):
         """Click first search suggestion."""
-        self.locators.search_suggestions.first.click()
\ No newline at end of file
+        self.locators.search_suggestions.first.click()
@@ -3,6 +3,11 @@ from logging import Logger
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
 from pages.components.project_locators.pages_locators import HomePageLocators
+from utils.product_table import ProductTable, parse_prices
+from utils.product_locator import product_locator
+from pages.product_details_page import ProductDetailsPage
+from pages.components.filters import Filters
+from pages.components.project_locators.components_locators import FilterLocators
 from typing import Optional
 import logging
 
@@ -20,6 +25,9 @@ class HomePage(BasePage):
         home_page_obj.search_for_product("Thor hammer")
         home_page_obj.signin_link.click()
     """
+
+    # Timer windows skipped on the virtual clock (utils/clock_control.py); filter ones come from Filters
+    TIME_WINDOWS = {**BasePage.TIME_WINDOWS, **Filters.TIME_WINDOWS}
     
     def __init__(self, page: Page):
         """
@@ -35,44 +43,53 @@ class HomePage(BasePage):
     # SORTING METHODS
     # ========================================
     
-    def sort_by_option(self, option_value: str):
+    def sort_by_option(self, option_value: str) -> ProductTable:
         """
         Sort products by value.
         
         Args:
             option_value: Sort option value (e.g., "price,asc")
-        """
-        self.locators.sort_dropdown.select_option(option_value)
         
-        # WAIT
-        self.wait_for_content_loaded()
+        Returns:
+            Snapshot of the re-rendered grid
+        """
+        # WAIT: only until the grid really re-renders
+        self.wait_for_transition(HomePageLocators.PRODUCT_CARDS,
+                                 lambda: self.locators.sort_dropdown.select_option(option_value))
+        return self.get_product_table()
     
-    def sort_by_label(self, label: str):
+    def sort_by_label(self, label: str) -> ProductTable:
         """
         Sort products by label text.
         
         Args:
             label: Sort option label (e.g., "Price (High - Low)")
+        
+        Returns:
+            Snapshot of the re-rendered grid (never the stale order)
         """
-        self.locators.sort_dropdown.select_option(label=label)
+        # WAIT: only until the grid really re-renders
+        self.wait_for_transition(HomePageLocators.PRODUCT_CARDS,
+                                 lambda: self.locators.sort_dropdown.select_option(label=label))
         logger.info(f"Sort product by label <{label}>")
-        
-        # WAIT
-        self.wait_for_content_loaded()
+        return self.get_product_table()
     
     # ========================================
     # PRICE RANGE METHOD
     # ========================================
     
-    #def drag_the_slider(self, slider_min: int, slider_max: int):
-    #    pass
-    
     def set_price_range(self, min_price, max_price):
-        """Set price range filter."""
-        if min_price is not None:
-            self.locators.slider_min = min_price
-        if max_price is not None:
-            self.locators.slider_max = max_price
+        """
+        Set the price slider to exact values (one drag per handle, one grid wait).
+        
+        Args:
+            min_price: Lower bound (None = unchanged)
+            max_price: Upper bound (None = unchanged)
+        
+        Returns:
+            (min, max) shown by the slider afterwards
+        """
+        return Filters(self.page).set_price_range(min_price, max_price)
     
     # ========================================
     # SEARCH METHODS
@@ -81,9 +98,35 @@ class HomePage(BasePage):
     def go_to_cart(self):
         self.locators.cart_icon.click()
 
+    def open_product(self, product_name: str):
+        """
+        Open a product's details page directly (/product/{id}), without searching.
+        
+        The id comes from utils.product_locator (catalog snapshot / cached lookup).
+        
+        Args:
+            product_name: Exact product name (e.g., "Thor Hammer")
+        """
+        self.goto(product_locator.url_for(product_name))
+        self.locators.add_to_cart_button.wait_for(state="visible")
+        logger.info(f"Opened product: {product_name}")
+
+    def add_product_to_cart(self, product_name: str, quantity: int = 1):
+        """
+        Open a product directly and add it to the shopping cart.
+        
+        Args:
+            product_name: Exact product name
+            quantity: Number of units
+        """
+        self.open_product(product_name)
+        ProductDetailsPage(self.page).add_to_cart(quantity)
+
     def search_and_add_to_cart(self, keyword: str, quantity: int = 1):
         """
         Searches for a product and adds it to the shopping cart.
+        
+        Goes through the search UI: use add_product_to_cart unless the test is about search.
         """
         logger.info(f"Searching for product: {keyword}")
 
@@ -96,13 +139,8 @@ class HomePage(BasePage):
 
         logger.info(f"clicked on product: {keyword}")
 
-        # 3. Add to cart (Handling quantity)
-        # Note: If a quantity selector exists, it should be handled here.
-        # This implementation clicks the add button 'quantity' times for simplicity.
-        for _ in range(int(quantity)):
-            self.locators.add_to_cart_button.click()
-
-        logger.info(f"Added {quantity} item(s) to cart.")
+        # 3. Add to cart: quantity typed once, a single click
+        ProductDetailsPage(self.page).add_to_cart(quantity)
     
     def search_for_product(self, product_name: str):
         """
@@ -160,7 +198,8 @@ class HomePage(BasePage):
         self.page.get_by_role("checkbox", name=category_name).check()
         logger.info(f"Filter by category <{category_name}> checkbox checked")
         
-        # WAIT
+        # WAIT (debounce skipped on the virtual clock)
+        self.skip_time("filter_debounce")
         self.wait_for_content_loaded()
     
     def unfilter_by_category(self, category_name: str):
@@ -173,7 +212,8 @@ class HomePage(BasePage):
         self.page.get_by_role("checkbox", name=category_name).uncheck()
         logger.info(f"Filter by category <{category_name}> checkbox unchecked")
         
-        # WAIT
+        # WAIT (debounce skipped on the virtual clock)
+        self.skip_time("filter_debounce")
         self.wait_for_content_loaded()
     
     def is_category_filtered(self, category_name: str) -> bool:
@@ -188,6 +228,20 @@ class HomePage(BasePage):
         """
         return self.page.get_by_role("checkbox", name=category_name).is_checked()
     
+    def filter_by_brand(self, brand_name: str):
+        """
+        Apply brand filter by name.
+        
+        Args:
+            brand_name: Brand name (e.g., "ForgeFlex Tools")
+        """
+        self.page.get_by_role("checkbox", name=brand_name).check()
+        logger.info(f"Filter by brand <{brand_name}> checkbox checked")
+        
+        # WAIT (debounce skipped on the virtual clock)
+        self.skip_time("filter_debounce")
+        self.wait_for_content_loaded()
+    
     def filter_by_brand_index(self, brand_index: int):
         """
         Apply brand filter by position.
@@ -308,10 +362,49 @@ class HomePage(BasePage):
             List of prices as floats
         """
         price_texts = self.locators.product_prices.all_inner_texts()
-        list_of_product_prices = [float(p.replace("$", "").replace(",", "").strip()) for p in price_texts]
+        list_of_product_prices = parse_prices(price_texts).tolist()
         logger.info(f"This is the list_of_product_prices: {list_of_product_prices}")
         return list_of_product_prices
     
+    def get_product_table(self) -> ProductTable:
+        """
+        Snapshot of the visible grid (ids, names, prices) in one evaluate.
+
+        Returns:
+            ProductTable in display order
+        """
+        return ProductTable.from_cards(self.locators.product_cards)
+
+    def get_page_state(self) -> dict:
+        """
+        Header, grid, pagination and filter state in one round trip (BasePage.read_many).
+        
+        Returns:
+            {"navbar_visible", "cart_count", "search_term", "sort", "product_count",
+             "active_page", "checked_categories", "checked_brands"}
+        """
+        state = self.read_many({
+            "navbar": (HomePageLocators.NAVBAR, ["visible"]),
+            "cart": (HomePageLocators.CART_COUNT, ["text"]),
+            "search": (HomePageLocators.SEARCH_INPUT, ["value"]),
+            "sort": (HomePageLocators.SORT, ["value"]),
+            "cards": (HomePageLocators.PRODUCT_CARDS, ["count"]),
+            "active_page": (HomePageLocators.ACTIVE_PAGE, ["text"]),
+            "categories": (FilterLocators.CATEGORY_CHECKBOXES + ":checked", ["values"]),
+            "brands": (FilterLocators.BRAND_CHECKBOXES + ":checked", ["values"]),
+        })
+        cart_text = state["cart"]["text"]
+        return {
+            "navbar_visible": state["navbar"]["visible"],
+            "cart_count": int(cart_text) if cart_text else 0,
+            "search_term": state["search"]["value"] or "",
+            "sort": state["sort"]["value"] or "",
+            "product_count": state["cards"]["count"],
+            "active_page": state["active_page"]["text"],
+            "checked_categories": state["categories"]["values"],
+            "checked_brands": state["brands"]["values"],
+        }
+
     def get_cart_count(self) -> int:
         """
         Get number of items in cart from badge.
@@ -345,8 +438,7 @@ class HomePage(BasePage):
         Returns:
             True if sorted correctly, False otherwise
         """
-        prices = self.get_all_product_prices()
-        return prices == sorted(prices)
+        return self.get_product_table().is_sorted("price")
     
     def is_products_sorted_by_price_descending(self) -> bool:
         """
@@ -355,8 +447,7 @@ class HomePage(BasePage):
         Returns:
             True if sorted correctly, False otherwise
         """
-        prices = self.get_all_product_prices()
-        return prices == sorted(prices, reverse=True)
+        return self.get_product_table().is_sorted("price", descending=True)
     
     def is_products_sorted_by_name_ascending(self) -> bool:
         """
@@ -365,6 +456,5 @@ class HomePage(BasePage):
         Returns:
             True if sorted correctly, False otherwise
         """
-        names = self.get_all_product_names()
-        return names == sorted(names)
+        return self.get_product_table().is_sorted("name")
 
@@ -34,3 +34,19 @@ class LoginPage(BasePage):
         # Optional: wait for navigation or dashboard
         self.page.wait_for_load_state("networkidle")
 
+    def attach_token(self, token: str) -> None:
+        """
+        Log the browser in with a token from APIClient.login (no login form).
+        
+        The storefront reads the token from localStorage, so the origin must be
+        loaded before writing it; the next navigation picks it up.
+        
+        Args:
+            token: Access token returned by APIClient.login
+        """
+        if not self.page.url.startswith(Config.BASE_URL):
+            self.goto(Config.BASE_URL)
+        self.page.evaluate("([key, token]) => localStorage.setItem(key, token)",
+                           [Config.AUTH_TOKEN_STORAGE_KEY, token])
+        logger.info("Attached API login token")
+
@@ -1,6 +1,7 @@
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
 from pages.components.project_locators.pages_locators import ProductDetailsPageLocators
+from utils.product_table import parse_prices
 from typing import Optional
 import logging
 import re
@@ -20,6 +21,35 @@ class ProductDetailsPage(BasePage):
         super().__init__(page)
         self.locators = ProductDetailsPageLocators(page)
 
+    # ========================================
+    # QUANTITY / ADD TO CART
+    # ========================================
+
+    def set_quantity(self, quantity: int):
+        """
+        Type the quantity in one action (instead of clicking +/- or add N times).
+        
+        Args:
+            quantity: Number of units
+        """
+        self.locators.quantity_input.fill(str(int(quantity)))
+
+    def add_to_cart(self, quantity: int = 1):
+        """
+        Add `quantity` units with a single add-to-cart click.
+        
+        Waits for the cart API call to complete, so the cart is up to date on return.
+        
+        Args:
+            quantity: Number of units
+        """
+        if int(quantity) != 1:
+            self.set_quantity(quantity)
+        with self.page.expect_response(
+                lambda r: re.search(r"/carts/[^/?]+$", r.url) is not None and r.request.method == "POST"):
+            self.locators.add_to_cart_btn.click()
+        logger.info(f"Added {quantity} item(s) to cart.")
+
     # ========================================
     # SORTING METHODS
     # ========================================
@@ -266,7 +296,7 @@ class ProductDetailsPage(BasePage):
             List of prices as floats
         """
         price_texts = self.locators.product_prices.all_inner_texts()
-        list_of_product_prices = [float(p.replace("$", "").replace(",", "").strip()) for p in price_texts]
+        list_of_product_prices = parse_prices(price_texts).tolist()
         logger.info(f"This is the list_of_product_prices: {list_of_product_prices}")
         return list_of_product_prices
     
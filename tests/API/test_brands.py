@@ -17,3 +17,18 @@ def test_should_retrieve_at_least_two_brands(api_client):
     logger.info(f"Brands found: {found_brands}")
     assert found_brands >= 2
 
+
+def test_should_serve_brands_from_cache_until_invalidated(cached_api_client):
+    # Arrange: Start from an empty entry for /brands
+    cached_api_client.invalidate_cache("/brands")
+
+    # Act: First call hits the network, second one the cache
+    first = cached_api_client.get_brands()
+    second = cached_api_client.get_brands()
+
+    # Assert: Same payload both times
+    assert first.ok and second.ok
+    assert second.json() == first.json()
+
+    # Assert: Explicit invalidation drops the entry
+    assert cached_api_client.invalidate_cache("/brands") >= 1
@@ -0,0 +1,20 @@
+import pytest
+import logging
+
+from utils.load_runner import run_load
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.load
+@pytest.mark.slow
+@pytest.mark.offline
+def test_should_sustain_concurrent_users_without_errors(api_stub):
+    # 1. Act: Short ramped run against the local stand-in
+    report = run_load(api_stub.base_url, concurrency=5, ramp_up=1, duration=3)
+
+    # 2. Assert: Traffic flowed and nothing failed
+    logger.info("\n" + report.format_table())
+    assert report.total_requests > 0, "No request completed during the load run"
+    assert report.error_rate == 0, f"Errors during load run: {dict(report.errors)}"
+    assert report.requests_per_second > 0
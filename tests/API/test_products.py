@@ -1,10 +1,11 @@
 import pytest
 import logging
 from playwright.sync_api import expect
+from utils.product_table import ProductTable
 
 logger = logging.getLogger(__name__)
 
-def test_should_filter_products_by_price_and_rental_status(api_client):
+def test_should_filter_products_by_price_and_rental_status(api_client, catalog):
     # 1. Arrange: Define the filters
     params = {
         "page": 1,
@@ -25,15 +26,46 @@ def test_should_filter_products_by_price_and_rental_status(api_client):
     # Check that we actually got items
     assert len(products) > 0, "No products returned for the specified filters"
 
-    # Validate the first item respects the filters
-    first_product = products[0]
+    # Validate every item of the page respects the filters
+    for product in products:
+        assert 1 <= product["price"] <= 100, f"{product['name']}: price {product['price']} is out of range!"
+        assert product["is_rental"] is False, f"{product['name']} should not be a rental"
 
-    # Check Price (Should be between 1 and 100)
-    product_price = first_product["price"]
-    assert 1 <= product_price <= 100, f"Product price {product_price} is out of range!"
-
-    # Check Rental Status (Should be False)
-    assert first_product["is_rental"] is False, "Product should not be a rental"
+    # Validate the whole result set against the catalog snapshot
+    expected = catalog.in_price_range(1, 100, is_rental=False)
+    assert payload["total"] == len(expected), \
+        f"API reports {payload['total']} matching products, catalog snapshot has {len(expected)}"
+    expected_ids = {product.id for product in expected}
+    unexpected = [product["name"] for product in products if product["id"] not in expected_ids]
+    assert not unexpected, f"Products outside the filter returned: {unexpected}"
 
     # Log results for the report
-    logger.info(f"Verified {len(products)} products. First item: {first_product['name']} at ${product_price}")
\ No newline at end of file
+    logger.info(f"Verified {len(products)} products (total {payload['total']}) against the catalog snapshot")
+
+def test_should_stream_every_product_across_pages(api_client):
+    # 1. Arrange: Read the expected total from the first page
+    response = api_client.get_products({"page": 1})
+    expect(response).to_be_ok()
+    expected_total = response.json()["total"]
+
+    # 2. Act: Stream all pages (background prefetch)
+    products = list(api_client.iter_products())
+
+    # 3. Assert: Every product arrives exactly once
+    table = ProductTable.from_products(products)
+    assert len(table) == expected_total, f"Expected {expected_total} products, streamed {len(table)}"
+    assert not table.duplicate_ids(), f"Duplicated products across pages: {table.duplicate_ids()}"
+
+    logger.info(f"Streamed {len(table)} products")
+
+
+def test_should_fetch_pages_concurrently_in_request_order(api_client):
+    # 1. Arrange: One request per page
+    requests_spec = [{"endpoint": "/products", "params": {"page": n}} for n in (1, 2, 3)]
+
+    # 2. Act: Run them in parallel
+    responses = api_client.fetch_many(requests_spec)
+
+    # 3. Assert: Results keep the request order
+    assert all(r.ok for r in responses), [r.status for r in responses]
+    assert [r.json()["current_page"] for r in responses] == [1, 2, 3]
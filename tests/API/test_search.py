@@ -0,0 +1,13 @@
+import logging
+
+from utils.search_oracle import verify_search_terms
+
+logger = logging.getLogger(__name__)
+
+
+def test_search_api_matches_oracle_for_every_catalog_word(api_client, search_index):
+    # 1. Act: Batch-check the whole term list against the live API
+    mismatches = verify_search_terms(api_client, search_index, search_index.probe_terms())
+
+    # 2. Assert: The oracle predicts every result count
+    assert not mismatches, f"Search differs from the oracle: {mismatches[:10]}"
@@ -0,0 +1,49 @@
+import pytest
+from playwright.sync_api import expect
+from pages.home_page import HomePage
+from pages.cart_page import CartPage
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.smoke
+@pytest.mark.e2e
+def test_full_checkout_flow(home_page_obj: HomePage, valid_user: dict, checkout_data: dict):
+    '''
+    The one checkout run driven entirely through the UI:
+    add to cart -> cart -> sign in -> billing address -> payment -> order.
+
+    Step-level tests open the wizard through API shortcuts instead
+    (tests/UI/test_checkout_wizard.py).
+    '''
+    # 1️⃣ Cart
+    home_page_obj.add_product_to_cart("Hammer", 1)
+    home_page_obj.go_to_cart()
+    cart_page = CartPage(home_page_obj.page)
+    cart_page.verify_against({"Hammer": 1})
+
+    # 2️⃣ Sign in
+    sign_in = cart_page.proceed_to_checkout()
+    sign_in.sign_in(valid_user["email"], valid_user["password"])
+
+    # 3️⃣ Billing address
+    address = sign_in.proceed()
+    address.fill({
+        "street": checkout_data["billing_address"],
+        "city": checkout_data["city"],
+        "state": checkout_data["state"],
+        "country": checkout_data["country"],
+        "postal_code": checkout_data["zip"],
+    })
+
+    # 4️⃣ Payment + order
+    payment = address.proceed()
+    payment.pay_by_credit_card(checkout_data["card_number"], checkout_data["expiry"],
+                               checkout_data["cvv"], checkout_data["card_holder"])
+    payment.finish()
+    invoice = payment.confirm_order()
+
+    logger.info(f"Full checkout placed order {invoice}")
+    assert invoice, "❌ No invoice number on the order confirmation"
+    expect(payment.locators.order_confirmation).to_contain_text(invoice)
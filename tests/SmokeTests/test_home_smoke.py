@@ -42,4 +42,21 @@ def test_home_footer_is_visible(home_page_obj: HomePage):
     '''
     Assert footer is visible
     ''' 
-    expect(home_page_obj.locators.footer).to_be_visible()
\ No newline at end of file
+    expect(home_page_obj.locators.footer).to_be_visible()
+
+
+def test_home_initial_state_in_one_read(home_page_obj: HomePage):
+    '''
+    Read header, grid, pagination and filters in one round trip
+    Assert the untouched home page state
+    '''
+    expect(home_page_obj.locators.product_cards.first).to_be_visible()
+
+    state = home_page_obj.get_page_state()
+    logger.info(f"Home page state: {state}")
+
+    assert state["navbar_visible"]
+    assert state["product_count"] > 0
+    assert state["active_page"] == "1"
+    assert state["search_term"] == ""
+    assert state["checked_categories"] == [] and state["checked_brands"] == []
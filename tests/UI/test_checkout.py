@@ -1,43 +1,61 @@
 import pytest
 import logging
 
-from pages.cart_page import CartPage
-from pages.home_page import HomePage
-from utils.data_loader import get_csv_data
-
-# 1. Load external test data (SKU, Quantity, Expected Price)
+# 1. External test data (SKU, Quantity, Expected Price), streamed lazily by
+# pytest_generate_tests (tests/conftest.py) and typed at load time
 # CSV content format: product_name, qty, expected_price
-TEST_DATA = get_csv_data("test_orders.csv")
+ORDER_SCHEMA = {"quantity": int, "expected_price": float}
 
 logger = logging.getLogger(__name__)
 
 @pytest.mark.usefixtures("setup_session")
-@pytest.mark.parametrize("data", TEST_DATA)
-def test_checkout_process(authenticated_page, data):
+@pytest.mark.dataset("test_orders.csv", id_column="product_name", schema=ORDER_SCHEMA,
+                     batch_by="product_name")
+def test_checkout_process(cart_session, data_row, catalog):
     """
-    Test the checkout process (uses 'authenticated_page' fixture for automatic login)
+    Test the checkout process (logged in through the stored session).
+
+    With --cart-batching, rows of the same product reuse one cart and only
+    change the line quantity; otherwise every row starts from scratch.
+
+    The expected total comes from the catalog snapshot (current API price);
+    the CSV `expected_price` is only cross-checked, as it may be stale.
     """
     # Arrange (Setup data)
-    product_name = data['product_name']
-    quantity = int(data['quantity'])
-    expected_price = float(data['expected_price'])
+    product_name = data_row['product_name']
+    quantity = data_row['quantity']
+    expected_price = float(catalog.expected_total(product_name, quantity))
+    if data_row['expected_price'] != expected_price:
+        logger.warning(f"⚠️  Stale test data: CSV expects {data_row['expected_price']} for "
+                       f"{quantity} x {product_name}, catalog price gives {expected_price}")
 
     # Act (Execute actions)
-    # 1. Search and add item to cart
-    home_page = HomePage(authenticated_page)
-    logger.info(f"Authenticated. now searching for product: {product_name}")
-    home_page.search_and_add_to_cart(product_name, quantity)
-    home_page.go_to_cart()
-
-    # 2. Proceed to checkout
-    checkout_page = CartPage(authenticated_page)
-    #
-    # 3. Retrieve final price
-    actual_price = checkout_page.get_final_price()
+    # 1. Put the items in the cart and retrieve the final price
+    logger.info(f"Authenticated. now ordering {quantity} x {product_name}")
+    actual_price = cart_session.order_total(product_name, quantity)
 
     # Assert (Verify results)
     logger.info(f"Verifying price: Expected {expected_price}, Got {actual_price}")
 
     assert actual_price == expected_price, \
         f"❌ Price mismatch! Expected: {expected_price}, Actual: {actual_price}"
-    checkout_page.proceed_to_checkout()
\ No newline at end of file
+
+    # 2. Proceed to checkout (fresh sessions only, batches keep the cart)
+    cart_session.finish_row()
+
+
+def test_seeded_cart_total_matches_catalog(seeded_cart, catalog):
+    """
+    Cart built server-side in one go (no product page, no add-to-cart clicks).
+    """
+    # Arrange
+    lines = {"Hammer": 3, "Thor Hammer": 2}
+    expected_total = sum(catalog.expected_total(name, qty) for name, qty in lines.items())
+
+    # Act
+    cart_page = seeded_cart(lines)
+
+    # Assert: every line and the total in one snapshot
+    snapshot = cart_page.verify_against(
+        {name: (qty, catalog.by_name(name).price) for name, qty in lines.items()})
+    assert snapshot.total == expected_total
@@ -0,0 +1,58 @@
+import pytest
+from playwright.sync_api import expect
+import logging
+
+# Each test opens the wizard at the step it targets: cart and login are
+# prepared through the API (checkout_at fixture, pages/checkout_wizard.py).
+# The full UI flow is covered once, in tests/SmokeTests/test_checkout_smoke.py.
+
+logger = logging.getLogger(__name__)
+
+
+def test_sign_in_step_recognises_api_login(checkout_at, valid_user):
+    # Act
+    sign_in = checkout_at("sign_in", {"Hammer": 1}, valid_user["email"], valid_user["password"])
+
+    # Assert
+    assert sign_in.is_logged_in(), "❌ Sign in step asks for credentials despite the API login"
+
+
+def test_billing_address_is_prefilled_from_account(checkout_at):
+    # Act
+    address = checkout_at("address", {"Hammer": 1})
+
+    # Assert
+    values = address.get_address()
+    logger.info(f"Pre-filled billing address: {values}")
+    assert values["street"] and values["city"], f"❌ Address not pre-filled: {values}"
+    assert address.can_proceed()
+
+
+def test_billing_address_requires_postal_code(checkout_at):
+    # Arrange
+    address = checkout_at("address", {"Hammer": 1})
+
+    # Act
+    address.fill({"postal_code": ""})
+
+    # Assert
+    expect(address.locators.proceed_address).to_be_disabled()
+
+
+@pytest.mark.parametrize("method, details", [
+    ("bank-transfer", ("Test Bank", "Jane Doe", "12345678")),
+    ("credit-card", ("4111-1111-1111-1111", "12/2030", "123", "Jane Doe")),
+])
+def test_payment_step_accepts_method(checkout_at, method, details):
+    # Arrange
+    payment = checkout_at("payment", {"Hammer": 2})
+
+    # Act
+    if method == "bank-transfer":
+        payment.pay_by_bank_transfer(*details)
+    else:
+        payment.pay_by_credit_card(*details)
+    message = payment.finish()
+
+    # Assert
+    assert "successful" in message.lower(), f"❌ Payment by {method} failed: {message}"
@@ -1,27 +1,46 @@
+import pytest
 from playwright.sync_api import Page, expect
 from pages.home_page import HomePage
+from pages.components.filters import Filters
+from utils.filter_oracle import FilterState
+from utils.filter_explorer import FilterExplorer
+from config.config import Config
 import logging 
 
 logger = logging.getLogger(__name__)
 
-def test_filter_by_category_reduces_products(home_page_obj: HomePage):
+def test_filter_by_category_reduces_products(home_page_obj: HomePage, filter_oracle):
     '''
     Select one category
-    Assert product count changes
+    Assert the grid shows exactly what the API returns for that category
     '''
     # Ensure product_cards exist initially
     expect(home_page_obj.locators.product_cards).not_to_have_count(0)
     
-    # Check the Filter by Category checkbox
-    home_page_obj.filter_by_category(category_name = "Hand Tools")
+    # Check the Filter by Category checkbox (and fetch the API answer meanwhile)
+    report = filter_oracle.check(home_page_obj, FilterState(categories=["Hand Tools"]))
     
-    # Assert product list changes (filtered)
+    # Assert product list is the filtered one, same ids, same order
     expect(home_page_obj.locators.product_cards).not_to_have_count(0)
+    assert report.ok, str(report)
     
     # Uncheck the Filter by Category checkbox
     home_page_obj.unfilter_by_category(category_name = "Hand Tools")
 
 
+def test_filter_on_virtual_clock_matches_api(clock, home_page_obj: HomePage, filter_oracle):
+    '''
+    Same category/brand check with the page clock installed
+    Assert the debounce is skipped and the grid still equals the API answer
+    '''
+    # Act
+    report = filter_oracle.check(home_page_obj, FilterState(categories=["Hand Tools"], brands=["ForgeFlex Tools"]))
+
+    # Assert
+    assert clock.skipped_ms > 0, "No debounce window was skipped"
+    assert report.ok, str(report)
+
+
 def test_filter_by_brand_reduces_products(home_page_obj: HomePage):
     '''
     Select one brand
@@ -49,19 +68,18 @@ def test_sort_by_price_changes_product_order(home_page_obj: HomePage):
     expect(home_page_obj.locators.product_cards).not_to_have_count(0)
     
     # Capture first product price BEFORE sorting
-    list_of_product_prices = home_page_obj.get_all_product_prices()
-    first_price_before = list_of_product_prices[0]
+    first_price_before = home_page_obj.get_product_table().prices[0]
     logger.info(f"first_price_before = {first_price_before}")
 
-    # Apply "Sort by price: High - Low" drop-down
-    home_page_obj.sort_by_label("Price (High - Low)")
+    # Apply "Sort by price: High - Low" drop-down (returns the re-rendered grid, never the stale one)
+    sorted_grid = home_page_obj.sort_by_label("Price (High - Low)")
 
     # Capture first product price AFTER sorting
-    list_of_product_prices = home_page_obj.get_all_product_prices()
-    first_price_after = list_of_product_prices[0]
+    first_price_after = sorted_grid.prices[0]
     logger.info(f"first_price_after = {first_price_after}")
 
     # Assert sorting changed the order
+    assert sorted_grid.is_sorted("price", descending=True)
     assert first_price_after >= first_price_before
 
 def test_reset_filters_restores_all_products(home_page_obj: HomePage):
@@ -124,13 +142,8 @@ def test_sort_then_filter_then_reset_restores_default_order(home_page_obj: HomeP
     
     product_default_names = home_page_obj.get_all_product_names()
     
-    # Apply sort: Price High -> Low
-    home_page_obj.sort_by_label(label="Price (High - Low)")
-
-    # Wait
-    #home_page_obj.wait_for_content_loaded()
-    
-    sorted_names = home_page_obj.get_all_product_names()
+    # Apply sort: Price High -> Low (snapshot of the re-rendered grid)
+    sorted_names = home_page_obj.sort_by_label(label="Price (High - Low)").names
     
     assert sorted_names != product_default_names
     
@@ -152,14 +165,8 @@ def test_sort_then_filter_then_reset_restores_default_order(home_page_obj: HomeP
     # Assert filter is no longer applied
     assert reset_filter_names == sorted_names
     
-    # Reset sorting
-    home_page_obj.sort_by_label(label="")
-    
-    # Wait
-    #home_page_obj.wait_for_content_loaded()
-    
-    # Capture order after reset filter
-    reset_sort_names = home_page_obj.get_all_product_names()
+    # Reset sorting, capture order after reset
+    reset_sort_names = home_page_obj.sort_by_label(label="").names
     
     # Assert sorting is no longer applied
     assert reset_sort_names == product_default_names
@@ -174,9 +181,7 @@ def test_sorting_stability_across_pages(home_page_obj: HomePage):
     # Initial state: Ensure product_cards exist initially
     expect(home_page_obj.locators.product_cards).not_to_have_count(0)
     
-    home_page_obj.sort_by_label(label="Price (High - Low)")
-
-    page_1_values = home_page_obj.get_all_product_prices()
+    page_1_values = home_page_obj.sort_by_label(label="Price (High - Low)").prices.tolist()
     logger.info(f"page_1_values = {page_1_values}")
 
     # Assert Page 1 is sorted
@@ -228,4 +233,59 @@ def test_sorting_stability_across_pages_2(home_page_obj: HomePage):
     
     
     
-    
\ No newline at end of file
+    
+
+@pytest.mark.parametrize("state", [
+    FilterState(sort="price,asc"),
+    FilterState(categories=["Hand Tools"], sort="name,desc"),
+    FilterState(categories=["Power Tools"], brands=["ForgeFlex Tools"]),
+], ids=repr)
+def test_filter_and_sort_combinations_match_api(home_page_obj: HomePage, filter_oracle, state):
+    '''
+    Apply a filter/sort combination through the UI
+    Assert the grid equals the equivalent /products page (ids and order)
+    '''
+    report = filter_oracle.check(home_page_obj, state)
+    assert report.ok, str(report)
+
+
+@pytest.mark.parametrize("low, high", [(5, 6), (10, 90), (40, 60)])
+def test_price_range_slider_filters_products(home_page_obj: HomePage, filter_oracle, low, high):
+    '''
+    Set the price slider to exact values (one drag per handle, any width)
+    Assert the slider shows them and the grid equals the API answer
+    '''
+    # Act: Drive the slider through the oracle (API fetched meanwhile)
+    report = filter_oracle.check(home_page_obj, FilterState(price_range=(low, high)))
+
+    # Assert
+    assert Filters(home_page_obj.page).get_price_range() == (low, high)
+    assert not home_page_obj.get_product_table().out_of_price_range(low, high)
+    assert report.ok, str(report)
+
+
+@pytest.mark.slow
+def test_pairwise_filter_combinations_match_api(home_page_obj: HomePage, filter_oracle, catalog):
+    '''
+    Reduce categories x brands x price ranges x sorts to one state per distinct result
+    Drive each representative through the UI and compare with the API
+    '''
+    # 1. Arrange: Pairwise + equivalence reduction (API/catalog only, no browser)
+    result = FilterExplorer(filter_oracle, catalog).explore(
+        categories=[None, "Hand Tools", "Power Tools", "Other"],
+        brands=[None, "ForgeFlex Tools", "MightyCraft Hardware"],
+        price_ranges=[(1, 100), (1, 20), (50, 100)],
+        sorts=[None, "price,asc", "price,desc", "name,asc", "name,desc"],
+    )
+    logger.info("\n" + result.coverage_report())
+
+    # 2. Act: Only the representatives go through the UI
+    failures = []
+    for state in result.representatives:
+        home_page_obj.navigate_to(Config.BASE_URL)
+        report = filter_oracle.check(home_page_obj, state)
+        if not report.ok:
+            failures.append(str(report))
+
+    # 3. Assert
+    assert not failures, "\n".join(failures)
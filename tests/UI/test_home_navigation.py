@@ -2,6 +2,8 @@ import re
 import pytest
 from playwright.sync_api import expect
 from pages.home_page import HomePage
+from config.config import Config
+from utils.animations import suppress_animations
 import logging 
 
 logger = logging.getLogger(__name__)
@@ -69,4 +71,45 @@ def test_clicking_product_opens_product_detail(home_page_obj: HomePage):
     
     # Assert product title is visible
     expect(home_page_obj.locators.product_name).to_be_visible()
-    
\ No newline at end of file
+    
+
+def test_animation_suppression_zeroes_transitions(page):
+    '''
+    Suppress animations explicitly (independent of --no-animations)
+    Assert the storefront renders with zero-length transitions
+    '''
+    # Arrange
+    suppress_animations(page)
+    home_page = HomePage(page)
+
+    # Act
+    home_page.goto(Config.BASE_URL)
+    expect(home_page.locators.product_cards.first).to_be_visible()
+
+    # Assert: the init script ran in the page, not just the Python-side bookkeeping
+    assert home_page.animations_suppressed
+    expect(page.locator('style[data-test="animation-suppression"]')).to_have_count(1)
+    assert page.evaluate("() => window.__animationsSuppressed === true")
+    assert page.evaluate("() => matchMedia('(prefers-reduced-motion: reduce)').matches")
+    durations = home_page.locators.product_cards.first.evaluate(
+        "el => [getComputedStyle(el).transitionDuration, getComputedStyle(el).animationDuration]")
+    assert all(d.split(",")[0].strip() == "0s" for d in durations), durations
+
+
+@pytest.mark.keep_animations
+def test_keep_animations_opts_out_of_suppression(page):
+    '''
+    Marked keep_animations: even with --no-animations the page keeps its animations
+    Assert the suppression script never ran
+    '''
+    # Arrange
+    home_page = HomePage(page)
+
+    # Act
+    home_page.goto(Config.BASE_URL)
+    expect(home_page.locators.product_cards.first).to_be_visible()
+
+    # Assert
+    assert not home_page.animations_suppressed
+    expect(page.locator('style[data-test="animation-suppression"]')).to_have_count(0)
+    assert page.evaluate("() => window.__animationsSuppressed === undefined")
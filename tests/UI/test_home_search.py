@@ -1,33 +1,36 @@
 from playwright.sync_api import Page, expect
 from pages.home_page import HomePage
+from utils.search_oracle import PAGE_SIZE
 import logging 
 
 logger = logging.getLogger(__name__)
 
-def test_search_returns_results_for_valid_term(home_page_obj: HomePage):
+def test_search_returns_results_for_valid_term(home_page_obj: HomePage, search_index):
     '''
     Search for "hammer"
-    Assert at least 1 product is shown
+    Assert the exact products predicted by the search oracle are shown
     '''
-    
-    print("Actual object type:", type(home_page_obj)) 
-    print("HomePage class file:", home_page_obj.__class__.__module__) 
-    print("Methods in object:", dir(home_page_obj))
+    expected_names = search_index.names("hammer")
+    assert expected_names, "Oracle predicts no result for 'hammer' (catalog changed?)"
 
-    logger.info(f"Actual object type: {type(home_page_obj)}")
-    logger.info(f"HomePage class file: {home_page_obj.__class__.__module__}") 
-    logger.info(f"Methods in object: {dir(home_page_obj)}")
-    
     home_page_obj.search_for_product("hammer")
-    expect(home_page_obj.locators.product_cards).not_to_have_count(0)
 
-    
+    # Only the first page is rendered
+    expect(home_page_obj.locators.product_cards).to_have_count(min(len(expected_names), PAGE_SIZE))
+    shown = [name.strip() for name in home_page_obj.get_all_product_names()]
+    if len(expected_names) <= PAGE_SIZE:
+        assert sorted(shown) == expected_names
+    else:
+        assert set(shown) <= set(expected_names), f"Unexpected results: {set(shown) - set(expected_names)}"
+    logger.info(f"Search 'hammer': {len(shown)} shown, oracle predicts {len(expected_names)}")
+
 
-def test_search_no_results_for_gibberish(home_page_obj: HomePage):
+def test_search_no_results_for_gibberish(home_page_obj: HomePage, search_index):
     '''
     Search for "asdasdasd123"
     Assert “no results” message OR zero products
     '''
+    assert search_index.count("asdasdasd123") == 0
     home_page_obj.search_for_product("asdasdasd123")
     
     # Assert “no results” message
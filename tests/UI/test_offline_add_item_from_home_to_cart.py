@@ -10,7 +10,7 @@ def test_offline_add_item_from_home_to_cart(page, home_page_obj: HomePage):
     """
     # Act: Navigate and add to cart
     # We return a new Page Object from the click action
-    home_page_obj.search_and_add_to_cart("Thor Hammer")
+    home_page_obj.add_product_to_cart("Thor Hammer")
     cart_count = home_page_obj.get_cart_count()
     Logger.info(f"Added item to cart, cart count = {cart_count}")
 
@@ -0,0 +1,29 @@
+import pytest
+from config.config import Config
+from pages.home_page import HomePage
+from utils.search_benchmark import SearchLatencyBenchmark
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.slow
+def test_search_suggestion_latency(home_page_obj: HomePage):
+    '''
+    Type every configured term (SEARCH_BENCH_TERMS) at a realistic cadence
+    Report per-term and aggregate keystroke-to-suggestion p50/p95
+    Assert suggestions appeared and, when a budget is set, p95 stays within it
+    '''
+    # 1. Act: Type the terms, timing is taken in the page (performance marks)
+    report = SearchLatencyBenchmark(home_page_obj.page).run(Config.SEARCH_BENCH_TERMS)
+    logger.info("\n" + report.format_table())
+
+    # 2. Assert: Every term got suggestions for its final keystroke
+    unanswered = [term.term for term in report.terms if term.final_latency_ms is None]
+    assert not unanswered, f"No suggestions rendered for: {unanswered}"
+
+    # 3. Assert: Regression budget (opt-in)
+    budget = Config.SEARCH_BENCH_P95_BUDGET_MS
+    if budget is not None:
+        p95 = report.overall.percentile(95)
+        assert p95 <= budget, f"Search suggestion p95 {p95:.0f}ms exceeds budget {budget:.0f}ms"
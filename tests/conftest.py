@@ -1,15 +1,28 @@
 import os
+import json
 import random
 import pytest
 import logging
 from playwright.sync_api import Page
 from playwright_stealth import Stealth  # Cloudflare bypass: stealth mode
 from config.config import Config
-from utils.api_client import APIClient
+from utils.api_client import APIClient, RequestsRequestContext
+from utils.response_cache import ResponseCache
+from utils.api_stub import STUB_CATALOG_FILE, StubAPIServer
+from utils.catalog_store import CatalogStore
+from utils.product_locator import product_locator
+from utils.search_oracle import SearchIndex
+from utils.filter_oracle import FilterOracle
 from utils.helpers import Helpers
 from utils.cloudflare_helper import CloudflareHelper  # Cloudflare bypass: helper
+from utils.health import environment_health
+from utils.clock_control import ClockControl
+from utils.data_loader import DataRowRef, iter_row_keys, load_row, parse_shard, in_shard
 from pages.login_page import LoginPage
 from pages.home_page import HomePage
+from pages.cart_session import CartSession
+from pages.cart_page import CartPage
+from pages.checkout_wizard import CheckoutWizard
 
 logger = logging.getLogger(__name__)
 
@@ -225,6 +238,7 @@ def setup_session(browser):
             logger.info("="*70 + "\n")
 
     except Exception as e:
+        environment_health.record_failure("setup_session", str(e))
         logger.error("\n" + "="*70)
         logger.error("❌ SESSION SETUP - FAILED")
         logger.error(f"Error: {str(e)}")
@@ -269,6 +283,7 @@ def authenticated_page(page):
     
     try:
         page.goto(Config.BASE_URL, wait_until="domcontentloaded", timeout=Config.CLOUDFLARE_TIMEOUT)
+        environment_health.record_success("navigation")
         # Wait for network to be idle
         try:
             page.wait_for_load_state("networkidle", timeout=Config.CLOUDFLARE_TIMEOUT)
@@ -276,6 +291,7 @@ def authenticated_page(page):
             logger.warning(f"⚠️  Network idle timeout (continuing): {e}")
             page.wait_for_timeout(2000)
     except Exception as e:
+        environment_health.record_failure("navigation", f"{Config.BASE_URL}: {e}")
         logger.warning(f"⚠️  Page load error (continuing): {e}")
         page.wait_for_timeout(2000)
     
@@ -305,6 +321,143 @@ def api_client(playwright):
         except Exception as e:
             print(f"⚠️  Error disposing request context: {e}")
 
+@pytest.fixture(scope="session")
+def response_cache():
+    """
+    Session-wide GET response cache backed by Config.API_CACHE_DIR.
+
+    The directory is shared by every xdist worker, so reference data
+    (brands, categories) is downloaded once per machine, not once per test.
+    """
+    return ResponseCache(ttl=Config.API_CACHE_TTL, directory=Config.API_CACHE_DIR)
+
+
+@pytest.fixture
+def cached_api_client(playwright, response_cache):
+    """
+    Same as api_client, but GETs go through the shared response cache.
+
+    Tests that mutate data must call `cached_api_client.invalidate_cache(endpoint)`.
+    """
+    request_context = playwright.request.new_context()
+
+    try:
+        yield APIClient(request_context, cache=response_cache)
+    finally:
+        try:
+            request_context.dispose()
+        except Exception as e:
+            print(f"⚠️  Error disposing request context: {e}")
+
+@pytest.fixture(scope="session")
+def api_stub():
+    """
+    Local stand-in for the API (see utils/api_stub.py), started once per session.
+
+    Usage:
+        def test_x(api_stub):
+            report = run_load(api_stub.base_url, concurrency=5, ramp_up=1, duration=3)
+
+    Tests that only need a client use `stub_api_client`.
+    """
+    stub = StubAPIServer().start()
+    yield stub
+    stub.stop()
+
+@pytest.fixture(scope="session")
+def stub_products():
+    """Raw product dicts served by the API stub (test_data/stub_catalog.json)."""
+    with open(STUB_CATALOG_FILE, encoding="utf-8") as f:
+        return json.load(f)["products"]
+
+@pytest.fixture
+def stub_api_client(api_stub):
+    """
+    APIClient pointed at the API stub, kept out of the run's API metrics and
+    circuit breaker. Its request context is disposed after the test.
+    """
+    request_context = RequestsRequestContext()
+    try:
+        yield APIClient(request_context, base_url=api_stub.base_url, record_metrics=False, track_health=False)
+    finally:
+        request_context.dispose()
+
+@pytest.fixture
+def stub_catalog(stub_products):
+    """In-memory CatalogStore holding the stub catalog (same data the stub serves)."""
+    store = CatalogStore("sqlite://")
+    store.load(stub_products)
+    yield store
+    store.close()
+
+@pytest.fixture(scope="session")
+def catalog():
+    """
+    Snapshot of the full product catalog (see utils/catalog_store.py), taken once per session.
+
+    Usage:
+        def test_x(catalog):
+            expected = catalog.expected_total("Hammer", 2)
+    """
+    request_context = RequestsRequestContext()
+    store = None
+    try:
+        store = CatalogStore.from_api(APIClient(request_context))
+        # Page objects resolve product ids from the snapshot from now on
+        product_locator.use_catalog(store)
+        yield store
+    finally:
+        product_locator.use_catalog(None)
+        product_locator.close()
+        if store is not None:
+            store.close()
+        request_context.dispose()
+
+@pytest.fixture(scope="session")
+def search_index(catalog) -> SearchIndex:
+    """Search oracle over the catalog snapshot (see utils/search_oracle.py)."""
+    return SearchIndex.from_catalog(catalog)
+
+@pytest.fixture
+def seeded_cart(page: Page, api_client):
+    """
+    Factory: build a cart through the API and open it in the browser.
+
+    Usage:
+        def test_x(seeded_cart):
+            cart_page = seeded_cart({"Hammer": 3, "Thor Hammer": 1})
+    """
+
+    def seed(lines: dict) -> CartPage:
+        cart_id = api_client.seed_cart({product_locator.resolve(name): qty for name, qty in lines.items()})
+        cart_page = CartPage(page)
+        cart_page.attach_cart(cart_id, sum(lines.values()))
+        return cart_page
+    return seed
+
+@pytest.fixture
+def checkout_at(page: Page, api_client):
+    """
+    Factory: open the checkout wizard at one step, earlier steps prepared via the API.
+
+    Usage:
+        def test_x(checkout_at):
+            payment = checkout_at("payment", {"Hammer": 1})
+    """
+    return CheckoutWizard(page, api_client).open_at
+
+@pytest.fixture
+def filter_oracle(api_client) -> FilterOracle:
+    """
+    UI-vs-API consistency oracle for home page filters (see utils/filter_oracle.py).
+
+    Usage:
+        def test_x(home_page_obj, filter_oracle):
+            report = filter_oracle.check(home_page_obj, FilterState(categories=["Hand Tools"]))
+            assert report.ok, report
+    """
+    return FilterOracle(api_client)
+
 @pytest.fixture
 def utils():
     return Helpers()
@@ -324,12 +477,14 @@ def home_page_obj(page: Page) -> HomePage:
     
     try:
         page.goto(Config.BASE_URL, wait_until="domcontentloaded", timeout=Config.CLOUDFLARE_TIMEOUT)
+        environment_health.record_success("navigation")
         try:
             page.wait_for_load_state("networkidle", timeout=Config.CLOUDFLARE_TIMEOUT)
         except Exception as e:
             logger.warning(f"⚠️  Network idle timeout (continuing): {e}")
             page.wait_for_timeout(2000)
     except Exception as e:
+        environment_health.record_failure("navigation", f"{Config.BASE_URL}: {e}")
         logger.error(f"❌ Failed to navigate to {Config.BASE_URL}: {e}")
         raise
 
@@ -408,10 +563,12 @@ def checkout_data() -> dict:
         "billing_address": "123 Test Street",
         "city": "Test City",
         "state": "CA",
+        "country": "United States",
         "zip": "12345",
-        "card_number": "4111111111111111",  # Test card
+        "card_number": "4111-1111-1111-1111",  # Test card (format expected by the payment step)
         "cvv": "123",
-        "expiry": "12/25"
+        "expiry": "12/2030",
+        "card_holder": "Jane Doe"
     }
 
 
@@ -419,11 +576,33 @@ def checkout_data() -> dict:
 # HELPER FIXTURES
 # ============================================================================
 
+@pytest.fixture
+def clock(page: Page):
+    """
+    Virtual clock for the page: page objects skip their debounce/animation
+    windows (TIME_WINDOWS) instead of waiting in real time.
+
+    Request it before page-object fixtures, so it is installed before the
+    first navigation.
+
+    Usage:
+        def test_x(clock, home_page_obj: HomePage):
+            home_page_obj.filter_by_category("Hand Tools")   # debounce skipped
+            clock.advance(1000)                              # any other window
+    """
+    control = ClockControl.install(page)
+    yield control
+    control.release()
+
+
 @pytest.fixture
 def wait_for_animation(page: Page):
     """
     Provides a function to wait for CSS animations.
 
+    Real time on purpose: the virtual clock fires timers but does not drive
+    CSS animations/transitions (use `advance_timers` for timer windows).
+
     Usage:
         def test_modal(home_page_obj: HomePage, wait_for_animation):
             home_page_obj.open_modal_button.click()
@@ -436,6 +615,26 @@ def wait_for_animation(page: Page):
     return wait
 
 
+@pytest.fixture
+def advance_timers(clock):
+    """
+    Provides a function to jump over timer-driven windows (setTimeout/
+    setInterval: debounces, toasts, polling) on the virtual clock, instantly.
+
+    Request it before page-object fixtures, like `clock`.
+
+    Usage:
+        def test_toast(advance_timers, home_page_obj: HomePage):
+            home_page_obj.add_to_cart_button.click()
+            advance_timers(5000)  # toast auto-hide timer fires now
+            expect(home_page_obj.toast).to_be_hidden()
+    """
+
+    def advance(milliseconds: int):
+        clock.advance(milliseconds)
+    return advance
+
+
 # ============================================================================
 # PARAMETRIZED TEST DATA
 # ============================================================================
@@ -453,3 +652,90 @@ def search_term(request):
             assert home_page_obj.get_product_count() > 0
     """
     return request.param
+
+
+
+# ============================================================================
+# LAZY, SHARDED DATA-DRIVEN PARAMETRIZATION
+# ============================================================================
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize `data_row` from @pytest.mark.dataset without loading payloads.
+
+    Only row ids are streamed during collection (one DataRowRef per row);
+    the row itself is loaded by the `data_row` fixture when the test runs.
+    With --data-shard K/N only the rows of shard K are collected, so CI
+    matrix jobs split a large file deterministically. pytest-xdist then
+    distributes the collected rows among its workers as usual.
+    With --cart-batching, rows are ordered by the marker's `batch_by`
+    column so rows sharing preconditions run back to back.
+
+    Usage:
+        @pytest.mark.dataset("test_orders.csv", id_column="product_name",
+                             schema={"quantity": int}, batch_by="product_name")
+        def test_order(data_row):
+            assert data_row["quantity"] > 0
+    """
+    marker = metafunc.definition.get_closest_marker("dataset")
+    if marker is None or "data_row" not in metafunc.fixturenames:
+        return
+
+    filename = marker.args[0]
+    id_column = marker.kwargs.get("id_column")
+    batch_by = marker.kwargs.get("batch_by") if metafunc.config.getoption("--cart-batching") else None
+    shard = parse_shard(metafunc.config.getoption("--data-shard"))
+
+    refs = [ref for ref in iter_row_keys(filename, id_column, batch_by) if in_shard(ref.row_id, shard)]
+    if batch_by:
+        # Stable sort: same-group rows become adjacent, file order kept inside a group
+        refs.sort(key=lambda ref: ref.group or "")
+    metafunc.parametrize("data_row", refs, ids=[ref.row_id for ref in refs], indirect=True)
+
+
+@pytest.fixture
+def data_row(request) -> dict:
+    """
+    Typed payload of the dataset row selected by pytest_generate_tests.
+
+    The dataset is parsed once per worker (memoized), on first use.
+    """
+    ref: DataRowRef = request.param
+    schema = request.node.get_closest_marker("dataset").kwargs.get("schema")
+    return load_row(ref.filename, ref.index, schema)
+
+
+@pytest.fixture(scope="module")
+def cart_batch(browser, setup_session):
+    """
+    One logged-in page + CartSession(reuse=True) shared by a module's rows.
+
+    Only used with --cart-batching (see `cart_session`).
+    """
+    context = browser.new_context(
+        storage_state=AUTH_FILE if os.path.exists(AUTH_FILE) else None,
+        viewport={"width": 1280, "height": 800},
+    )
+    page = context.new_page()
+    Stealth().apply_stealth_sync(page)
+    page.set_default_timeout(Config.CLOUDFLARE_TIMEOUT)
+
+    try:
+        yield CartSession(page, reuse=True)
+    finally:
+        page.close()
+        context.close()
+
+
+@pytest.fixture
+def cart_session(request) -> CartSession:
+    """
+    CartSession for data-driven checkout rows.
+
+    Default: a fresh session on `authenticated_page` for every row.
+    --cart-batching: the module-wide reusable session (cart_batch); each
+    row still reports as its own test.
+    """
+    if request.config.getoption("--cart-batching"):
+        return request.getfixturevalue("cart_batch")
+    return CartSession(request.getfixturevalue("authenticated_page"))
@@ -0,0 +1,28 @@
+import pytest
+from decimal import Decimal
+
+from utils.api_stub import filter_products
+
+
+@pytest.mark.offline
+def test_should_compute_expected_totals_in_decimal(stub_catalog, stub_products):
+    assert len(stub_catalog) == len(stub_products)
+    assert stub_catalog.expected_total("hammer", 2) == Decimal("25.16")
+    with pytest.raises(KeyError):
+        stub_catalog.expected_total("No Such Product", 1)
+
+
+@pytest.mark.offline
+def test_should_filter_like_the_api(stub_catalog, stub_products):
+    # 1. Arrange: Reference result from the stub's backend emulation
+    params = {"between": "price,1,100", "is_rental": "false"}
+    expected = {p["id"] for p in filter_products(stub_products, params)}
+
+    # 2. Act
+    actual = stub_catalog.in_price_range(1, 100, is_rental=False)
+
+    # 3. Assert: Same products, sorted by price
+    assert {p.id for p in actual} == expected
+    assert [p.price for p in actual] == sorted(p.price for p in actual)
+    brand = stub_products[0]["brand"]
+    assert {p.id for p in stub_catalog.by_brand(brand["name"])} == {p.id for p in stub_catalog.by_brand(brand["id"])}
@@ -0,0 +1,30 @@
+import pytest
+
+from utils.filter_explorer import EMPTY_RESULT, FilterExplorer, pairwise
+from utils.filter_oracle import FilterOracle
+
+
+@pytest.mark.offline
+def test_pairwise_covers_every_value_pair():
+    dimensions = {"a": [1, 2, 3], "b": ["x", "y"], "c": [None, True, False]}
+    rows = pairwise(dimensions)
+
+    assert len(rows) < 3 * 2 * 3
+    for first, second in [("a", "b"), ("a", "c"), ("b", "c")]:
+        covered = {(row[first], row[second]) for row in rows}
+        assert len(covered) == len(dimensions[first]) * len(dimensions[second])
+
+
+@pytest.mark.offline
+def test_explorer_collapses_equivalent_combinations(stub_api_client, stub_catalog):
+    # 1. Arrange: Stub API + catalog built from the same data
+    explorer = FilterExplorer(FilterOracle(stub_api_client), stub_catalog)
+
+    # 2. Act: 0.01-0.02 matches nothing, whatever the sort
+    result = explorer.explore(categories=[None, "Hand Tools"], brands=[None, "ForgeFlex Tools"],
+                              price_ranges=[(1, 100), (0.01, 0.02)], sorts=[None, "price,asc", "price,desc"])
+
+    # 3. Assert: Fewer UI runs than combinations, and empty ones are merged
+    assert len(result.representatives) < len(result.combos) <= result.exhaustive_count
+    assert EMPTY_RESULT in result.classes
+    assert "pairwise combinations" in result.coverage_report()
@@ -0,0 +1,18 @@
+import pytest
+
+from utils.filter_oracle import FilterOracle, FilterState
+
+
+@pytest.mark.offline
+def test_filter_state_maps_to_storefront_query(stub_api_client):
+    oracle = FilterOracle(stub_api_client)
+    params = oracle.to_params(FilterState(categories=["Hand Tools"], brands=["ForgeFlex Tools"], sort="price,desc"))
+    with pytest.raises(ValueError):
+        oracle.to_params(FilterState(brands=["No Such Brand"]))
+
+    # Parent category expands to itself + every subcategory
+    category_ids = params["by_category"].split(",")
+    assert category_ids[0] == "01JCAT00000000000000000001" and len(category_ids) > 1
+    assert params["by_brand"] == "01JBRD00000000000000000001"
+    assert params["between"] == "price,1,100" and params["is_rental"] == "false"
+    assert params["sort"] == "price,desc"
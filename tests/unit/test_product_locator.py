@@ -0,0 +1,17 @@
+import pytest
+
+from utils.product_locator import ProductLocatorService
+
+
+@pytest.mark.offline
+def test_should_resolve_product_names_to_urls(api_stub):
+    service = ProductLocatorService(api_base_url=api_stub.base_url)
+    try:
+        # Exact, case-insensitive name match ("Hammer", not "Thor Hammer")
+        product_id = service.resolve("hammer")
+        assert service.url_for("Hammer").endswith(f"/product/{product_id}")
+        assert service.resolve("Thor Hammer") != product_id
+        with pytest.raises(LookupError):
+            service.resolve("No Such Product")
+    finally:
+        service.close()
@@ -0,0 +1,32 @@
+import pytest
+from decimal import Decimal
+
+from utils.api_stub import filter_products
+from utils.product_table import ProductTable, parse_decimal_price, parse_price, parse_prices
+
+
+@pytest.mark.offline
+def test_should_parse_display_prices():
+    assert parse_price("$1,200.50") == 1200.5
+    assert parse_prices([" $12.58 ", "$0.99"]).tolist() == [12.58, 0.99]
+    assert parse_decimal_price("$1,200.50") == Decimal("1200.50")
+
+
+@pytest.mark.offline
+def test_should_check_order_range_and_duplicates(stub_products):
+    # 1. Arrange: Same listing as /products?sort=price,desc&between=price,1,20
+    listing = filter_products(stub_products, {"sort": "price,desc", "between": "price,1,20"})
+
+    # 2. Act
+    table = ProductTable.from_products(listing)
+
+    # 3. Assert
+    assert len(table) == len(listing)
+    assert table.is_sorted("price", descending=True)
+    assert not table.is_sorted("price")
+    assert table.out_of_price_range(1, 20) == []
+    assert table.duplicate_ids() == []
+
+    doubled = ProductTable.from_products(listing + listing[:1])
+    assert doubled.duplicate_ids() == [listing[0]["id"]]
+    assert table.take(table.cents > 1000).out_of_price_range(10, 20) == []
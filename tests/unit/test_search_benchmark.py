@@ -0,0 +1,53 @@
+import pytest
+
+from pages.components.project_locators.components_locators import SearchBarLocators
+from utils.search_benchmark import _PROBE_JS, _READ_JS, SEARCH_ENDPOINT, SearchLatencyReport, TermLatency
+
+
+@pytest.mark.offline
+def test_should_aggregate_keystroke_latencies():
+    # 1. Arrange: Two terms, one keystroke never answered
+    hammer = TermLatency("hammer", [{"value": "h", "latency": None}, {"value": "ha", "latency": 120.0},
+                                    {"value": "ham", "latency": 80.0}])
+    saw = TermLatency("saw", [{"value": "s", "latency": 40.0}, {"value": "sa", "latency": None}])
+
+    # 2. Act
+    report = SearchLatencyReport([hammer, saw], keystroke_delay_ms=150)
+    data = report.to_dict()
+
+    # 3. Assert
+    assert (hammer.answered, hammer.unanswered, hammer.final_latency_ms) == (2, 1, 80.0)
+    assert saw.final_latency_ms is None
+    assert data["overall"]["keystrokes"] == 5 and data["overall"]["answered"] == 3
+    assert data["overall"]["p50_ms"] == pytest.approx(80, abs=1)  # histogram bucket resolution
+    assert data["overall"]["max_ms"] == 120.0
+    assert "hammer" in report.format_table()
+
+
+@pytest.mark.offline
+def test_probe_ignores_mutations_outside_the_suggestion_list(page):
+    # 1. Arrange: Search box and list inside a form, probe installed, one keystroke typed
+    page.set_content("""
+        <form id="search"><input data-test="search-query">
+            <ul data-test="search-suggestions"><li data-test="search-suggestion-1">hammer</li></ul>
+        </form>""")
+    page.evaluate(_PROBE_JS, [SearchBarLocators.SEARCH_INPUT, SearchBarLocators.SUGGESTIONS, SEARCH_ENDPOINT])
+    page.locator(SearchBarLocators.SEARCH_INPUT).press_sequentially("h")
+
+    # 2. Act: Ancestors of the list mutate first
+    page.evaluate("""() => {
+        document.getElementById('search').setAttribute('data-busy', 'true');
+        document.body.appendChild(document.createElement('div'));
+    }""")
+    page.evaluate("() => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)))")
+    pending_after_ancestors = page.evaluate("() => window.__searchLatency.pending()")
+
+    # ...then the list itself re-renders with the same item
+    page.evaluate("() => { document.querySelector('[data-test=\"search-suggestion-1\"]').textContent = 'hammer'; }")
+    page.wait_for_function("() => window.__searchLatency.pending() === 0")
+    page.evaluate("() => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)))")
+
+    # 3. Assert: Only the list render answered the keystroke
+    assert pending_after_ancestors == 1
+    keystrokes = page.evaluate(_READ_JS)
+    assert [k["value"] for k in keystrokes] == ["h"] and keystrokes[0]["latency"] is not None
@@ -0,0 +1,16 @@
+import pytest
+
+from utils.search_oracle import SearchIndex, verify_search_terms
+
+
+@pytest.mark.offline
+def test_search_oracle_agrees_with_stub(stub_api_client, stub_products):
+    # 1. Arrange: Oracle over the same catalog the stub serves
+    index = SearchIndex.from_products(stub_products)
+
+    # 2. Act
+    mismatches = verify_search_terms(stub_api_client, index, index.probe_terms(), batch_size=50)
+
+    # 3. Assert
+    assert index.count("hammer") >= 2
+    assert not mismatches, mismatches[:10]
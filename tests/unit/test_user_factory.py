@@ -0,0 +1,32 @@
+import pytest
+
+from utils.user_factory import generate_users, to_register_payloads
+
+
+def _luhn_valid(number: str) -> bool:
+    digits = [int(d) for d in reversed(number)]
+    total = sum(digits[0::2]) + sum(sum(divmod(d * 2, 10)) for d in digits[1::2])
+    return total % 10 == 0
+
+
+@pytest.mark.offline
+def test_should_generate_unique_reproducible_users():
+    # 1. Act: Same seed twice, plus a second batch
+    users = generate_users(2000, seed=7)
+    again = generate_users(2000, seed=7)
+    other_batch = generate_users(2000, seed=8)
+
+    # 2. Assert: No collisions inside or across batches, deterministic per seed
+    assert users["email"].is_unique
+    assert users["user_id"].is_unique
+    assert not set(users["email"]) & set(other_batch["email"])
+    assert users.equals(again)
+    assert all(_luhn_valid(n) for n in users["card_number"])
+
+
+@pytest.mark.offline
+def test_should_build_register_payloads():
+    payload = to_register_payloads(generate_users(1, seed=1))[0]
+
+    assert payload["email"].endswith("@example.com")
+    assert set(payload["address"]) == {"street", "city", "state", "country", "postal_code"}
@@ -0,0 +1,75 @@
+"""
+Opt-in suppression of storefront animations.
+
+With --no-animations (or DISABLE_ANIMATIONS=true) every page of a test's
+browser context runs an init script before the app loads that:
+
+    - zeroes CSS animation/transition durations and delays,
+    - shortens Web Animations API calls (Angular animations) to 0ms,
+    - turns smooth scrolling off and hides the blinking caret,
+
+and the page reports prefers-reduced-motion: reduce. Elements are then
+static as soon as they appear; BasePage.animations_suppressed lets waits
+skip their "let it settle" steps.
+
+Tests that check animation behaviour opt out with @pytest.mark.keep_animations.
+"""
+
+import logging
+from weakref import WeakSet
+
+from playwright.sync_api import BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+ANIMATION_SUPPRESSION_JS = """
+(() => {
+    const css = `*, *::before, *::after {
+        animation-duration: 0s !important;
+        animation-delay: 0s !important;
+        animation-iteration-count: 1 !important;
+        transition-duration: 0s !important;
+        transition-delay: 0s !important;
+        scroll-behavior: auto !important;
+        caret-color: transparent !important;
+    }`;
+    const install = () => {
+        const style = document.createElement('style');
+        style.setAttribute('data-test', 'animation-suppression');
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) install();
+    else document.addEventListener('DOMContentLoaded', install);
+
+    const animate = Element.prototype.animate;
+    Element.prototype.animate = function (keyframes, options) {
+        const timing = typeof options === 'number' ? {} : {...(options || {})};
+        return animate.call(this, keyframes, {...timing, duration: 0, delay: 0, endDelay: 0});
+    };
+    window.__animationsSuppressed = true;
+})();
+"""
+
+# Contexts running the init script
+_suppressed: "WeakSet[BrowserContext]" = WeakSet()
+
+
+def suppress_animations(page: Page) -> None:
+    """
+    Disable animations for every page of `page`'s context (call before navigating).
+
+    Pages already loaded keep their animations until the next navigation.
+    """
+    context = page.context
+    if context in _suppressed:
+        return
+    context.add_init_script(ANIMATION_SUPPRESSION_JS)
+    page.emulate_media(reduced_motion="reduce")
+    _suppressed.add(context)
+    logger.info("🎬 Animations suppressed for this browser context")
+
+
+def animations_suppressed(page: Page) -> bool:
+    """Whether the page's context runs the suppression init script."""
+    return page.context in _suppressed
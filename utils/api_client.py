@@ -1,42 +1,286 @@
+import json
 import logging
-from typing import Dict, Optional, Any
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any, Iterator, List, Iterable, Union
+
+import requests
 from config.config import Config
 from playwright.sync_api import APIRequestContext, APIResponse
+from utils.api_metrics import api_metrics
+from utils.health import environment_health
+from utils.response_cache import ResponseCache
+
+
+class BufferedResponse:
+    """
+    Fully-read HTTP response returned by the concurrent helpers.
+
+    Mirrors the read API of Playwright's APIResponse (ok, status, headers,
+    body(), text(), json()) so tests can treat both the same way.
+    Note: Playwright's expect() only accepts real APIResponse objects,
+    assert on `response.ok` instead.
+    """
+
+    def __init__(self, url: str, status: int, status_text: str, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.status_text = status_text
+        self.headers = {k.lower(): v for k, v in headers.items()}
+        self._body = body
+
+    @classmethod
+    def from_requests(cls, response: requests.Response) -> "BufferedResponse":
+        """Build a BufferedResponse from a `requests` response."""
+        return cls(
+            url=response.url,
+            status=response.status_code,
+            status_text=response.reason or "",
+            headers=dict(response.headers),
+            body=response.content,
+        )
+
+    @property
+    def ok(self) -> bool:
+        """True for 2xx status codes (same rule as APIResponse.ok)."""
+        return 200 <= self.status <= 299
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        return self._body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self._body)
+
+
+# What a (possibly cached) GET returns: a live APIResponse, or a BufferedResponse on cache hits
+Response = Union[APIResponse, BufferedResponse]
+
+
+class RequestsRequestContext:
+    """
+    Minimal stand-in for Playwright's APIRequestContext backed by `requests`.
+
+    Implements only fetch()/dispose(), which is all APIClient needs, so the
+    client (and its domain methods) can run without a Playwright instance,
+    e.g. one client per thread in a load run. Not thread-safe: one per thread.
+    """
+
+    def __init__(self):
+        self.session = requests.Session()
+
+    def fetch(self, url: str, method: str = "GET", params: Optional[Dict[str, Any]] = None,
+              data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+              timeout: Optional[float] = None) -> BufferedResponse:
+        """Same signature subset as APIRequestContext.fetch (timeout in ms)."""
+        response = self.session.request(
+            method.upper(),
+            url,
+            params=params,
+            json=data,
+            headers=headers,
+            timeout=(timeout or Config.DEFAULT_TIMEOUT) / 1000,
+        )
+        return BufferedResponse.from_requests(response)
+
+    def dispose(self):
+        self.session.close()
 
 
 class APIClient:
     """
     Unified API Client using Playwright's APIRequestContext.
     Provides centralized logging and error handling for all HTTP methods.
+
+    Playwright's sync API is bound to the thread that created it, so the
+    concurrent helpers (fetch_many, iter_products) use a thread-local
+    `requests` session per worker instead of the shared request context.
+
+    Pass a ResponseCache to opt in to GET caching: cached GETs always
+    return a BufferedResponse (hit or miss), so assert on `response.ok`.
+
+    Calls feed the run-wide api_metrics and environment_health by default;
+    clients aimed at something other than the environment under test (the
+    local stub, load-run virtual users) pass record_metrics=False and
+    track_health=False so they neither skew the report nor trip the breaker.
     """
 
-    def __init__(self, request_context: APIRequestContext):
+    def __init__(self, request_context: APIRequestContext, cache: Optional[ResponseCache] = None,
+                 base_url: Optional[str] = None, record_metrics: bool = True, track_health: bool = True):
         self.request = request_context
-        # Centralized base URL for the project
-        self.api_base_url = Config.API_BASE_URL
+        # Centralized base URL for the project (override e.g. for the local stub)
+        self.api_base_url = base_url or Config.API_BASE_URL
         self.logger = logging.getLogger(__name__)
+        # One requests.Session per worker thread (Session is not thread-safe)
+        self._local = threading.local()
+        # Opt-in GET response cache (None = disabled)
+        self.cache = cache
+        # Feed the process-wide api_metrics / environment_health singletons
+        self.record_metrics = record_metrics
+        self.track_health = track_health
+
+    def _build_url(self, endpoint: str) -> str:
+        return f"{self.api_base_url}{endpoint}" if endpoint.startswith("/") else endpoint
 
     def _execute_request(self, method: str, endpoint: str, **kwargs) -> APIResponse:
         """
-        Internal wrapper to execute requests with logging.
+        Internal wrapper to execute requests with logging and metrics
+        (latency, status, response bytes -> utils.api_metrics).
         """
-        url = f"{self.api_base_url}{endpoint}" if endpoint.startswith("/") else endpoint
+        url = self._build_url(endpoint)
         self.logger.info(f"Sending {method.upper()} to {url}")
 
         # Mapping string methods to Playwright's request object
         # kwargs can include: data, params, headers, etc.
-        response = self.request.fetch(url, method=method, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = self.request.fetch(url, method=method, **kwargs)
+        except Exception as e:
+            self._record_failure(method, url, start, e)
+            raise
+        elapsed = time.perf_counter() - start
+
+        if self.record_metrics:
+            api_metrics.record(method, url, response.status, elapsed, self._response_size(response))
+        self._report_health(method, url, response.status)
+        self.logger.info(f"Received {response.status} from {method.upper()} {url} in {elapsed * 1000:.0f}ms")
 
         return response
 
+    def _record_failure(self, method: str, url: str, start: float, error: Exception):
+        """Record a transport error (no response at all)."""
+        if self.record_metrics:
+            api_metrics.record(method, url, "ERR", time.perf_counter() - start)
+        if self.track_health:
+            environment_health.record_failure("api", f"{method.upper()} {url}: {error}")
+
+    def _report_health(self, method: str, url: str, status: int):
+        """Feed the environment circuit breaker: 5xx = backend failure."""
+        if not self.track_health:
+            return
+        if status >= 500:
+            environment_health.record_failure("api", f"{method.upper()} {url}: HTTP {status}")
+        else:
+            environment_health.record_success("api")
+
+    @staticmethod
+    def _response_size(response: APIResponse) -> int:
+        """Body size from Content-Length, reading the body only when it is missing."""
+        length = response.headers.get("content-length")
+        if length is not None and length.isdigit():
+            return int(length)
+        try:
+            return len(response.body())
+        except Exception:
+            return 0
+
+    def _session(self) -> requests.Session:
+        """Return the requests.Session owned by the current thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def _execute_direct(self, method: str, endpoint: str,
+                        params: Optional[Dict[str, Any]] = None,
+                        data: Optional[Dict[str, Any]] = None,
+                        headers: Optional[Dict[str, str]] = None) -> BufferedResponse:
+        """
+        Thread-safe variant of _execute_request used by the concurrent helpers.
+
+        `data` is sent as a JSON body, like Playwright does for dict payloads.
+        """
+        url = self._build_url(endpoint)
+        self.logger.info(f"Sending {method.upper()} to {url} (worker {threading.current_thread().name})")
+
+        start = time.perf_counter()
+        try:
+            response = self._session().request(
+                method.upper(),
+                url,
+                params=params,
+                json=data,
+                headers=headers,
+                timeout=Config.DEFAULT_TIMEOUT / 1000,
+            )
+        except requests.RequestException as e:
+            self._record_failure(method, url, start, e)
+            raise
+
+        if self.record_metrics:
+            api_metrics.record(method, url, response.status_code, time.perf_counter() - start, len(response.content))
+        self._report_health(method, url, response.status_code)
+        return BufferedResponse.from_requests(response)
+
+    # ========================================================================
+    # RESPONSE CACHE
+    # ========================================================================
+
+    def _cached_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> BufferedResponse:
+        """
+        GET through the response cache.
+
+        Fresh entry -> served locally. Stale entry with ETag/Last-Modified ->
+        conditional request, a 304 reuses the cached body. Otherwise a normal
+        request whose 2xx response is stored.
+        """
+        url = self._build_url(endpoint)
+        key = self.cache.make_key(url, params)
+        entry = self.cache.lookup(key)
+
+        if entry is not None and entry.is_fresh():
+            self.logger.info(f"Cache HIT GET {url}")
+            return BufferedResponse(entry.url, entry.status, entry.status_text, entry.headers, entry.body)
+
+        validators = entry.validators() if entry is not None else {}
+        response = self._execute_request("GET", endpoint, params=params, headers=validators or None)
+
+        if response.status == 304 and entry is not None:
+            self.logger.info(f"Cache REVALIDATED GET {url}")
+            entry = self.cache.refresh(key, entry, response.headers)
+            return BufferedResponse(entry.url, entry.status, entry.status_text, entry.headers, entry.body)
+
+        body = response.body()
+        if response.ok:
+            self.cache.store(key, url, response.status, response.status_text, response.headers, body)
+        return BufferedResponse(response.url, response.status, response.status_text, response.headers, body)
+
+    def invalidate_cache(self, endpoint: Optional[str] = None) -> int:
+        """
+        Drop cached GETs for an endpoint prefix (everything if None).
+
+        Call after a test mutates data served by a cached endpoint, e.g.
+        api_client.invalidate_cache("/brands") after creating a brand.
+        """
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(self._build_url(endpoint) if endpoint else None)
+
     # ========================================================================
     # PUBLIC API METHODS
     # ========================================================================
 
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> APIResponse:
-        """Standard GET request."""
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+            use_cache: bool = True) -> Response:
+        """Standard GET request (served through the cache when one is configured)."""
+        if self.cache is not None and use_cache:
+            return self._cached_get(endpoint, params=params)
         return self._execute_request("GET", endpoint, params=params)
 
+    def get_direct(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> BufferedResponse:
+        """
+        GET on the calling thread's own requests session (uncached).
+
+        Safe from worker threads, unlike get(), whose Playwright request
+        context is bound to the thread that created it.
+        """
+        return self._execute_direct("GET", endpoint, params=params)
+
     def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> APIResponse:
         """Standard POST request."""
         return self._execute_request("POST", endpoint, data=data)
@@ -49,18 +293,158 @@ class APIClient:
         """Standard DELETE request."""
         return self._execute_request("DELETE", endpoint)
 
+    # ========================================================================
+    # CONCURRENT / BATCH METHODS
+    # ========================================================================
+
+    def fetch_many(self, requests_spec: Iterable[Dict[str, Any]],
+                   max_workers: Optional[int] = None) -> List[BufferedResponse]:
+        """
+        Run many independent requests concurrently.
+
+        Args:
+            requests_spec: Iterable of dicts with keys
+                "endpoint" (required), "method" (default "GET"),
+                "params", "data", "headers" (optional).
+            max_workers: Concurrency limit (default: Config.API_MAX_CONCURRENCY)
+
+        Returns:
+            Responses in the same order as requests_spec.
+
+        Example:
+            >>> pages = api_client.fetch_many(
+            ...     [{"endpoint": "/products", "params": {"page": n}} for n in range(1, 6)]
+            ... )
+        """
+        specs = list(requests_spec)
+        if not specs:
+            return []
+
+        workers = min(max_workers or Config.API_MAX_CONCURRENCY, len(specs))
+        self.logger.info(f"Fetching {len(specs)} requests with {workers} worker(s)")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api") as executor:
+            futures = [
+                executor.submit(
+                    self._execute_direct,
+                    spec.get("method", "GET"),
+                    spec["endpoint"],
+                    params=spec.get("params"),
+                    data=spec.get("data"),
+                    headers=spec.get("headers"),
+                )
+                for spec in specs
+            ]
+            # .result() re-raises the first worker exception, if any
+            return [future.result() for future in futures]
+
+    def iter_products(self, params: Optional[Dict[str, Any]] = None,
+                      prefetch: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every product across all pages of /products.
+
+        The first page gives `last_page`; the following pages are fetched in
+        the background with at most `prefetch` pages in flight, so items are
+        yielded in page order while the next pages are already downloading.
+
+        Args:
+            params: Filters forwarded to /products ("page" is managed here)
+            prefetch: Read-ahead window in pages (default: Config.API_PREFETCH_PAGES)
+
+        Yields:
+            Product dictionaries, in API order.
+        """
+        base_params = {k: v for k, v in (params or {}).items() if k != "page"}
+        window = max(1, prefetch or Config.API_PREFETCH_PAGES)
+
+        def fetch_page(page_number: int) -> Dict[str, Any]:
+            response = self._execute_direct("GET", "/products", params={**base_params, "page": page_number})
+            if not response.ok:
+                raise RuntimeError(f"GET /products page {page_number} failed: {response.status} {response.status_text}")
+            return response.json()
+
+        first = fetch_page(1)
+        yield from first.get("data", [])
+
+        last_page = int(first.get("last_page", 1))
+        if last_page <= 1:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="api-prefetch")
+        try:
+            pending = deque()
+            next_page = 2
+            while next_page <= last_page and len(pending) < window:
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+
+            while pending:
+                payload = pending.popleft().result()
+                if next_page <= last_page:
+                    pending.append(executor.submit(fetch_page, next_page))
+                    next_page += 1
+                yield from payload.get("data", [])
+        finally:
+            # Consumer may stop early: drop pages not started yet
+            executor.shutdown(wait=True, cancel_futures=True)
+
     # ========================================================================
     # DOMAIN SPECIFIC METHODS (Convenience)
     # ========================================================================
 
-    def get_brands(self) -> APIResponse:
+    def get_brands(self) -> Response:
         """Fetch all brands from the backend."""
         return self.get("/brands")
 
-    def get_products(self, params: Dict[str, Any]) -> APIResponse:
+    def get_products(self, params: Dict[str, Any]) -> Response:
         """Fetch products with optional filters (page, price between, is_rental)."""
         return self.get("/products", params=params)
 
     def create_contact_message(self, payload: Dict[str, Any]) -> APIResponse:
         """Example of a POST request to a specific endpoint."""
-        return self.post("/contact/send", data=payload)
\ No newline at end of file
+        return self.post("/contact/send", data=payload)
+
+    def login(self, email: str, password: str) -> str:
+        """Log in through the API and return the access token."""
+        response = self.post("/users/login", data={"email": email, "password": password})
+        if not response.ok:
+            raise RuntimeError(f"POST /users/login failed for {email}: HTTP {response.status}")
+        return response.json()["access_token"]
+
+    def create_cart(self) -> str:
+        """Create an empty cart and return its id."""
+        response = self.post("/carts")
+        if not response.ok:
+            raise RuntimeError(f"POST /carts failed: HTTP {response.status}")
+        return response.json()["id"]
+
+    def add_cart_item(self, cart_id: str, product_id: str, quantity: int = 1) -> APIResponse:
+        """Add `quantity` units of a product to a cart."""
+        return self.post(f"/carts/{cart_id}", data={"product_id": product_id, "quantity": quantity})
+
+    def seed_cart(self, lines: Dict[str, int]) -> str:
+        """
+        Build a cart server-side: one create call, then all lines in parallel.
+
+        Attach the result to the browser with CartPage.attach_cart.
+
+        Args:
+            lines: product_id -> quantity
+
+        Returns:
+            Cart id
+
+        Example:
+            >>> cart_id = api_client.seed_cart({hammer_id: 3, pliers_id: 1})
+        """
+        cart_id = self.create_cart()
+        responses = self.fetch_many(
+            {"method": "POST", "endpoint": f"/carts/{cart_id}",
+             "data": {"product_id": product_id, "quantity": quantity}}
+            for product_id, quantity in lines.items()
+        )
+        failed = [(product_id, r.status) for product_id, r in zip(lines, responses) if not r.ok]
+        if failed:
+            raise RuntimeError(f"Seeding cart {cart_id} failed for: {failed}")
+        self.logger.info(f"Seeded cart {cart_id} with {sum(lines.values())} item(s) in {len(lines)} line(s)")
+        return cart_id
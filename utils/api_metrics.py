@@ -0,0 +1,213 @@
+"""
+API call instrumentation.
+
+Every request sent by APIClient is recorded here: per-endpoint latency
+histogram, status code distribution and response bytes. At the end of the
+run conftest.py dumps the numbers into the results folder
+(api-metrics.json) and adds a summary table to the HTML report, so backend
+slowdowns show up in ordinary functional runs.
+
+Histograms are HDR-style (log-linear buckets): the relative error of any
+percentile is below 1%, memory is bounded, and two histograms merge by
+adding bucket counts (used to combine pytest-xdist workers).
+"""
+
+import json
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+# Path segments replaced by {id}: numbers and 26-char ULIDs (API ids)
+ID_SEGMENT = re.compile(r"^(\d+|[0-9A-HJKMNP-TV-Z]{26})$", re.IGNORECASE)
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies in microseconds.
+
+    Values below 2**SUB_BUCKET_BITS are counted exactly; larger values
+    share a bucket at most 2**-(SUB_BUCKET_BITS - 1) of their value wide
+    (1/128, about 0.8%).
+    """
+
+    SUB_BUCKET_BITS = 8
+
+    def __init__(self):
+        self.buckets: Counter = Counter()
+        self.count = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    @classmethod
+    def bucket_of(cls, value_us: int) -> int:
+        """Lower bound of the bucket holding value_us."""
+        shift = max(0, value_us.bit_length() - cls.SUB_BUCKET_BITS)
+        return (value_us >> shift) << shift
+
+    def record(self, seconds: float):
+        value_us = max(0, int(seconds * 1_000_000))
+        self.buckets[self.bucket_of(value_us)] += 1
+        self.count += 1
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = max(self.max_us, value_us)
+
+    def percentile(self, pct: float) -> float:
+        """Latency in milliseconds at percentile pct (0-100)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, round(pct / 100 * self.count))
+        seen = 0
+        for lower in sorted(self.buckets):
+            seen += self.buckets[lower]
+            if seen >= rank:
+                # Clamp to observed max so p100 is exact
+                return min(lower, self.max_us) / 1000
+        return self.max_us / 1000
+
+    def merge(self, other: "LatencyHistogram"):
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": {str(k): v for k, v in self.buckets.items()},
+            "count": self.count,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.buckets = Counter({int(k): v for k, v in data["buckets"].items()})
+        histogram.count = data["count"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
+
+
+class EndpointStats:
+    """Latency, status codes and bytes for one "METHOD /path" endpoint."""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.statuses: Counter = Counter()
+        self.bytes_total = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency": self.latency.to_dict(),
+            "statuses": {str(k): v for k, v in self.statuses.items()},
+            "bytes_total": self.bytes_total,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EndpointStats":
+        stats = cls()
+        stats.latency = LatencyHistogram.from_dict(data["latency"])
+        stats.statuses = Counter(data["statuses"])
+        stats.bytes_total = data["bytes_total"]
+        return stats
+
+
+class APIMetrics:
+    """Thread-safe registry of EndpointStats, keyed by normalized endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    @staticmethod
+    def endpoint_key(method: str, url: str) -> str:
+        """'GET https://api.host/products/01HX...?page=2' -> 'GET api.host/products/{id}'."""
+        parsed = urlparse(url)
+        segments = ["{id}" if ID_SEGMENT.match(s) else s for s in (parsed.path or "/").split("/")]
+        return f"{method.upper()} {parsed.netloc}{'/'.join(segments)}"
+
+    def record(self, method: str, url: str, status: Any, seconds: float, nbytes: int = 0):
+        """
+        Record one call.
+
+        Args:
+            status: HTTP status code, or a label such as "ERR" for transport errors
+        """
+        key = self.endpoint_key(method, url)
+        with self._lock:
+            stats = self.endpoints.setdefault(key, EndpointStats())
+            stats.latency.record(seconds)
+            stats.statuses[str(status)] += 1
+            stats.bytes_total += nbytes
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
+
+    # ========================================
+    # SERIALIZATION / MERGE (xdist workers)
+    # ========================================
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self.endpoints.items()}
+
+    def merge(self, snapshot: Dict[str, Any]):
+        with self._lock:
+            for key, data in snapshot.items():
+                incoming = EndpointStats.from_dict(data)
+                stats = self.endpoints.setdefault(key, EndpointStats())
+                stats.latency.merge(incoming.latency)
+                stats.statuses.update(incoming.statuses)
+                stats.bytes_total += incoming.bytes_total
+
+    # ========================================
+    # REPORTING
+    # ========================================
+
+    def summary_rows(self) -> List[Dict[str, Any]]:
+        """One row per endpoint, slowest p95 first."""
+        with self._lock:
+            rows = [
+                {
+                    "endpoint": key,
+                    "calls": stats.latency.count,
+                    "p50_ms": round(stats.latency.percentile(50), 1),
+                    "p95_ms": round(stats.latency.percentile(95), 1),
+                    "p99_ms": round(stats.latency.percentile(99), 1),
+                    "max_ms": round(stats.latency.max_us / 1000, 1),
+                    "statuses": dict(sorted(stats.statuses.items())),
+                    "bytes_total": stats.bytes_total,
+                }
+                for key, stats in self.endpoints.items()
+            ]
+        return sorted(rows, key=lambda row: row["p95_ms"], reverse=True)
+
+    def dump(self, path: Path):
+        """Write summary + raw histograms (mergeable later) as JSON."""
+        payload = {"summary": self.summary_rows(), "histograms": self.snapshot()}
+        Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    def to_html(self) -> str:
+        """Summary table for the pytest-html report."""
+        rows = "".join(
+            f"<tr><td>{r['endpoint']}</td><td>{r['calls']}</td><td>{r['p50_ms']}</td>"
+            f"<td>{r['p95_ms']}</td><td>{r['p99_ms']}</td><td>{r['max_ms']}</td>"
+            f"<td>{', '.join(f'{k}: {v}' for k, v in r['statuses'].items())}</td>"
+            f"<td>{r['bytes_total']}</td></tr>"
+            for r in self.summary_rows()
+        )
+        return (
+            "<h2>API latency</h2>"
+            "<table><thead><tr><th>Endpoint</th><th>Calls</th><th>p50 ms</th><th>p95 ms</th>"
+            "<th>p99 ms</th><th>Max ms</th><th>Statuses</th><th>Bytes</th></tr></thead>"
+            f"<tbody>{rows}</tbody></table>"
+        )
+
+
+# Process-wide registry used by APIClient and conftest.py
+api_metrics = APIMetrics()
@@ -0,0 +1,197 @@
+"""
+Local stand-in for the Practice Software Testing API.
+
+Serves a small, fixed catalog (test_data/stub_catalog.json) over HTTP on
+localhost so API tooling (load runs, client features) can be exercised
+with no network. Only the read endpoints the framework uses are emulated:
+
+    GET /brands
+    GET /categories            GET /categories/tree
+    GET /products              (page, between, is_rental, by_category, by_brand, sort, q)
+    GET /products/search?q=    GET /products/{id}
+
+Responses follow the real API shapes (Laravel pagination, 9 items per page).
+
+Usage:
+    with StubAPIServer() as stub:
+        client = APIClient(RequestsRequestContext(), base_url=stub.base_url,
+                           record_metrics=False, track_health=False)
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+STUB_CATALOG_FILE = Path(__file__).resolve().parent.parent / "test_data" / "stub_catalog.json"
+PER_PAGE = 9
+
+
+def filter_products(products: List[Dict[str, Any]], params: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Apply /products query parameters the way the backend does.
+
+    Args:
+        products: Full product list
+        params: Flat query params, e.g. {"between": "price,1,100", "sort": "price,asc"}
+
+    Returns:
+        Filtered and sorted products (not paginated)
+    """
+    result = list(products)
+
+    q = params.get("q")
+    if q:
+        result = [p for p in result if q.lower() in p["name"].lower()]
+
+    between = params.get("between")
+    if between:
+        _, low, high = between.split(",")
+        result = [p for p in result if float(low) <= p["price"] <= float(high)]
+
+    is_rental = params.get("is_rental")
+    if is_rental is not None:
+        wanted = is_rental.lower() == "true"
+        result = [p for p in result if p["is_rental"] is wanted]
+
+    by_category = params.get("by_category")
+    if by_category:
+        ids = set(by_category.split(","))
+        result = [p for p in result if p["category"]["id"] in ids]
+
+    by_brand = params.get("by_brand")
+    if by_brand:
+        ids = set(by_brand.split(","))
+        result = [p for p in result if p["brand"]["id"] in ids]
+
+    sort = params.get("sort")
+    if sort:
+        field, _, direction = sort.partition(",")
+        result.sort(key=lambda p: p[field].lower() if isinstance(p[field], str) else p[field],
+                    reverse=direction == "desc")
+
+    return result
+
+
+def paginate(items: List[Dict[str, Any]], page: int, per_page: int = PER_PAGE) -> Dict[str, Any]:
+    """Laravel-style paginator payload."""
+    total = len(items)
+    last_page = max(1, math.ceil(total / per_page))
+    start = (page - 1) * per_page
+    data = items[start:start + per_page]
+    return {
+        "current_page": page,
+        "data": data,
+        "from": start + 1 if data else None,
+        "last_page": last_page,
+        "per_page": per_page,
+        "to": start + len(data) if data else None,
+        "total": total,
+    }
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the in-memory catalog of the owning server."""
+
+    server: "_StubHTTPServer"
+
+    def do_GET(self):
+        if self.server.latency_s:
+            time.sleep(self.server.latency_s)
+
+        parsed = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        parts = [p for p in parsed.path.split("/") if p]
+        catalog = self.server.catalog
+
+        if parts == ["brands"]:
+            return self._send(200, catalog["brands"])
+        if parts == ["categories"]:
+            return self._send(200, catalog["categories"])
+        if parts == ["categories", "tree"]:
+            return self._send(200, self._category_tree(catalog["categories"]))
+        if parts in (["products"], ["products", "search"]):
+            page = int(params.get("page", 1))
+            return self._send(200, paginate(filter_products(catalog["products"], params), page))
+        if len(parts) == 2 and parts[0] == "products":
+            product = next((p for p in catalog["products"] if p["id"] == parts[1]), None)
+            if product is not None:
+                return self._send(200, product)
+
+        return self._send(404, {"message": "Requested item not found"})
+
+    @staticmethod
+    def _category_tree(categories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        roots = [dict(c) for c in categories if c["parent_id"] is None]
+        for root in roots:
+            root["sub_categories"] = [c for c in categories if c["parent_id"] == root["id"]]
+        return roots
+
+    def _send(self, status: int, payload: Any):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Route access logs to logging instead of stderr
+        logger.debug("stub %s", format % args)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, catalog: Dict[str, Any], latency_s: float):
+        super().__init__(address, _StubRequestHandler)
+        self.catalog = catalog
+        self.latency_s = latency_s
+
+
+class StubAPIServer:
+    """
+    Background HTTP server emulating the read-only API on localhost.
+
+    Args:
+        catalog_file: JSON file with "brands", "categories", "products"
+        latency_ms: Artificial delay per request (simulates a remote backend)
+        port: 0 = pick a free port
+    """
+
+    def __init__(self, catalog_file: Optional[Path] = None, latency_ms: float = 0, port: int = 0):
+        with open(catalog_file or STUB_CATALOG_FILE, encoding="utf-8") as f:
+            self.catalog = json.load(f)
+        self._server = _StubHTTPServer(("127.0.0.1", port), self.catalog, latency_ms / 1000)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubAPIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="api-stub", daemon=True)
+        self._thread.start()
+        logger.info(f"✓ Stub API listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        logger.info("✓ Stub API stopped")
+
+    def __enter__(self) -> "StubAPIServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
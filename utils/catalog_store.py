@@ -0,0 +1,240 @@
+"""
+Catalog snapshot store.
+
+Pulls the full product list through APIClient once (iter_products) into an
+indexed SQLite database, so tests can compute expected values locally
+instead of hand-maintaining them:
+
+    catalog = CatalogStore.from_api(api_client)
+    catalog.expected_total("Hammer", 2)                       # Decimal('25.16')
+    catalog.query(price_range=(1, 100), is_rental=False)      # what /products should return
+
+Prices are stored as integer cents and returned as Decimal (no float drift
+when multiplying by quantities).
+"""
+
+import logging
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import (Boolean, Column, Integer, MetaData, String, Table, create_engine, func, insert, or_,
+                        select)
+from sqlalchemy.pool import StaticPool
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+
+products_table = Table(
+    "products", metadata,
+    Column("id", String, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("name_key", String, nullable=False, index=True),  # lower-cased name
+    Column("price_cents", Integer, nullable=False, index=True),
+    Column("category_id", String, index=True),
+    Column("category_name", String),
+    Column("brand_id", String, index=True),
+    Column("brand_name", String),
+    Column("is_rental", Boolean, nullable=False, index=True),
+    Column("in_stock", Boolean),
+)
+
+INSERT_CHUNK = 500
+
+# One id/name or several (matched as "any of")
+Names = Union[str, Sequence[str]]
+
+
+def to_cents(price: Any) -> int:
+    """12.58 / '12.58' / Decimal('12.58') -> 1258 (str() first: avoids binary float error)."""
+    return int((Decimal(str(price)) * 100).to_integral_value())
+
+
+def _any_of(id_column, name_column, values: Names):
+    values = [values] if isinstance(values, str) else list(values)
+    return or_(id_column.in_(values), func.lower(name_column).in_([v.lower() for v in values]))
+
+
+class CatalogProduct:
+    """One product of the snapshot (read-only view of a table row)."""
+
+    __slots__ = ("id", "name", "price", "category_id", "category_name",
+                 "brand_id", "brand_name", "is_rental", "in_stock")
+
+    def __init__(self, row):
+        self.id = row.id
+        self.name = row.name
+        self.price = Decimal(row.price_cents).scaleb(-2)
+        self.category_id = row.category_id
+        self.category_name = row.category_name
+        self.brand_id = row.brand_id
+        self.brand_name = row.brand_name
+        self.is_rental = row.is_rental
+        self.in_stock = row.in_stock
+
+    def __repr__(self):
+        return f"CatalogProduct({self.id!r}, {self.name!r}, {self.price})"
+
+
+class CatalogStore:
+    """
+    Indexed local copy of the product catalog.
+
+    Args:
+        db_url: SQLAlchemy URL (default: Config.CATALOG_DB_URL, in-memory SQLite).
+                A file URL such as "sqlite:///catalog.db" keeps the snapshot
+                around for inspection.
+    """
+
+    def __init__(self, db_url: Optional[str] = None):
+        db_url = db_url or Config.CATALOG_DB_URL
+        if db_url == "sqlite://":
+            # One shared connection: every connection would get its own empty in-memory DB
+            self.engine = create_engine(db_url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+        else:
+            self.engine = create_engine(db_url)
+        metadata.create_all(self.engine)
+        self._lock = threading.Lock()
+        # Hot-path lookups served from memory, the rest goes through SQL indexes
+        self._by_id: Dict[str, CatalogProduct] = {}
+        self._by_name: Dict[str, CatalogProduct] = {}
+        self.loaded_at: Optional[float] = None
+
+    @classmethod
+    def from_api(cls, api_client, params: Optional[Dict[str, Any]] = None,
+                 db_url: Optional[str] = None) -> "CatalogStore":
+        """Snapshot every product the API lists (all pages, prefetched)."""
+        store = cls(db_url)
+        started = time.perf_counter()
+        count = store.load(api_client.iter_products(params))
+        logger.info(f"✓ Catalog snapshot: {count} products in {time.perf_counter() - started:.1f}s")
+        return store
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _to_row(product: Dict[str, Any]) -> Dict[str, Any]:
+        category = product.get("category") or {}
+        brand = product.get("brand") or {}
+        return {
+            "id": product["id"],
+            "name": product["name"],
+            "name_key": product["name"].lower(),
+            "price_cents": to_cents(product["price"]),
+            "category_id": category.get("id"),
+            "category_name": category.get("name"),
+            "brand_id": brand.get("id"),
+            "brand_name": brand.get("name"),
+            "is_rental": bool(product.get("is_rental", False)),
+            "in_stock": product.get("in_stock"),
+        }
+
+    def load(self, products: Iterable[Dict[str, Any]]) -> int:
+        """
+        Replace the snapshot with `products` (API product dicts).
+
+        Returns:
+            Number of products stored.
+        """
+        count = 0
+        with self._lock, self.engine.begin() as conn:
+            conn.execute(products_table.delete())
+            chunk: List[Dict[str, Any]] = []
+            for product in products:
+                chunk.append(self._to_row(product))
+                if len(chunk) >= INSERT_CHUNK:
+                    conn.execute(insert(products_table), chunk)
+                    count += len(chunk)
+                    chunk = []
+            if chunk:
+                conn.execute(insert(products_table), chunk)
+                count += len(chunk)
+
+            rows = conn.execute(select(products_table).order_by(products_table.c.id)).all()
+            self._by_id = {row.id: CatalogProduct(row) for row in rows}
+            self._by_name = {}
+            for product in self._by_id.values():
+                self._by_name.setdefault(product.name.lower(), product)
+
+        self.loaded_at = time.time()
+        return count
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[CatalogProduct]:
+        """Every product, ordered by id."""
+        return iter(list(self._by_id.values()))
+
+    def by_id(self, product_id: str) -> Optional[CatalogProduct]:
+        return self._by_id.get(product_id)
+
+    def by_name(self, name: str) -> Optional[CatalogProduct]:
+        """Exact, case-insensitive name match (first by id if names repeat)."""
+        return self._by_name.get(name.lower())
+
+    def query(self, price_range: Optional[Tuple[Any, Any]] = None, category: Optional[Names] = None,
+              brand: Optional[Names] = None, is_rental: Optional[bool] = None,
+              order_by: str = "price") -> List[CatalogProduct]:
+        """
+        Products matching every given filter (None = not filtered).
+
+        Args:
+            price_range: (low, high), inclusive like the API's `between=price,low,high`
+            category: Category id or name, or a list of them (any of)
+            brand: Brand id or name, or a list of them (any of)
+            is_rental: Rental flag
+            order_by: "price", "name" or "id"
+
+        Example:
+            >>> catalog.query(price_range=(1, 100), brand="ForgeFlex Tools")
+        """
+        t = products_table
+        statement = select(t)
+        if price_range is not None:
+            low, high = price_range
+            statement = statement.where(t.c.price_cents.between(to_cents(low), to_cents(high)))
+        if category is not None:
+            statement = statement.where(_any_of(t.c.category_id, t.c.category_name, category))
+        if brand is not None:
+            statement = statement.where(_any_of(t.c.brand_id, t.c.brand_name, brand))
+        if is_rental is not None:
+            statement = statement.where(t.c.is_rental == is_rental)
+
+        order_column = {"price": t.c.price_cents, "name": t.c.name_key, "id": t.c.id}[order_by]
+        statement = statement.order_by(order_column, t.c.id)
+
+        with self._lock, self.engine.connect() as conn:
+            return [CatalogProduct(row) for row in conn.execute(statement)]
+
+    def in_category(self, category: str) -> List[CatalogProduct]:
+        return self.query(category=category)
+
+    def by_brand(self, brand: str) -> List[CatalogProduct]:
+        return self.query(brand=brand)
+
+    def in_price_range(self, low: Any, high: Any, is_rental: Optional[bool] = None) -> List[CatalogProduct]:
+        return self.query(price_range=(low, high), is_rental=is_rental)
+
+    def expected_total(self, product_name: str, quantity: int) -> Decimal:
+        """
+        Cart total for `quantity` units of a product, from the snapshot price.
+
+        Raises:
+            KeyError: Product not in the catalog
+        """
+        product = self.by_name(product_name)
+        if product is None:
+            raise KeyError(f"Product not in catalog snapshot: {product_name!r}")
+        return product.price * quantity
+
+    def close(self):
+        self.engine.dispose()
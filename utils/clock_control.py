@@ -0,0 +1,87 @@
+"""
+Virtual time for storefront pages (Playwright clock API).
+
+Debounced inputs (search, filters) and timer-driven animations make UI
+steps wait in real time. With the page clock installed, page objects jump
+over those windows instead:
+
+    clock = ClockControl.install(page)     # or the `clock` fixture
+    home_page.search_bar.type_search_term("ham")   # debounce skipped, no sleep
+
+Page objects declare the windows they know about in TIME_WINDOWS
+(name -> ms) and call skip_window(self, name) after the action that opens
+one. Without an installed clock skip_window is a no-op, so the same page
+objects keep working (in real time) in tests that do not opt in.
+
+The clock keeps running at normal speed after install; only skipped
+windows are fast-forwarded (Clock.run_for fires the timers due in them).
+"""
+
+import logging
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+# Page -> its ClockControl (dropped with the page)
+_controls: "WeakKeyDictionary[Page, ClockControl]" = WeakKeyDictionary()
+
+
+class ClockControl:
+    """
+    Controls the virtual clock of one page.
+
+    Create with ClockControl.install(page), ideally before the first
+    navigation so every timer of the app is virtual.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.skipped_ms = 0
+
+    @classmethod
+    def install(cls, page: Page) -> "ClockControl":
+        """Install the fake clock on `page` (idempotent)."""
+        control = _controls.get(page)
+        if control is None:
+            page.clock.install()
+            control = _controls[page] = cls(page)
+            logger.info("⏱️  Virtual clock installed")
+        return control
+
+    def advance(self, milliseconds: int) -> None:
+        """Run the clock `milliseconds` ahead at once, firing every timer due meanwhile."""
+        self.page.clock.run_for(milliseconds)
+        self.skipped_ms += milliseconds
+
+    def release(self) -> None:
+        """Stop page objects from skipping time (the fake clock itself stays until the page closes)."""
+        _controls.pop(self.page, None)
+        logger.info(f"⏱️  Virtual clock released ({self.skipped_ms}ms skipped)")
+
+
+def clock_for(page: Page) -> Optional[ClockControl]:
+    """The page's ClockControl, None when no clock is installed."""
+    return _controls.get(page)
+
+
+def skip_window(owner, window: str) -> bool:
+    """
+    Fast-forward over one of `owner.TIME_WINDOWS` when the page clock is installed.
+
+    Args:
+        owner: Page object or component with `page` and `TIME_WINDOWS`
+        window: Window name, e.g. "search_debounce"
+
+    Returns:
+        True if time was skipped, False in real-time mode
+    """
+    control = clock_for(owner.page)
+    if control is None:
+        return False
+    milliseconds = owner.TIME_WINDOWS[window]
+    control.advance(milliseconds)
+    logger.info(f"⏩ Skipped {window} ({milliseconds}ms)")
+    return True
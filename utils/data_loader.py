@@ -1,27 +1,360 @@
 import csv
+import itertools
 import os
-from typing import List, Dict
+import re
+import threading
+import zlib
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+# Column name -> type applied at load time (int, float, Decimal, bool, str)
+Schema = Dict[str, Callable[[Any], Any]]
 
-def get_csv_data(filename: str) -> List[Dict]:
+# Parsed datasets keyed by (path, mtime, size, schema[, block]): editing the file invalidates the entry
+_DATASET_CACHE: Dict[Tuple, List[Dict]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Rows parsed together by load_row: a shard only materializes the blocks it runs
+ROW_BLOCK_SIZE = 256
+
+TRUE_VALUES = {"true", "1", "yes", "y"}
+FALSE_VALUES = {"false", "0", "no", "n", ""}
+
+
+def get_data_path(filename: str) -> str:
+    """Absolute path of a file in the 'test_data' directory."""
+    # Dynamically retrieve the project root directory path
+    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, "test_data", filename)
+
+
+def to_bool(value: Any) -> bool:
+    """'true'/'yes'/'1' -> True, 'false'/'no'/'0'/'' -> False."""
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"Not a boolean: {value!r}")
+
+
+def _converter(column_type: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    if column_type is bool:
+        return to_bool
+    if column_type is Decimal:
+        # str() first: Decimal(0.1) would keep the binary float error
+        return lambda value: Decimal(str(value).strip())
+    if column_type is int:
+        # Excel/Parquet may hand back 2.0 for an integer column
+        return lambda value: int(float(value)) if isinstance(value, float) else int(str(value).strip())
+    return column_type
+
+
+def _apply_schema(rows: List[Dict], schema: Optional[Schema], file_path: str, first_row: int = 0) -> List[Dict]:
+    if not schema:
+        return rows
+    converters = {column: _converter(column_type) for column, column_type in schema.items()}
+    for line, row in enumerate(rows, start=first_row + 2):  # line 1 is the header
+        for column, convert in converters.items():
+            if column not in row:
+                raise ValueError(f"{os.path.basename(file_path)}: missing column '{column}'")
+            value = row[column]
+            if value is None:
+                continue
+            try:
+                row[column] = convert(value)
+            except (ValueError, ArithmeticError) as e:
+                raise ValueError(
+                    f"{os.path.basename(file_path)} line {line}: cannot convert "
+                    f"{column}={value!r} to {getattr(schema[column], '__name__', schema[column])}"
+                ) from e
+    return rows
+
+
+def _read_csv(file_path: str) -> List[Dict]:
+    with open(file_path, mode='r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def _read_with_pandas(file_path: str, extension: str) -> List[Dict]:
+    # Optional heavy dependencies: only needed for Excel/Parquet datasets
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError(f"pandas is required to read {extension} test data (pip install pandas)") from e
+
+    if extension in (".xlsx", ".xlsm"):
+        frame = pd.read_excel(file_path, engine="openpyxl")
+    else:
+        frame = pd.read_parquet(file_path)  # pyarrow engine
+
+    # NaN -> None so empty cells behave like empty CSV cells
+    frame = frame.astype(object).where(frame.notna(), None)
+    return frame.to_dict(orient="records")
+
+
+READERS = {
+    ".csv": lambda path, ext: _read_csv(path),
+    ".xlsx": _read_with_pandas,
+    ".xlsm": _read_with_pandas,
+    ".parquet": _read_with_pandas,
+}
+
+
+def _read_csv_block(file_path: str, start: int, stop: int) -> List[Dict]:
+    # Rows before `start` are parsed and dropped, never kept
+    with open(file_path, mode='r', encoding='utf-8-sig', newline='') as f:
+        return list(itertools.islice(csv.DictReader(f), start, stop))
+
+
+def _read_parquet_block(file_path: str, start: int, stop: int) -> List[Dict]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Only the row groups overlapping [start, stop) are read
+    parquet = pq.ParquetFile(file_path)
+    tables, offset, first_offset = [], 0, None
+    for group in range(parquet.num_row_groups):
+        group_rows = parquet.metadata.row_group(group).num_rows
+        if offset < stop and offset + group_rows > start:
+            tables.append(parquet.read_row_group(group))
+            first_offset = offset if first_offset is None else first_offset
+        offset += group_rows
+    if not tables:
+        return []
+    frame = pa.concat_tables(tables).slice(start - first_offset, stop - start).to_pandas()
+    # NaN -> None so empty cells behave like empty CSV cells
+    frame = frame.astype(object).where(frame.notna(), None)
+    return frame.to_dict(orient="records")
+
+
+def _read_excel_block(file_path: str, start: int, stop: int) -> List[Dict]:
+    from openpyxl import load_workbook
+
+    # Streaming (read-only) mode: rows outside the block are skipped, not kept
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = list(next(rows, ()))
+        return [dict(zip(header, row)) for row in itertools.islice(rows, start, stop)]
+    finally:
+        workbook.close()
+
+
+BLOCK_READERS = {
+    ".csv": _read_csv_block,
+    ".xlsx": _read_excel_block,
+    ".xlsm": _read_excel_block,
+    ".parquet": _read_parquet_block,
+}
+
+
+def _cache_key(filename: str, schema: Optional[Schema]) -> Tuple[str, str, Tuple]:
+    file_path = get_data_path(filename)
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Unsupported test data format: {extension} ({filename})")
+
+    stat = os.stat(file_path)
+    schema_key = tuple(sorted((column, getattr(t, "__name__", repr(t))) for column, t in (schema or {}).items()))
+    return file_path, extension, (file_path, stat.st_mtime_ns, stat.st_size, schema_key)
+
+
+def _memoize(key: Tuple, parse: Callable[[], List[Dict]]) -> List[Dict]:
+    with _CACHE_LOCK:
+        rows = _DATASET_CACHE.get(key)
+    if rows is None:
+        rows = parse()
+        with _CACHE_LOCK:
+            # Drop entries of older versions of the same file
+            for stale in [k for k in _DATASET_CACHE if k[0] == key[0] and k[1:3] != key[1:3]]:
+                del _DATASET_CACHE[stale]
+            _DATASET_CACHE[key] = rows
+    return rows
+
+
+def _cached_rows(filename: str, schema: Optional[Schema] = None) -> List[Dict]:
+    """Parsed rows shared by every caller (never hand these out unchanged)."""
+    file_path, extension, key = _cache_key(filename, schema)
+    return _memoize(key, lambda: _apply_schema(READERS[extension](file_path, extension), schema, file_path))
+
+
+def _cached_block(filename: str, block: int, schema: Optional[Schema] = None) -> List[Dict]:
+    """Parsed rows of one ROW_BLOCK_SIZE block, shared like _cached_rows."""
+    file_path, extension, key = _cache_key(filename, schema)
+    with _CACHE_LOCK:
+        whole = _DATASET_CACHE.get(key)
+    if whole is not None:
+        return whole[block * ROW_BLOCK_SIZE:(block + 1) * ROW_BLOCK_SIZE]
+
+    start = block * ROW_BLOCK_SIZE
+    return _memoize(key + (block,), lambda: _apply_schema(
+        BLOCK_READERS[extension](file_path, start, start + ROW_BLOCK_SIZE), schema, file_path, start))
+
+
+def load_dataset(filename: str, schema: Optional[Schema] = None) -> List[Dict]:
+    """
+    Load a CSV / Excel / Parquet file from 'test_data', typed and memoized.
+
+    The parsed rows are cached per process, keyed by path + modification
+    time + schema, so every test (and every xdist worker) parses a file once.
+
+    Args:
+        filename: File name inside 'test_data' (e.g. "test_orders.csv")
+        schema: Column -> type, e.g. {"quantity": int, "expected_price": Decimal}.
+                Columns not listed keep their raw value (str for CSV).
+
+    Returns:
+        List[Dict]: Fresh row dicts (safe to modify), e.g.
+                    [{'product_name': 'Hammer', 'quantity': 1, ...}, ...]
+
+    Raises:
+        FileNotFoundError: File does not exist
+        ValueError: Unsupported extension, missing column or bad value
+    """
+    return [dict(row) for row in _cached_rows(filename, schema)]
+
+
+def load_row(filename: str, index: int, schema: Optional[Schema] = None) -> Dict:
+    """
+    One row of a dataset (0-based index), typed and memoized like load_dataset.
+
+    Only the ROW_BLOCK_SIZE block holding the row is parsed (CSV/Excel rows
+    before it are streamed past, Parquet reads just the overlapping row
+    groups), so a CI shard never materializes the rows of other shards.
+    Later rows of the same block are lookups.
+
+    Raises:
+        IndexError: index is past the end of the dataset
+    """
+    block = _cached_block(filename, index // ROW_BLOCK_SIZE, schema)
+    offset = index % ROW_BLOCK_SIZE
+    if index < 0 or offset >= len(block):
+        raise IndexError(f"{filename}: no row {index}")
+    return dict(block[offset])
+
+
+def clear_dataset_cache():
+    """Forget every parsed dataset."""
+    with _CACHE_LOCK:
+        _DATASET_CACHE.clear()
+
+
+def get_csv_data(filename: str, schema: Optional[Schema] = None) -> List[Dict]:
     """
     Reads a CSV file from the 'test_data' directory.
 
     Returns:
         List[Dict]: A list of dictionaries representing the rows,
                     e.g., [{'sku': 'A01', 'quantity': '1'}, ...]
+                    (typed values when a schema is given, see load_dataset)
     """
-    # Dynamically retrieve the project root directory path
-    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    file_path = os.path.join(base_path, "test_data", filename)
-
-    data = []
     try:
-        with open(file_path, mode='r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                data.append(row)
-        return data
+        return load_dataset(filename, schema)
     except FileNotFoundError:
-        print(f"❌ Error: Test data file not found: {file_path}")
+        print(f"❌ Error: Test data file not found: {get_data_path(filename)}")
         return []
+
+
+# ============================================================================
+# LAZY / SHARDED PARAMETRIZATION (see tests/conftest.py: pytest_generate_tests)
+# ============================================================================
+
+class DataRowRef:
+    """
+    Lightweight pointer to one dataset row, used as a collection-time parameter.
+
+    Holds only the file name, row index and id: the payload is loaded by
+    the `data_row` fixture when the test actually runs.
+    """
+
+    __slots__ = ("filename", "index", "row_id", "group")
+
+    def __init__(self, filename: str, index: int, row_id: str, group: Optional[str] = None):
+        self.filename = filename
+        self.index = index
+        self.row_id = row_id
+        # Value of the batching column (rows sharing it share preconditions)
+        self.group = group
+
+    def __repr__(self):
+        return f"DataRowRef({self.filename!r}, {self.index}, {self.row_id!r})"
+
+
+def iter_row_keys(filename: str, id_column: Optional[str] = None,
+                  group_column: Optional[str] = None) -> Iterator[DataRowRef]:
+    """
+    Stream one DataRowRef per row without keeping row payloads in memory.
+
+    CSV is read row by row; Parquet reads only the key columns; Excel is
+    read in openpyxl's streaming (read-only) mode.
+
+    Args:
+        id_column: Column used in the test id (index only if None)
+        group_column: Column copied into DataRowRef.group (batching key)
+    """
+    file_path = get_data_path(filename)
+    extension = os.path.splitext(file_path)[1].lower()
+    columns = [c for c in (id_column, group_column) if c]
+
+    if extension == ".csv":
+        with open(file_path, mode='r', encoding='utf-8-sig', newline='') as f:
+            keys = ((row.get(id_column) if id_column else None, row.get(group_column) if group_column else None)
+                    for row in csv.DictReader(f))
+            yield from _make_refs(filename, keys)
+    elif extension == ".parquet":
+        import pandas as pd
+        import pyarrow.parquet as pq
+        if columns:
+            frame = pd.read_parquet(file_path, columns=sorted(set(columns)))
+            ids = frame[id_column] if id_column else [None] * len(frame)
+            groups = frame[group_column] if group_column else [None] * len(frame)
+            yield from _make_refs(filename, zip(ids, groups))
+        else:
+            num_rows = pq.ParquetFile(file_path).metadata.num_rows
+            yield from _make_refs(filename, ((None, None) for _ in range(num_rows)))
+    elif extension in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = list(next(rows, ()))
+            id_pos = header.index(id_column) if id_column else None
+            group_pos = header.index(group_column) if group_column else None
+            keys = ((row[id_pos] if id_pos is not None else None, row[group_pos] if group_pos is not None else None)
+                    for row in rows)
+            yield from _make_refs(filename, keys)
+        finally:
+            workbook.close()
+    else:
+        raise ValueError(f"Unsupported test data format: {extension} ({filename})")
+
+
+def _make_refs(filename: str, keys) -> Iterator[DataRowRef]:
+    for index, (value, group) in enumerate(keys):
+        label = re.sub(r"[^\w.-]+", "_", str(value)).strip("_") if value not in (None, "") else ""
+        row_id = f"{index}-{label}" if label else str(index)
+        yield DataRowRef(filename, index, row_id, None if group is None else str(group))
+
+
+def parse_shard(spec: Optional[str]) -> Optional[Tuple[int, int]]:
+    """'2/4' -> (2, 4): run the 2nd of 4 shards. None/'' -> no sharding."""
+    if not spec:
+        return None
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", spec)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise ValueError(f"Invalid data shard '{spec}', expected K/N with 1 <= K <= N")
+    return int(match.group(1)), int(match.group(2))
+
+
+def in_shard(row_id: str, shard: Optional[Tuple[int, int]]) -> bool:
+    """
+    Deterministic row -> shard assignment (CRC32 of the id, not hash(),
+    which is randomized per process).
+    """
+    if shard is None:
+        return True
+    number, total = shard
+    return zlib.crc32(row_id.encode("utf-8")) % total == number - 1
@@ -0,0 +1,189 @@
+"""
+Pairwise filter-combination explorer.
+
+Exhaustive categories x brands x price ranges x sort orders is far too slow
+to drive through the UI. The explorer reduces it in three steps:
+
+    1. pairwise(): greedy covering array - every pair of values of any two
+       dimensions appears in at least one combination;
+    2. the catalog snapshot flags combinations with no result (no API call);
+    3. the remaining ones are fetched from /products concurrently and
+       grouped by result (total + first page ids, in order): combinations
+       in one group are equivalent, only one representative is kept.
+
+Only the representatives are then driven through HomePage (FilterOracle).
+
+Usage:
+    explorer = FilterExplorer(filter_oracle, catalog)
+    result = explorer.explore(categories=[None, "Hand Tools"], brands=[None, "ForgeFlex Tools"],
+                              price_ranges=[(1, 100), (1, 20)], sorts=[None, "price,asc"])
+    for state in result.representatives:
+        ...
+    logger.info(result.coverage_report())
+"""
+
+import logging
+from itertools import combinations, product
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from utils.filter_oracle import DEFAULT_PRICE_RANGE, FilterOracle, FilterState
+
+logger = logging.getLogger(__name__)
+
+EMPTY_RESULT = ("empty",)
+
+
+def pairwise(dimensions: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Greedy all-pairs covering array (deterministic).
+
+    Args:
+        dimensions: name -> possible values
+
+    Returns:
+        Combinations (name -> value) covering every value pair of every two dimensions.
+    """
+    names = list(dimensions)
+    values = [list(dimensions[name]) for name in names]
+    if len(names) < 2:
+        return [{names[0]: v} for v in values[0]] if names else []
+
+    dimension_pairs = list(combinations(range(len(names)), 2))
+    uncovered = {(i, a, j, b) for i, j in dimension_pairs
+                 for a in range(len(values[i])) for b in range(len(values[j]))}
+    candidates = list(product(*(range(len(v)) for v in values)))
+
+    def gain(row: Tuple[int, ...]) -> int:
+        return sum((i, row[i], j, row[j]) in uncovered for i, j in dimension_pairs)
+
+    rows: List[Tuple[int, ...]] = []
+    while uncovered:
+        best = max(candidates, key=gain)
+        rows.append(best)
+        uncovered -= {(i, best[i], j, best[j]) for i, j in dimension_pairs}
+
+    return [{names[i]: values[i][row[i]] for i in range(len(names))} for row in rows]
+
+
+def _value_pairs(combination: Dict[str, Any]) -> set:
+    items = sorted(combination.items(), key=lambda item: item[0])
+    return {(a, repr(x), b, repr(y)) for (a, x), (b, y) in combinations(items, 2)}
+
+
+class ExplorationResult:
+    """Equivalence classes found by FilterExplorer.explore, plus coverage numbers."""
+
+    def __init__(self, dimensions: Dict[str, Sequence[Any]], combos: List[Dict[str, Any]],
+                 classes: Dict[Hashable, List[Dict[str, Any]]]):
+        self.dimensions = dimensions
+        self.combos = combos
+        self.classes = classes
+
+    @property
+    def exhaustive_count(self) -> int:
+        count = 1
+        for values in self.dimensions.values():
+            count *= len(values)
+        return count
+
+    @property
+    def representatives(self) -> List[FilterState]:
+        """One FilterState per distinct result (the first combination of each class)."""
+        return [to_state(members[0]) for members in self.classes.values()]
+
+    def coverage_report(self) -> str:
+        all_pairs = set()
+        for i, j in combinations(sorted(self.dimensions), 2):
+            for x in self.dimensions[i]:
+                for y in self.dimensions[j]:
+                    all_pairs.add((i, repr(x), j, repr(y)))
+        direct = set()
+        for members in self.classes.values():
+            direct |= _value_pairs(members[0])
+        via_class = set()
+        for combo in self.combos:
+            via_class |= _value_pairs(combo)
+
+        lines = [
+            "Filter exploration coverage",
+            f"  exhaustive combinations : {self.exhaustive_count}",
+            f"  pairwise combinations   : {len(self.combos)}",
+            f"  distinct results (run)  : {len(self.classes)}",
+            f"  value pairs covered     : {len(direct & all_pairs)}/{len(all_pairs)} directly, "
+            f"{len(via_class & all_pairs)}/{len(all_pairs)} including equivalent combinations",
+        ]
+        for signature, members in self.classes.items():
+            label = "no result" if signature == EMPTY_RESULT else f"{signature[0]} product(s)"
+            lines.append(f"  - {to_state(members[0])}: {label}, stands for {len(members)} combination(s)")
+        return "\n".join(lines)
+
+
+def to_state(combination: Dict[str, Any]) -> FilterState:
+    """{'category', 'brand', 'price_range', 'sort'} (None = unset) -> FilterState."""
+    return FilterState(
+        categories=[combination["category"]] if combination.get("category") else (),
+        brands=[combination["brand"]] if combination.get("brand") else (),
+        price_range=combination.get("price_range") or DEFAULT_PRICE_RANGE,
+        sort=combination.get("sort"),
+    )
+
+
+class FilterExplorer:
+    """
+    Reduces filter combinations to a minimal representative set.
+
+    Args:
+        oracle: FilterOracle (query mapping + API client)
+        catalog: Optional CatalogStore used to skip API calls for empty combinations
+    """
+
+    def __init__(self, oracle: FilterOracle, catalog=None):
+        self.oracle = oracle
+        self.catalog = catalog
+
+    def _empty_in_catalog(self, params: Dict[str, Any]) -> bool:
+        if self.catalog is None:
+            return False
+        _, low, high = params["between"].split(",")
+        products = self.catalog.query(
+            price_range=(low, high),
+            category=params["by_category"].split(",") if "by_category" in params else None,
+            brand=params["by_brand"].split(",") if "by_brand" in params else None,
+            is_rental=False,
+        )
+        return not products
+
+    def explore(self, categories: Sequence[Optional[str]], brands: Sequence[Optional[str]],
+                price_ranges: Sequence[Tuple[int, int]], sorts: Sequence[Optional[str]],
+                max_workers: Optional[int] = None) -> ExplorationResult:
+        """
+        Enumerate, reduce and group combinations (None = dimension not filtered).
+
+        Returns:
+            ExplorationResult; run `result.representatives` through the UI.
+        """
+        dimensions = {"category": list(categories), "brand": list(brands),
+                      "price_range": list(price_ranges), "sort": list(sorts)}
+        combos = pairwise(dimensions)
+        params = [self.oracle.to_params(to_state(combo)) for combo in combos]
+
+        signatures: List[Optional[Hashable]] = [EMPTY_RESULT if self._empty_in_catalog(p) else None for p in params]
+        pending = [index for index, signature in enumerate(signatures) if signature is None]
+        responses = self.oracle.api_client.fetch_many(
+            [{"endpoint": "/products", "params": params[index]} for index in pending], max_workers=max_workers)
+        for index, response in zip(pending, responses):
+            if not response.ok:
+                raise AssertionError(f"GET /products {params[index]} -> HTTP {response.status}")
+            payload = response.json()
+            ids = tuple(product["id"] for product in payload["data"])
+            signatures[index] = EMPTY_RESULT if not payload["total"] else (payload["total"], ids)
+
+        classes: Dict[Hashable, List[Dict[str, Any]]] = {}
+        for combo, signature in zip(combos, signatures):
+            classes.setdefault(signature, []).append(combo)
+
+        result = ExplorationResult(dimensions, combos, classes)
+        logger.info(f"Filter exploration: {result.exhaustive_count} exhaustive -> {len(combos)} pairwise -> "
+                    f"{len(classes)} to run ({len(pending)} API calls, "
+                    f"{len(combos) - len(pending)} pruned by catalog)")
+        return result
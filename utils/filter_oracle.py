@@ -0,0 +1,177 @@
+"""
+UI-vs-API consistency oracle for the home page filters.
+
+For a FilterState (categories, brands, price range, sort) the oracle:
+
+    1. starts the equivalent GET /products query in a background thread,
+    2. applies the same state through HomePage (the API call overlaps
+       with the UI settling, so the check adds almost no wall time),
+    3. snapshots the grid in one evaluate (ProductTable.from_cards) and
+       compares ids and order with the API page, re-snapshotting until
+       they agree or the timeout expires.
+
+Usage:
+    oracle = FilterOracle(api_client)
+    report = oracle.check(home_page, FilterState(categories=["Hand Tools"], sort="price,asc"))
+    assert report.ok, report
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pages.components.filters import Filters
+from utils.product_table import ProductTable
+
+logger = logging.getLogger(__name__)
+
+# What the storefront sends before the user touches anything
+DEFAULT_PRICE_RANGE: Tuple[int, int] = (1, 100)
+
+
+class FilterState:
+    """
+    One combination of home page filters.
+
+    Args:
+        categories: Category names as shown in the sidebar (parents include their subcategories)
+        brands: Brand names as shown in the sidebar
+        price_range: (min, max) of the price slider
+        sort: Sort option value, e.g. "price,asc", "name,desc" (None = default order)
+    """
+
+    def __init__(self, categories: Sequence[str] = (), brands: Sequence[str] = (),
+                 price_range: Tuple[int, int] = DEFAULT_PRICE_RANGE, sort: Optional[str] = None):
+        self.categories = tuple(categories)
+        self.brands = tuple(brands)
+        self.price_range = tuple(price_range)
+        self.sort = sort
+
+    def __repr__(self):
+        parts = [f"categories={list(self.categories)}" if self.categories else "",
+                 f"brands={list(self.brands)}" if self.brands else "",
+                 f"price={self.price_range}" if self.price_range != DEFAULT_PRICE_RANGE else "",
+                 f"sort={self.sort}" if self.sort else ""]
+        return f"FilterState({', '.join(p for p in parts if p) or 'default'})"
+
+    def apply(self, home_page) -> None:
+        """Drive the UI into this state (from a freshly loaded home page)."""
+        if self.categories or self.brands:
+            # All checkboxes in one batch, one grid settle
+            Filters(home_page.page).apply_filter_set(categories=self.categories, brands=self.brands)
+        if self.price_range != DEFAULT_PRICE_RANGE:
+            home_page.set_price_range(*self.price_range)
+        if self.sort:
+            home_page.sort_by_option(self.sort)
+
+
+class ConsistencyReport:
+    """Outcome of one UI-vs-API comparison."""
+
+    def __init__(self, state: FilterState, ui: ProductTable, api: ProductTable, elapsed: float):
+        self.state = state
+        self.ui_ids = ui.id_list()
+        self.api_ids = api.id_list()
+        self.elapsed = elapsed
+        self.missing_in_ui = api.missing_from(ui)
+        self.unexpected_in_ui = ui.missing_from(api)
+
+    @property
+    def order_differs(self) -> bool:
+        return not self.missing_in_ui and not self.unexpected_in_ui and self.ui_ids != self.api_ids
+
+    @property
+    def ok(self) -> bool:
+        return self.ui_ids == self.api_ids
+
+    def __str__(self):
+        if self.ok:
+            return f"{self.state}: UI matches API ({len(self.ui_ids)} products)"
+        lines = [f"{self.state}: UI differs from API"]
+        if self.missing_in_ui:
+            lines.append(f"  missing in UI: {self.missing_in_ui}")
+        if self.unexpected_in_ui:
+            lines.append(f"  unexpected in UI: {self.unexpected_in_ui}")
+        if self.order_differs:
+            lines.append(f"  order: UI {self.ui_ids} vs API {self.api_ids}")
+        return "\n".join(lines)
+
+
+class FilterOracle:
+    """
+    Computes the API answer for a FilterState and compares it with the grid.
+
+    Args:
+        api_client: APIClient (only its thread-safe fetch_many/get paths are used)
+        settle_timeout: Seconds to wait for the grid to match before reporting
+    """
+
+    def __init__(self, api_client, settle_timeout: float = 5.0):
+        self.api_client = api_client
+        self.settle_timeout = settle_timeout
+        self._category_ids: Optional[Dict[str, List[str]]] = None
+        self._brand_ids: Optional[Dict[str, str]] = None
+
+    def _load_reference_data(self):
+        """Sidebar names -> ids, fetched once (parents expand to their subcategories)."""
+        categories, brands = self.api_client.fetch_many([
+            {"endpoint": "/categories/tree"},
+            {"endpoint": "/brands"},
+        ])
+        self._category_ids = {}
+        for root in categories.json():
+            children = root.get("sub_categories") or []
+            self._category_ids[root["name"]] = [root["id"]] + [child["id"] for child in children]
+            for child in children:
+                self._category_ids[child["name"]] = [child["id"]]
+        self._brand_ids = {brand["name"]: brand["id"] for brand in brands.json()}
+
+    def to_params(self, state: FilterState) -> Dict[str, Any]:
+        """The /products query the storefront sends for `state` (first page)."""
+        if self._category_ids is None:
+            self._load_reference_data()
+        try:
+            category_ids = [cid for name in state.categories for cid in self._category_ids[name]]
+            brand_ids = [self._brand_ids[name] for name in state.brands]
+        except KeyError as e:
+            raise ValueError(f"Unknown category/brand in {state}: {e}") from e
+
+        low, high = state.price_range
+        params: Dict[str, Any] = {"page": 1, "between": f"price,{low},{high}", "is_rental": "false"}
+        if category_ids:
+            params["by_category"] = ",".join(category_ids)
+        if brand_ids:
+            params["by_brand"] = ",".join(brand_ids)
+        if state.sort:
+            params["sort"] = state.sort
+        return params
+
+    def _fetch_expected(self, params: Dict[str, Any]) -> ProductTable:
+        # Runs on the oracle's worker thread: thread-local session, no nested pool
+        response = self.api_client.get_direct("/products", params=params)
+        if not response.ok:
+            raise AssertionError(f"GET /products {params} -> HTTP {response.status}")
+        return ProductTable.from_products(response.json()["data"])
+
+    def check(self, home_page, state: FilterState) -> ConsistencyReport:
+        """Apply `state` in the UI and compare the grid with the API (see module docstring)."""
+        started = time.perf_counter()
+        params = self.to_params(state)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="oracle") as executor:
+            expected_future = executor.submit(self._fetch_expected, params)
+            state.apply(home_page)
+            expected = expected_future.result()
+
+        # The grid may still be re-rendering: re-snapshot until it agrees or time runs out
+        deadline = time.perf_counter() + self.settle_timeout
+        while True:
+            actual = ProductTable.from_cards(home_page.locators.product_cards)
+            report = ConsistencyReport(state, actual, expected, time.perf_counter() - started)
+            if report.ok or time.perf_counter() >= deadline:
+                break
+            home_page.page.wait_for_timeout(200)
+
+        logger.info(f"{'✓' if report.ok else '❌'} {report} [{report.elapsed:.2f}s]")
+        return report
@@ -0,0 +1,137 @@
+"""
+Environment health: preflight probe + circuit breaker.
+
+When the storefront or the API is down, every test would otherwise wait out
+its full timeout before failing. Instead:
+
+    1. At session start, probe_environment() checks BASE_URL, API_BASE_URL
+       and LOGIN_URL in parallel with a short timeout.
+    2. During the run, navigation (BasePage, page fixtures) and APIClient
+       report failures/successes to the breaker.
+    3. Once the breaker is open (failed probe, or N consecutive failures),
+       conftest.py skips or fails the remaining tests immediately with one
+       diagnostic.
+
+Tests that do not need the remote environment are marked `offline`.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures; any success resets the count.
+
+    Once open it stays open for the rest of the session (an outage is not
+    expected to recover within one CI job).
+    """
+
+    def __init__(self, threshold: int = 3):
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.failures: List[str] = []
+        self.reason: Optional[str] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.reason is not None
+
+    def record_success(self, source: str):
+        with self._lock:
+            self.consecutive_failures = 0
+
+    def record_failure(self, source: str, detail: str):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.failures.append(f"{source}: {detail}")
+            if not self.is_open and self.consecutive_failures >= self.threshold:
+                self._open(f"{self.consecutive_failures} consecutive failures, last one from {source}")
+
+    def trip(self, reason: str):
+        """Open the breaker immediately (e.g. failed preflight probe)."""
+        with self._lock:
+            if not self.is_open:
+                self._open(reason)
+
+    def _open(self, reason: str):
+        self.reason = reason
+        logger.error("\n" + "=" * 70)
+        logger.error("🚨 ENVIRONMENT UNHEALTHY - remaining tests will not run")
+        logger.error(f"   Reason: {reason}")
+        for failure in self.failures[-5:]:
+            logger.error(f"   - {failure}")
+        logger.error("=" * 70 + "\n")
+
+    def diagnostic(self) -> str:
+        """One-line explanation used as skip/fail reason."""
+        last = self.failures[-1] if self.failures else "n/a"
+        return f"Environment unhealthy ({self.reason}). Last failure: {last}"
+
+    def reset(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self.failures.clear()
+            self.reason = None
+
+
+def probe_url(url: str, timeout: float) -> Optional[str]:
+    """
+    Check that url answers.
+
+    Any HTTP status below 500 counts as "up" (Cloudflare may answer 403 to
+    non-browser clients, which still proves the site is reachable).
+
+    Returns:
+        None if healthy, otherwise an error description.
+    """
+    try:
+        response = requests.get(url, timeout=timeout, allow_redirects=True)
+    except requests.RequestException as e:
+        return f"{type(e).__name__}: {e}"
+    if response.status_code >= 500:
+        return f"HTTP {response.status_code}"
+    return None
+
+
+def probe_environment(targets: Optional[Dict[str, str]] = None,
+                      timeout: Optional[float] = None) -> Dict[str, Optional[str]]:
+    """
+    Probe all targets in parallel.
+
+    Args:
+        targets: name -> URL (default: storefront, API and login page)
+        timeout: Per-request timeout in seconds (default: Config.HEALTH_PROBE_TIMEOUT)
+
+    Returns:
+        name -> None (healthy) or error description
+    """
+    targets = targets or {
+        "storefront": Config.BASE_URL,
+        "api": Config.API_BASE_URL,
+        "login": Config.LOGIN_URL,
+    }
+    timeout = timeout or Config.HEALTH_PROBE_TIMEOUT
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = {name: executor.submit(probe_url, url, timeout) for name, url in targets.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+    for name, error in results.items():
+        if error is None:
+            logger.info(f"✓ Preflight {name}: {targets[name]} is reachable")
+        else:
+            logger.error(f"❌ Preflight {name}: {targets[name]} -> {error}")
+    return results
+
+
+# Process-wide breaker fed by BasePage, page fixtures and APIClient
+environment_health = CircuitBreaker(threshold=Config.CIRCUIT_BREAKER_THRESHOLD)
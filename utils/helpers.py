@@ -1,6 +1,5 @@
-import random
-import string
 import re
+import uuid
 from datetime import datetime
 from typing import Dict, Optional
 from playwright.sync_api import Page
@@ -10,8 +9,13 @@ class Helpers:
 
     @staticmethod
     def generate_test_user_payload() -> Dict[str, str]:
-        """Generates a raw dictionary for API or Form injection."""
-        uid = ''.join(random.choices(string.digits, k=5))
+        """
+        Generates a raw dictionary for API or Form injection.
+
+        For many users at once use utils.user_factory.generate_users.
+        """
+        # 48 random bits: collisions stay negligible even across large account pools
+        uid = uuid.uuid4().hex[:12]
         return {
             "first_name": "Test",
             "last_name": f"User_{uid}",
@@ -0,0 +1,213 @@
+"""
+API throughput / load runner.
+
+Replays APIClient domain methods from N concurrent virtual users (one
+thread and one APIClient each) with a linear ramp-up, for a fixed duration,
+and reports requests per second, latency percentiles and error rates.
+
+Targets the local stub (utils/api_stub.py) by default, so it runs with no
+network. Point it at the real backend with --target live (or any URL).
+
+Usage:
+    python -m utils.load_runner --concurrency 20 --ramp-up 5 --duration 30
+    python -m utils.load_runner --target live --concurrency 5 --duration 10
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.config import Config
+from utils.api_client import APIClient, RequestsRequestContext
+from utils.api_metrics import LatencyHistogram
+from utils.api_stub import StubAPIServer
+
+logger = logging.getLogger(__name__)
+
+# (name, weight, call) - call receives a client and a per-user Random
+Scenario = List[Tuple[str, int, Callable[[APIClient, random.Random], Any]]]
+
+DEFAULT_SCENARIO: Scenario = [
+    ("get_brands", 2, lambda client, rng: client.get_brands()),
+    ("get_products[page]", 5, lambda client, rng: client.get_products({"page": rng.randint(1, 5)})),
+    ("get_products[price]", 3, lambda client, rng: client.get_products(
+        {"page": 1, "between": "price,1,100", "is_rental": "false"})),
+]
+
+
+class LoadReport:
+    """Aggregated results of a load run (thread-safe while recording)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.errors: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    def record(self, name: str, seconds: float, status: Any, error: bool):
+        with self._lock:
+            self.latency.setdefault(name, LatencyHistogram()).record(seconds)
+            self.statuses[str(status)] += 1
+            if error:
+                self.errors[name] += 1
+
+    @property
+    def total_requests(self) -> int:
+        return sum(h.count for h in self.latency.values())
+
+    @property
+    def elapsed(self) -> float:
+        return max(self.finished_at - self.started_at, 1e-9)
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.total_requests / self.elapsed
+
+    @property
+    def error_rate(self) -> float:
+        total = self.total_requests
+        return sum(self.errors.values()) / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        overall = LatencyHistogram()
+        for histogram in self.latency.values():
+            overall.merge(histogram)
+
+        def describe(histogram: LatencyHistogram, errors: int) -> Dict[str, Any]:
+            return {
+                "requests": histogram.count,
+                "errors": errors,
+                "p50_ms": round(histogram.percentile(50), 1),
+                "p95_ms": round(histogram.percentile(95), 1),
+                "p99_ms": round(histogram.percentile(99), 1),
+                "max_ms": round(histogram.max_us / 1000, 1),
+            }
+
+        return {
+            "elapsed_s": round(self.elapsed, 2),
+            "requests": self.total_requests,
+            "requests_per_second": round(self.requests_per_second, 1),
+            "error_rate": round(self.error_rate, 4),
+            "statuses": dict(self.statuses),
+            "overall": describe(overall, sum(self.errors.values())),
+            "operations": {name: describe(h, self.errors[name]) for name, h in self.latency.items()},
+        }
+
+    def format_table(self) -> str:
+        data = self.to_dict()
+        lines = [
+            f"Requests: {data['requests']}  RPS: {data['requests_per_second']}  "
+            f"Error rate: {data['error_rate']:.2%}  Elapsed: {data['elapsed_s']}s",
+            f"{'Operation':<24}{'Reqs':>7}{'Errs':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}",
+        ]
+        for name, row in {**data["operations"], "ALL": data["overall"]}.items():
+            lines.append(f"{name:<24}{row['requests']:>7}{row['errors']:>6}{row['p50_ms']:>9}"
+                         f"{row['p95_ms']:>9}{row['p99_ms']:>9}{row['max_ms']:>9}")
+        return "\n".join(lines)
+
+
+def run_load(base_url: str, concurrency: int = 10, ramp_up: float = 0, duration: float = 10,
+             think_time: float = 0, scenario: Optional[Scenario] = None, seed: int = 0) -> LoadReport:
+    """
+    Run virtual users against base_url and collect a LoadReport.
+
+    Args:
+        base_url: API root the APIClient instances point at
+        concurrency: Number of virtual users (threads)
+        ramp_up: Seconds over which users are started (linearly)
+        duration: Total run length in seconds, ramp-up included
+        think_time: Pause in seconds between two calls of one user
+        scenario: Weighted domain calls (default: DEFAULT_SCENARIO)
+        seed: Base seed; user i uses seed + i (reproducible call mix)
+    """
+    scenario = scenario or DEFAULT_SCENARIO
+    names = [name for name, _, _ in scenario]
+    weights = [weight for _, weight, _ in scenario]
+    calls = {name: call for name, _, call in scenario}
+
+    report = LoadReport()
+    report.started_at = time.perf_counter()
+    deadline = report.started_at + duration
+
+    def virtual_user(index: int):
+        start_at = report.started_at + (ramp_up * index / concurrency if concurrency else 0)
+        time.sleep(max(0.0, start_at - time.perf_counter()))
+
+        rng = random.Random(seed + index)
+        context = RequestsRequestContext()
+        # Load traffic stays out of the run's API report and circuit breaker
+        client = APIClient(context, base_url=base_url, record_metrics=False, track_health=False)
+        try:
+            while time.perf_counter() < deadline:
+                name = rng.choices(names, weights)[0]
+                started = time.perf_counter()
+                try:
+                    response = calls[name](client, rng)
+                    report.record(name, time.perf_counter() - started, response.status, not response.ok)
+                except Exception as e:
+                    logger.debug(f"{name} failed: {e}")
+                    report.record(name, time.perf_counter() - started, "ERR", True)
+                if think_time:
+                    time.sleep(think_time)
+        finally:
+            context.dispose()
+
+    logger.info(f"Load run: {concurrency} users, ramp-up {ramp_up}s, duration {duration}s -> {base_url}")
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="vu") as executor:
+        for future in [executor.submit(virtual_user, i) for i in range(concurrency)]:
+            future.result()
+    report.finished_at = time.perf_counter()
+
+    logger.info(f"Load run done: {report.total_requests} requests, {report.requests_per_second:.1f} rps, "
+                f"error rate {report.error_rate:.2%}")
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay APIClient calls under concurrency.")
+    parser.add_argument("--target", default="stub",
+                        help="'stub' (default, local stand-in), 'live' (Config.API_BASE_URL) or a URL")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--ramp-up", type=float, default=0, help="seconds")
+    parser.add_argument("--duration", type=float, default=10, help="seconds, ramp-up included")
+    parser.add_argument("--think-time", type=float, default=0, help="seconds between calls per user")
+    parser.add_argument("--stub-latency-ms", type=float, default=0, help="artificial stub latency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    stub = None
+    if args.target == "stub":
+        stub = StubAPIServer(latency_ms=args.stub_latency_ms).start()
+        base_url = stub.base_url
+    elif args.target == "live":
+        base_url = Config.API_BASE_URL
+    else:
+        base_url = args.target
+
+    try:
+        report = run_load(base_url, args.concurrency, args.ramp_up, args.duration,
+                          args.think_time, seed=args.seed)
+    finally:
+        if stub is not None:
+            stub.stop()
+
+    print(report.format_table())
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+    return 0 if report.error_rate == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+"""
+Product locator service: product name -> id -> storefront URL.
+
+Opening a known product through the search box costs three slow UI steps
+(type, submit + wait, click the card). The product page is addressable
+directly as /product/{id}, so page objects resolve the id here and
+navigate straight to it:
+
+    home_page.open_product("Thor Hammer")     # goto /product/01J...
+
+Resolution order: in-memory cache, catalog snapshot (when the `catalog`
+fixture registered one), then a one-off /products/search API lookup.
+Search in the UI stays reserved for tests of the search feature.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+from config.config import Config
+from utils.api_client import APIClient, RequestsRequestContext
+
+logger = logging.getLogger(__name__)
+
+
+class ProductLocatorService:
+    """
+    Resolves product names to ids/URLs with a process-wide cache.
+
+    Args:
+        catalog: Optional CatalogStore snapshot
+        api_base_url: API root for fallback lookups (default: Config.API_BASE_URL)
+    """
+
+    def __init__(self, catalog=None, api_base_url: Optional[str] = None):
+        self.catalog = catalog
+        self.api_base_url = api_base_url
+        self._ids: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        # One request context, one lookup at a time (its session is not thread-safe)
+        self._api_lock = threading.Lock()
+        self._context = None
+        self._client = None
+
+    def use_catalog(self, catalog) -> None:
+        """Resolve from this CatalogStore snapshot (None = API lookups only)."""
+        self.catalog = catalog
+
+    def _api_client(self):
+        # Created on first fallback lookup only (requests-based, not bound to a Playwright thread)
+        if self._client is None:
+            self._context = RequestsRequestContext()
+            # Lookups are tooling traffic: keep them out of the run's API metrics and circuit breaker
+            self._client = APIClient(self._context, base_url=self.api_base_url,
+                                     record_metrics=False, track_health=False)
+        return self._client
+
+    def _search_api(self, product_name: str) -> Optional[str]:
+        wanted = product_name.lower()
+        page, last_page = 1, 1
+        with self._api_lock:
+            while page <= last_page:
+                response = self._api_client().get("/products/search", params={"q": product_name, "page": page})
+                if not response.ok:
+                    raise LookupError(f"Product lookup for {product_name!r} failed: HTTP {response.status}")
+                payload = response.json()
+                for product in payload["data"]:
+                    if product["name"].lower() == wanted:
+                        return product["id"]
+                page, last_page = page + 1, payload.get("last_page", 1)
+        return None
+
+    def resolve(self, product_name: str) -> str:
+        """
+        Product id for an exact (case-insensitive) product name.
+
+        Raises:
+            LookupError: No product has this name
+        """
+        key = product_name.lower()
+        with self._lock:
+            product_id = self._ids.get(key)
+        if product_id is not None:
+            return product_id
+
+        product = self.catalog.by_name(product_name) if self.catalog is not None else None
+        product_id = product.id if product is not None else self._search_api(product_name)
+        if product_id is None:
+            raise LookupError(f"Unknown product: {product_name!r}")
+
+        with self._lock:
+            self._ids[key] = product_id
+        logger.info(f"Resolved product {product_name!r} -> {product_id}")
+        return product_id
+
+    def url_for(self, product_name: str) -> str:
+        """Storefront URL of the product details page."""
+        return f"{Config.BASE_URL.rstrip('/')}/product/{self.resolve(product_name)}"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+
+    def close(self) -> None:
+        """Dispose the fallback request context (a later lookup opens a new one)."""
+        if self._context is not None:
+            self._context.dispose()
+            self._context = self._client = None
+
+
+# Process-wide service used by page objects (HomePage.open_product)
+product_locator = ProductLocatorService()
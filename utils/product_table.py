@@ -0,0 +1,178 @@
+"""
+Column-oriented product table.
+
+One structure for "a list of products" wherever it comes from (grid
+snapshot, API pages, catalog snapshot), stored as NumPy columns:
+
+    ids    fixed-width bytes array (ULIDs are 26 chars)
+    cents  int64 array (prices in cents, exact)
+    names  list of interned str (repeated names share one object)
+
+Ordering, range and duplicate checks are vectorized, so asserting on a
+100k-product catalog costs milliseconds and a few MB.
+
+Usage:
+    table = ProductTable.from_cards(home_page.locators.product_cards)
+    assert table.is_sorted("price", descending=True)
+    assert not table.out_of_price_range(1, 100)
+"""
+
+import re
+import sys
+from array import array
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+_NON_PRICE = re.compile(r"[^\d.\-]")
+
+# Reads every card of the grid in one round trip: [id, name, price text]
+_GRID_SNAPSHOT_JS = """
+(cards, [nameSelector, priceSelector]) => cards.map(card => {
+    const name = card.querySelector(nameSelector);
+    const price = card.querySelector(priceSelector);
+    return [
+        (card.getAttribute('href') || '').split('/').pop(),
+        name ? name.innerText.trim() : '',
+        price ? price.innerText : '',
+    ];
+})
+"""
+
+
+def parse_price(text: str) -> float:
+    """'$1,200.50' -> 1200.5 (currency symbols, thousands separators and spaces dropped)."""
+    return float(_NON_PRICE.sub("", text))
+
+
+def parse_decimal_price(text: str) -> Decimal:
+    """'$1,200.50' -> Decimal('1200.50') (exact, for money comparisons)."""
+    return Decimal(_NON_PRICE.sub("", text))
+
+
+def parse_prices(texts: Sequence[str]) -> np.ndarray:
+    """Price strings -> float64 array (same rules as parse_price)."""
+    return np.fromiter((parse_price(text) for text in texts), dtype=np.float64, count=len(texts))
+
+
+def _to_cents(values: np.ndarray) -> np.ndarray:
+    return np.rint(np.asarray(values, dtype=np.float64) * 100).astype(np.int64)
+
+
+class ProductTable:
+    """
+    Array-backed list of products (id, name, price).
+
+    Args:
+        ids: Product ids
+        names: Product names
+        cents: Prices in cents (int64 array or sequence)
+    """
+
+    __slots__ = ("ids", "names", "cents")
+
+    def __init__(self, ids: Sequence[str], names: Sequence[str], cents: Any):
+        self.ids = np.array(ids, dtype="S") if len(ids) else np.empty(0, dtype="S26")
+        self.names: List[str] = [sys.intern(name) for name in names]
+        self.cents = np.asarray(cents, dtype=np.int64)
+        if not len(self.ids) == len(self.names) == len(self.cents):
+            raise ValueError(f"Column lengths differ: ids={len(self.ids)}, names={len(self.names)}, "
+                             f"prices={len(self.cents)}")
+
+    # ------------------------------------------------------------------
+    # Loaders
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_cards(cls, cards, name_selector: str = '[data-test="product-name"]',
+                   price_selector: str = '[data-test="product-price"]') -> "ProductTable":
+        """Snapshot the product grid (Locator of the card links) with a single evaluate."""
+        rows = cards.evaluate_all(_GRID_SNAPSHOT_JS, [name_selector, price_selector])
+        if not rows:
+            return cls([], [], [])
+        ids, names, prices = zip(*rows)
+        return cls(ids, names, _to_cents(parse_prices(prices)))
+
+    @classmethod
+    def from_products(cls, products: Iterable[Dict[str, Any]]) -> "ProductTable":
+        """
+        From API product dicts (a page's "data", or APIClient.iter_products()).
+
+        Consumes the iterable incrementally, so streaming a large catalog
+        never holds the JSON dicts in memory at once.
+        """
+        ids: List[str] = []
+        names: List[str] = []
+        cents = array("q")
+        for product in products:
+            ids.append(product["id"])
+            names.append(sys.intern(product["name"]))
+            cents.append(int((Decimal(str(product["price"])) * 100).to_integral_value()))
+        return cls(ids, names, np.frombuffer(cents, dtype=np.int64) if cents else [])
+
+    @classmethod
+    def from_catalog(cls, catalog, products: Optional[Iterable[Any]] = None) -> "ProductTable":
+        """From a CatalogStore snapshot (all products, or the CatalogProduct list of a query)."""
+        rows = list(products if products is not None else catalog)
+        return cls([p.id for p in rows], [p.name for p in rows],
+                   [int(p.price.scaleb(2)) for p in rows])
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.cents)
+
+    def __repr__(self):
+        return f"ProductTable({len(self)} products)"
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Prices as float64 (for display / tolerance comparisons)."""
+        return self.cents / 100
+
+    def id_list(self) -> List[str]:
+        return [product_id.decode("ascii") for product_id in self.ids.tolist()]
+
+    def take(self, selector: Any) -> "ProductTable":
+        """Rows selected by a boolean mask or index array."""
+        indices = np.arange(len(self))[selector]
+        return ProductTable(self.ids[indices].astype(str).tolist(),
+                            [self.names[i] for i in indices], self.cents[indices])
+
+    # ------------------------------------------------------------------
+    # Vectorized checks
+    # ------------------------------------------------------------------
+    def is_sorted(self, by: str = "price", descending: bool = False) -> bool:
+        """
+        Whether rows are ordered by "price" or "name" (ties allowed).
+
+        Name ordering is case-sensitive, like Python's sorted().
+        """
+        if len(self) < 2:
+            return True
+        if by == "price":
+            column = self.cents
+        elif by == "name":
+            column = np.array(self.names, dtype=str)
+        else:
+            raise ValueError(f"Unknown sort column: {by}")
+        first, second = column[:-1], column[1:]
+        return bool(np.all(first >= second) if descending else np.all(first <= second))
+
+    def out_of_price_range(self, low: float, high: float) -> List[str]:
+        """Names of the products priced outside [low, high] (empty = all in range)."""
+        mask = (self.cents < round(low * 100)) | (self.cents > round(high * 100))
+        return [self.names[i] for i in np.flatnonzero(mask)]
+
+    def duplicate_ids(self) -> List[str]:
+        """Ids that appear more than once."""
+        if not len(self):
+            return []
+        unique, counts = np.unique(self.ids, return_counts=True)
+        return [product_id.decode("ascii") for product_id in unique[counts > 1].tolist()]
+
+    def missing_from(self, other: "ProductTable") -> List[str]:
+        """Ids of this table that `other` does not contain."""
+        return [product_id.decode("ascii") for product_id in
+                self.ids[~np.isin(self.ids, other.ids)].tolist()]
@@ -0,0 +1,294 @@
+"""
+Response cache for idempotent API GETs.
+
+Reference data (brands, categories, ...) rarely changes during a run, yet
+every test that needs it fetches it again. This cache keeps GET responses
+keyed by URL + params and honours the usual HTTP rules:
+
+    - Cache-Control: no-store      -> never cached
+    - Cache-Control: max-age=N     -> fresh for N seconds
+    - Cache-Control: no-cache      -> always revalidated
+    - ETag / Last-Modified         -> conditional request (304 = reuse body)
+
+Entries live in an in-memory LRU and, optionally, in an on-disk directory
+shared by all pytest-xdist workers of the machine. With the directory the
+disk is the source of truth: a memory hit is only served while its file is
+unchanged, so an invalidation by any worker reaches every worker.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    """One cached GET response plus its freshness information."""
+
+    def __init__(self, url: str, status: int, status_text: str, headers: Dict[str, str],
+                 body: bytes, expires_at: float):
+        self.url = url
+        self.status = status
+        self.status_text = status_text
+        self.headers = {k.lower(): v for k, v in headers.items()}
+        self.body = body
+        self.expires_at = expires_at
+        # Identity of the disk file this entry was read from / written to (not serialized)
+        self.disk_version: Optional[tuple] = None
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Headers for a conditional request (empty if the server gave none)."""
+        headers = {}
+        if "etag" in self.headers:
+            headers["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "status_text": self.status_text,
+            "headers": self.headers,
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "expires_at": self.expires_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CacheEntry":
+        return cls(
+            url=data["url"],
+            status=data["status"],
+            status_text=data["status_text"],
+            headers=data["headers"],
+            body=base64.b64decode(data["body"]),
+            expires_at=data["expires_at"],
+        )
+
+
+class ResponseCache:
+    """
+    LRU response cache with an optional on-disk backend.
+
+    Args:
+        max_entries: LRU capacity (memory and disk, each)
+        ttl: Freshness override in seconds. When None, the server's
+             Cache-Control decides. Useful for APIs that send no caching
+             headers at all (Laravel's default is "no-cache, private").
+        directory: Enables the disk backend; use the same directory in
+                   every xdist worker to share entries across processes.
+
+    Example:
+        >>> cache = ResponseCache(ttl=300, directory=".api_cache")
+        >>> client = APIClient(request_context, cache=cache)
+        >>> client.get_brands()              # network
+        >>> client.get_brands()              # served from cache
+        >>> client.invalidate_cache("/brands")
+    """
+
+    MAX_AGE_PATTERN = re.compile(r"(?:s-maxage|max-age)\s*=\s*(\d+)")
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = None,
+                 directory: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = Path(directory) if directory else None
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    # ========================================
+    # KEYS & FRESHNESS
+    # ========================================
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Stable key for a GET: same URL + same params (any order) = same key."""
+        normalized = json.dumps(
+            {"url": url, "params": {k: str(v) for k, v in (params or {}).items()}},
+            sort_keys=True,
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def is_storable(self, headers: Dict[str, str]) -> bool:
+        cache_control = {k.lower(): v for k, v in headers.items()}.get("cache-control", "").lower()
+        return "no-store" not in cache_control
+
+    def compute_expiry(self, headers: Dict[str, str]) -> float:
+        """Absolute expiry time (epoch seconds) for a response."""
+        now = time.time()
+        if self.ttl is not None:
+            return now + self.ttl
+
+        cache_control = {k.lower(): v for k, v in headers.items()}.get("cache-control", "").lower()
+        if "no-cache" in cache_control:
+            return now  # stale immediately: always revalidate
+        match = self.MAX_AGE_PATTERN.search(cache_control)
+        return now + int(match.group(1)) if match else now
+
+    # ========================================
+    # LOOKUP / STORE
+    # ========================================
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for key (fresh or stale) or None."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is not None:
+            if self.directory is None or self._disk_version(key) == entry.disk_version:
+                return entry
+            # Another worker invalidated or rewrote it: drop the memory copy
+            with self._lock:
+                self._memory.pop(key, None)
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def store(self, key: str, url: str, status: int, status_text: str,
+              headers: Dict[str, str], body: bytes) -> Optional[CacheEntry]:
+        """Cache a response. Returns the entry, or None if not storable."""
+        if not self.is_storable(headers):
+            return None
+
+        entry = CacheEntry(url, status, status_text, headers, body, self.compute_expiry(headers))
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, headers: Dict[str, str]) -> CacheEntry:
+        """Update freshness after a 304 Not Modified."""
+        entry.headers.update({k.lower(): v for k, v in headers.items()})
+        entry.expires_at = self.compute_expiry(headers)
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+        return entry
+
+    # ========================================
+    # INVALIDATION
+    # ========================================
+
+    def invalidate(self, url_prefix: Optional[str] = None) -> int:
+        """
+        Drop entries whose URL starts with url_prefix (all entries if None).
+
+        Call this after a test mutates data served by a cached endpoint.
+
+        Returns:
+            Number of entries removed (memory + disk)
+        """
+        removed = 0
+        with self._lock:
+            for key in [k for k, e in self._memory.items() if url_prefix is None or e.url.startswith(url_prefix)]:
+                del self._memory[key]
+                removed += 1
+
+        if self.directory is not None:
+            for path in self.directory.glob("*.json"):
+                try:
+                    if url_prefix is not None:
+                        url = json.loads(path.read_text(encoding="utf-8"))["url"]
+                        if not url.startswith(url_prefix):
+                            continue
+                    path.unlink()
+                    removed += 1
+                except (OSError, ValueError, KeyError):
+                    pass  # Another worker removed or is rewriting it
+
+        logger.info(f"Cache invalidated ({url_prefix or 'all'}): {removed} entries removed")
+        return removed
+
+    def clear(self) -> int:
+        """Drop every entry."""
+        return self.invalidate(None)
+
+    # ========================================
+    # INTERNAL HELPERS
+    # ========================================
+
+    def _remember(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _disk_version(self, key: str) -> Optional[tuple]:
+        """Inode + size of the entry's file (writes replace the file, touching it does not)."""
+        try:
+            stat = self._disk_path(key).stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_size
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        if self.directory is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            version = self._disk_version(key)
+            entry = CacheEntry.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            os.utime(path)  # LRU bookkeeping: mtime = last access
+            entry.disk_version = version
+            return entry
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_disk(self, key: str, entry: CacheEntry):
+        if self.directory is None:
+            return
+        # Write to a temp file then rename: readers never see half a file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry.to_dict(), f)
+            os.replace(tmp_path, self._disk_path(key))
+            entry.disk_version = self._disk_version(key)
+        except OSError as e:
+            logger.warning(f"⚠️  Failed to write cache entry: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        self._evict_disk()
+
+    def _evict_disk(self):
+        files = list(self.directory.glob("*.json"))
+        if len(files) <= self.max_entries:
+            return
+
+        def last_access(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        files.sort(key=last_access)
+        for path in files[:len(files) - self.max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
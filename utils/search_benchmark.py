@@ -0,0 +1,234 @@
+"""
+Keystroke-to-suggestion latency benchmark for the search box.
+
+A probe installed in the page timestamps every keystroke and every
+suggestion render with the Performance API:
+
+    input event            -> performance.mark("search-key-<n>")
+    suggestions answered   -> performance.mark("search-render-<n>") on the next
+                              animation frame, plus one performance.measure
+                              "search-latency-<k>" for each pending keystroke k
+
+A keystroke is answered by the first of:
+
+    - any re-render of the suggestion list (nodes, text or attributes
+      changed inside it) while suggestions are shown, even if the items
+      are the same as before ("hamme" -> "hammer");
+    - the completion of a search request sent after the keystroke, when
+      the list settles without touching the DOM at all.
+
+A render answers every keystroke typed since the previous one, so a
+keystroke superseded by a faster typist is still measured up to the
+suggestions the user actually sees. Keystrokes that never trigger either
+(e.g. below the minimum term length) are reported as unanswered.
+
+Timing happens in the page, so Playwright round trips do not inflate the
+numbers; the measures of a term are read back in one evaluate call.
+
+Usage:
+    benchmark = SearchLatencyBenchmark(page)
+    report = benchmark.run(["hammer", "pliers"])
+    logger.info(report.format_table())
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from playwright.sync_api import Page
+
+from config.config import Config
+from pages.components.project_locators.components_locators import SearchBarLocators
+from pages.components.search_bar import SearchBar
+from utils.api_metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Endpoint behind the suggestions (requests to it settle pending keystrokes)
+SEARCH_ENDPOINT = "/products/search"
+
+# Installs the probe once per document; later calls only reset it
+_PROBE_JS = """
+([inputSelector, suggestionsSelector, searchEndpoint]) => {
+    if (window.__searchLatency) { window.__searchLatency.reset(); return; }
+    const state = {seq: 0, pending: []};
+    const shown = () => [...document.querySelectorAll(suggestionsSelector)].some(el => el.offsetParent !== null);
+    // On or inside the list only: ancestors (form, header, body) churn for other reasons
+    const element = node => node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+    const inSuggestions = node => !!element(node) && !!element(node).closest(suggestionsSelector);
+    // An inserted subtree carrying suggestions is a render too (first time the list appears)
+    const bringsSuggestions = node => node.nodeType === Node.ELEMENT_NODE && !!node.querySelector(suggestionsSelector);
+
+    // Answer every pending keystroke up to `lastId`, timed at the next frame
+    const answer = lastId => {
+        const answered = state.pending.filter(id => id <= lastId);
+        if (!answered.length) return;
+        state.pending = state.pending.filter(id => id > lastId);
+        requestAnimationFrame(() => {
+            const render = `search-render-${answered[answered.length - 1]}`;
+            performance.mark(render);
+            answered.forEach(id => performance.measure(`search-latency-${id}`, `search-key-${id}`, render));
+        });
+    };
+
+    document.addEventListener('input', event => {
+        if (!event.target.matches(inputSelector)) return;
+        const id = ++state.seq;
+        performance.mark(`search-key-${id}`, {detail: event.target.value});
+        state.pending.push(id);
+    }, true);
+
+    // Any re-render of the list answers, same items or not
+    new MutationObserver(records => {
+        if (!state.pending.length || !shown()) return;
+        const touched = records.some(record => inSuggestions(record.target)
+            || [...record.addedNodes, ...record.removedNodes].some(inSuggestions)
+            || [...record.addedNodes].some(bringsSuggestions));
+        if (touched) answer(state.seq);
+    }).observe(document.body, {childList: true, subtree: true, characterData: true, attributes: true});
+
+    // A finished search request answers the keystrokes typed before it was sent
+    const open = XMLHttpRequest.prototype.open;
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url, ...rest) {
+        this.__searchRequest = String(url).includes(searchEndpoint);
+        return open.call(this, method, url, ...rest);
+    };
+    XMLHttpRequest.prototype.send = function (...args) {
+        if (this.__searchRequest) {
+            const sentAfter = state.seq;
+            this.addEventListener('loadend', () => requestAnimationFrame(() => answer(sentAfter)));
+        }
+        return send.apply(this, args);
+    };
+
+    window.__searchLatency = {
+        pending: () => state.pending.length,
+        reset: () => {
+            state.pending = [];
+            performance.clearMarks();
+            performance.clearMeasures();
+        },
+    };
+}
+"""
+
+# Keystroke marks and latency measures of the current term, in one round trip
+_READ_JS = """
+() => {
+    const keys = performance.getEntriesByType('mark').filter(m => m.name.startsWith('search-key-'));
+    const measures = Object.fromEntries(performance.getEntriesByType('measure')
+        .filter(m => m.name.startsWith('search-latency-'))
+        .map(m => [m.name.slice('search-latency-'.length), m.duration]));
+    return keys.map(k => {
+        const id = k.name.slice('search-key-'.length);
+        return {value: k.detail, latency: id in measures ? measures[id] : null};
+    });
+}
+"""
+
+
+class TermLatency:
+    """Keystroke latencies of one typed term."""
+
+    def __init__(self, term: str, keystrokes: List[Dict[str, Any]]):
+        self.term = term
+        self.keystrokes = keystrokes
+        self.histogram = LatencyHistogram()
+        for keystroke in keystrokes:
+            if keystroke["latency"] is not None:
+                self.histogram.record(keystroke["latency"] / 1000)
+
+    @property
+    def answered(self) -> int:
+        return self.histogram.count
+
+    @property
+    def unanswered(self) -> int:
+        return len(self.keystrokes) - self.answered
+
+    @property
+    def final_latency_ms(self) -> Optional[float]:
+        """Latency of the last keystroke (the full term), None if never answered."""
+        return self.keystrokes[-1]["latency"] if self.keystrokes else None
+
+
+class SearchLatencyReport:
+    """Per-term and aggregate keystroke-to-suggestion latencies."""
+
+    def __init__(self, terms: List[TermLatency], keystroke_delay_ms: int):
+        self.terms = terms
+        self.keystroke_delay_ms = keystroke_delay_ms
+        self.overall = LatencyHistogram()
+        for term in terms:
+            self.overall.merge(term.histogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        def describe(histogram: LatencyHistogram, keystrokes: int) -> Dict[str, Any]:
+            return {
+                "keystrokes": keystrokes,
+                "answered": histogram.count,
+                "p50_ms": round(histogram.percentile(50), 1),
+                "p95_ms": round(histogram.percentile(95), 1),
+                "max_ms": round(histogram.max_us / 1000, 1),
+            }
+
+        return {
+            "keystroke_delay_ms": self.keystroke_delay_ms,
+            "overall": describe(self.overall, sum(len(t.keystrokes) for t in self.terms)),
+            "terms": {t.term: {**describe(t.histogram, len(t.keystrokes)),
+                               "final_ms": None if t.final_latency_ms is None else round(t.final_latency_ms, 1)}
+                      for t in self.terms},
+        }
+
+    def format_table(self) -> str:
+        data = self.to_dict()
+        lines = [
+            f"Search keystroke-to-suggestion latency (typing every {self.keystroke_delay_ms}ms)",
+            f"{'Term':<20}{'Keys':>6}{'Ans':>6}{'p50':>9}{'p95':>9}{'max':>9}{'final':>9}",
+        ]
+        for name, row in {**data["terms"], "ALL": data["overall"]}.items():
+            final = row.get("final_ms")
+            lines.append(f"{name:<20}{row['keystrokes']:>6}{row['answered']:>6}{row['p50_ms']:>9}"
+                         f"{row['p95_ms']:>9}{row['max_ms']:>9}{'-' if final is None else final:>9}")
+        return "\n".join(lines)
+
+
+class SearchLatencyBenchmark:
+    """
+    Types terms into the search box and measures suggestion latency.
+
+    Args:
+        page: Playwright page showing the search box
+        keystroke_delay_ms: Typing cadence (default: Config.SEARCH_BENCH_KEY_DELAY_MS)
+        settle_ms: Max wait for the last keystroke to be answered (default: Config.SEARCH_BENCH_SETTLE_MS)
+    """
+
+    def __init__(self, page: Page, keystroke_delay_ms: Optional[int] = None, settle_ms: Optional[int] = None):
+        self.page = page
+        self.search_bar = SearchBar(page)
+        self.keystroke_delay_ms = Config.SEARCH_BENCH_KEY_DELAY_MS if keystroke_delay_ms is None \
+            else keystroke_delay_ms
+        self.settle_ms = Config.SEARCH_BENCH_SETTLE_MS if settle_ms is None else settle_ms
+
+    def measure_term(self, term: str) -> TermLatency:
+        """Clear the box, type `term` at the configured cadence and collect its latencies."""
+        self.search_bar.clear_search()
+        self.page.evaluate(_PROBE_JS, [SearchBarLocators.SEARCH_INPUT, SearchBarLocators.SUGGESTIONS,
+                                       SEARCH_ENDPOINT])
+        self.search_bar.type_search_term(term, delay=self.keystroke_delay_ms)
+        try:
+            self.page.wait_for_function("() => window.__searchLatency.pending() === 0", timeout=self.settle_ms)
+        except Exception:
+            logger.warning(f"⚠️  Suggestions for {term!r} did not settle within {self.settle_ms}ms")
+        # The measure is taken one animation frame after the render
+        self.page.evaluate("() => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)))")
+        result = TermLatency(term, self.page.evaluate(_READ_JS))
+        logger.info(f"Search {term!r}: {result.answered}/{len(result.keystrokes)} keystroke(s) answered, "
+                    f"p95 {result.histogram.percentile(95):.0f}ms")
+        return result
+
+    def run(self, terms: Optional[Sequence[str]] = None) -> SearchLatencyReport:
+        """Measure every term (default: Config.SEARCH_BENCH_TERMS)."""
+        results = [self.measure_term(term) for term in (terms or Config.SEARCH_BENCH_TERMS)]
+        self.search_bar.clear_search()
+        return SearchLatencyReport(results, self.keystroke_delay_ms)
@@ -0,0 +1,154 @@
+"""
+Local search oracle.
+
+Predicts what the storefront search (GET /products/search?q=) returns for
+any term: a case-insensitive substring match on the product name. Built
+from the catalog snapshot as a trigram inverted index, so a lookup only
+verifies the few products sharing every trigram of the term.
+
+    index = SearchIndex.from_catalog(catalog)
+    index.count("hammer")          # exact number of results
+    index.names("hammer")          # exact result set
+
+verify_search_terms() checks thousands of terms against the real API in
+concurrent batches and returns only the mismatches.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+NGRAM = 3
+# Products per page on the storefront and in the API paginator
+PAGE_SIZE = 9
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class SearchIndex:
+    """
+    Trigram inverted index over product names.
+
+    Args:
+        products: (product_id, name) pairs
+    """
+
+    def __init__(self, products: Iterable[Tuple[str, str]]):
+        self._names: Dict[str, str] = {}
+        self._keys: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        for product_id, name in products:
+            key = name.lower()
+            self._names[product_id] = name
+            self._keys[product_id] = key
+            for gram in _grams(key):
+                self._postings[gram].add(product_id)
+
+    @classmethod
+    def from_catalog(cls, catalog) -> "SearchIndex":
+        """Build from a CatalogStore snapshot."""
+        return cls((product.id, product.name) for product in catalog)
+
+    @classmethod
+    def from_products(cls, products: Iterable[Dict[str, Any]]) -> "SearchIndex":
+        """Build from API product dicts."""
+        return cls((product["id"], product["name"]) for product in products)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(self, term: str) -> List[str]:
+        """
+        Ids of the products the backend returns for `term`, sorted.
+
+        An empty term matches everything (the backend ignores an empty q).
+        """
+        needle = term.lower()
+        if len(needle) < NGRAM:
+            candidates: Iterable[str] = self._keys
+        else:
+            # Intersect the rarest postings first: the set shrinks fastest
+            postings = sorted((self._postings.get(gram, set()) for gram in _grams(needle)), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates &= posting
+        return sorted(product_id for product_id in candidates if needle in self._keys[product_id])
+
+    def count(self, term: str) -> int:
+        return len(self.search(term))
+
+    def names(self, term: str) -> List[str]:
+        """Names of the matching products, sorted (duplicates kept)."""
+        return sorted(self._names[product_id] for product_id in self.search(term))
+
+    def vocabulary(self) -> List[str]:
+        """Every distinct lower-cased word of the product names (handy as a term list)."""
+        return sorted({word for key in self._keys.values() for word in key.split()})
+
+    def probe_terms(self) -> Iterator[str]:
+        """Every name word, its prefixes/infixes, and a few terms that match nothing."""
+        for word in self.vocabulary():
+            yield word
+            yield word[:3]
+            yield word[1:-1]
+        yield from ("asdasdasd123", "zzz", "")
+
+
+def verify_search_terms(api_client, index: SearchIndex, terms: Iterable[str],
+                        batch_size: int = 200, max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Compare the API search against the oracle for many terms.
+
+    Requests page 1 of /products/search for each term (concurrently,
+    APIClient.fetch_many, `batch_size` terms at a time) and compares the
+    reported total; when all results fit on one page the ids are compared too.
+
+    Args:
+        api_client: APIClient
+        index: Oracle built from the same catalog the API serves
+        terms: Search terms (any iterable, consumed batch by batch)
+        batch_size: Terms in flight per batch (bounds memory for huge lists)
+        max_workers: Concurrency (default: Config.API_MAX_CONCURRENCY)
+
+    Returns:
+        Mismatches: [{"term", "expected", "actual"}], empty when the API agrees.
+    """
+    mismatches: List[Dict[str, Any]] = []
+    checked = 0
+    batch: List[str] = []
+
+    def check(batch_terms: List[str]):
+        responses = api_client.fetch_many(
+            [{"endpoint": "/products/search", "params": {"q": term, "page": 1}} for term in batch_terms],
+            max_workers=max_workers,
+        )
+        for term, response in zip(batch_terms, responses):
+            expected_ids = index.search(term)
+            if not response.ok:
+                mismatches.append({"term": term, "expected": len(expected_ids), "actual": f"HTTP {response.status}"})
+                continue
+            payload = response.json()
+            if payload["total"] != len(expected_ids):
+                mismatches.append({"term": term, "expected": len(expected_ids), "actual": payload["total"]})
+            elif len(expected_ids) <= PAGE_SIZE and sorted(p["id"] for p in payload["data"]) != expected_ids:
+                mismatches.append({"term": term, "expected": expected_ids,
+                                   "actual": sorted(p["id"] for p in payload["data"])})
+
+    for term in terms:
+        batch.append(term)
+        if len(batch) >= batch_size:
+            check(batch)
+            checked += len(batch)
+            batch = []
+    if batch:
+        check(batch)
+        checked += len(batch)
+
+    logger.info(f"Search oracle: {checked} terms checked, {len(mismatches)} mismatch(es)")
+    return mismatches
@@ -0,0 +1,150 @@
+"""
+Bulk synthetic user generator.
+
+Builds N users (identity, address, payment card) in one vectorized NumPy
+pass, reproducible from a seed and free of collisions: uniqueness comes
+from the row index combined with a batch tag, not from random draws.
+
+Usage:
+    users = generate_users(1000, seed=42)
+    export_users(users, "results_Playwright/users.parquet")
+    responses = register_users(api_client, users)
+"""
+
+import logging
+import secrets
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+FIRST_NAMES = np.array(["Jane", "John", "Maria", "Luca", "Aiko", "Omar", "Sofia", "Liam", "Emma", "Noah",
+                        "Chen", "Fatima", "Ivan", "Priya", "Lucas", "Mia"])
+LAST_NAMES = np.array(["Doe", "Smith", "Rossi", "Tanaka", "Haddad", "Garcia", "Muller", "Brown", "Wilson",
+                       "Kim", "Novak", "Patel", "Silva", "Jensen", "Moreau", "Costa"])
+STREETS = np.array(["Main Street", "Oak Avenue", "Station Road", "Church Lane", "Park Drive", "Mill Road"])
+CITIES = np.array([("Amsterdam", "North Holland", "NL"), ("Berlin", "Berlin", "DE"), ("Milan", "Lombardy", "IT"),
+                   ("Lyon", "Auvergne-Rhone-Alpes", "FR"), ("Austin", "Texas", "US"), ("Leeds", "England", "GB")])
+DEFAULT_PASSWORD = "SecurePass123!"
+
+
+def _luhn_card_numbers(rng: np.random.Generator, n: int) -> np.ndarray:
+    """n valid 16-digit test card numbers (prefix 4), Luhn check digit computed for all rows at once."""
+    digits = rng.integers(0, 10, size=(n, 15))
+    digits[:, 0] = 4
+    # Luhn: from the right of the full number, every 2nd digit is doubled;
+    # with the check digit appended, those are the even positions of the 15-digit body
+    doubled = digits[:, 0::2] * 2
+    doubled = np.where(doubled > 9, doubled - 9, doubled)
+    total = doubled.sum(axis=1) + digits[:, 1::2].sum(axis=1)
+    check = (10 - total % 10) % 10
+    full = np.concatenate([digits, check[:, None]], axis=1)
+    return np.array(["".join(map(str, row)) for row in full])
+
+
+def generate_users(n: int, seed: Optional[int] = None, batch_tag: Optional[str] = None) -> pd.DataFrame:
+    """
+    Generate n unique users with address and payment data.
+
+    Args:
+        n: Number of users
+        seed: Random seed (same seed + same tag = same users)
+        batch_tag: Prefix making ids unique across batches/runs.
+                   Default: derived from the seed, or random when no seed.
+
+    Returns:
+        DataFrame, one row per user (flat columns, see to_register_payloads)
+    """
+    rng = np.random.default_rng(seed)
+    tag = batch_tag or (f"s{seed}" if seed is not None else secrets.token_hex(4))
+    index = np.arange(n)
+
+    user_ids = np.char.add(f"{tag}-", np.char.zfill(index.astype(str), max(6, len(str(n)))))
+    first = FIRST_NAMES[rng.integers(0, len(FIRST_NAMES), n)]
+    last = LAST_NAMES[rng.integers(0, len(LAST_NAMES), n)]
+    city_rows = CITIES[rng.integers(0, len(CITIES), n)]
+    birth_days = rng.integers(18 * 365, 70 * 365, n)
+
+    frame = pd.DataFrame({
+        "user_id": user_ids,
+        "first_name": first,
+        "last_name": last,
+        "email": np.char.add(np.char.add("test_", np.char.replace(user_ids, "-", "_")), "@example.com"),
+        "password": DEFAULT_PASSWORD,
+        "dob": (np.datetime64("2026-01-01") - birth_days.astype("timedelta64[D]")).astype(str),
+        "phone": np.char.add("06", np.char.zfill(rng.integers(0, 10 ** 8, n).astype(str), 8)),
+        "street": np.char.add(np.char.add(rng.integers(1, 500, n).astype(str), " "),
+                              STREETS[rng.integers(0, len(STREETS), n)]),
+        "city": city_rows[:, 0],
+        "state": city_rows[:, 1],
+        "country": city_rows[:, 2],
+        "postal_code": np.char.zfill(rng.integers(1000, 99999, n).astype(str), 5),
+        "card_number": _luhn_card_numbers(rng, n),
+        "card_expiry": np.char.add(np.char.add(np.char.zfill(rng.integers(1, 13, n).astype(str), 2), "/"),
+                                   rng.integers(2027, 2032, n).astype(str)),
+        "card_cvv": np.char.zfill(rng.integers(0, 1000, n).astype(str), 3),
+    })
+    frame["card_holder"] = frame["first_name"] + " " + frame["last_name"]
+
+    if frame["email"].duplicated().any():
+        raise RuntimeError("Generated duplicate users (batch_tag reused inside one batch?)")
+    logger.info(f"Generated {n} users (tag={tag})")
+    return frame
+
+
+def to_register_payloads(users: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Rows -> bodies for POST /users/register."""
+    return [
+        {
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "dob": row.dob,
+            "phone": row.phone,
+            "email": row.email,
+            "password": row.password,
+            "address": {
+                "street": row.street,
+                "city": row.city,
+                "state": row.state,
+                "country": row.country,
+                "postal_code": row.postal_code,
+            },
+        }
+        for row in users.itertuples(index=False)
+    ]
+
+
+def export_users(users: pd.DataFrame, path: str) -> Path:
+    """Write users to .csv or .parquet (chosen by extension); readable by utils.data_loader."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.suffix == ".parquet":
+        users.to_parquet(target, index=False)
+    elif target.suffix == ".csv":
+        users.to_csv(target, index=False)
+    else:
+        raise ValueError(f"Unsupported export format: {target.suffix}")
+    logger.info(f"Exported {len(users)} users to {target}")
+    return target
+
+
+def register_users(api_client, users: pd.DataFrame, max_workers: Optional[int] = None) -> list:
+    """
+    Create the users through the API, concurrently (APIClient.fetch_many).
+
+    Returns:
+        Responses in row order.
+    """
+    responses = api_client.fetch_many(
+        [{"method": "POST", "endpoint": "/users/register", "data": payload}
+         for payload in to_register_payloads(users)],
+        max_workers=max_workers,
+    )
+    failed = [r.status for r in responses if not r.ok]
+    logger.info(f"Registered {len(responses) - len(failed)}/{len(responses)} users")
+    if failed:
+        logger.warning(f"⚠️  {len(failed)} registrations failed, statuses: {sorted(set(failed))}")
+    return responses